@@ -10,15 +10,33 @@ Target Environments:
 - IoT devices
 """
 
+import json
 import os
 import subprocess
 import platform
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import BinaryIO, List, Dict, Optional, Tuple
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
 
+# msgspec's compiled JSON encoder is optional; fall back to the stdlib
+try:
+    import msgspec
+    _json_encode = msgspec.json.encode
+except ImportError:
+    def _json_encode(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+_PROC_MEMINFO = '/proc/meminfo'
+
+# Read buffer for line scans of /proc files
+_INFO_READ_BUFFER = 64 * 1024
+
+# uname(2) does not change while the process runs; query it once
+_UNAME = platform.uname()
+
+
 class Architecture(Enum):
     """Hardware architecture types"""
     X86_64 = "x86_64"
@@ -28,6 +46,26 @@ class Architecture(Enum):
     UNKNOWN = "unknown"
 
 
+# platform.machine() values (lower-cased) to architectures
+_ARCH_MAP = {
+    'x86_64': Architecture.X86_64,
+    'amd64': Architecture.X86_64,
+    'aarch64': Architecture.ARM64,
+    'arm64': Architecture.ARM64,
+    'armv7l': Architecture.ARM32,
+    'armv7': Architecture.ARM32,
+    'riscv64': Architecture.RISCV,
+}
+
+
+# ArchitectureTester methods run by BaremetalEnvironmentBenchmark per platform
+_ARCH_TESTS_DEFAULT = ('test_architecture_detection',)
+_ARCH_TESTS = {
+    Architecture.X86_64: _ARCH_TESTS_DEFAULT + ('test_x86_64_support',),
+    Architecture.ARM64: _ARCH_TESTS_DEFAULT + ('test_arm64_support',),
+}
+
+
 class HardwareType(Enum):
     """Hardware type categories"""
     SERVER = "server"
@@ -37,7 +75,7 @@ class HardwareType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HardwareInfo:
     """Hardware information"""
     architecture: str
@@ -48,10 +86,16 @@ class HardwareInfo:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
-        return asdict(self)
+        return {
+            'architecture': self.architecture,
+            'cpu_model': self.cpu_model,
+            'cpu_count': self.cpu_count,
+            'total_memory_mb': self.total_memory_mb,
+            'platform_system': self.platform_system,
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BaremetalTestResult:
     """Bare metal test result"""
     test_name: str
@@ -72,9 +116,61 @@ class HardwareDetector:
     Requirement 5.1: Support x86_64 and ARM64
     """
 
-    def __init__(self):
-        """Initialize hardware detector"""
-        pass
+    def __init__(self, cpuinfo_path: str = '/proc/cpuinfo',
+                 meminfo_path: str = _PROC_MEMINFO):
+        """
+        Initialize hardware detector.
+
+        Args:
+            cpuinfo_path: CPU information file (Linux /proc format)
+            meminfo_path: Memory information file (Linux /proc format)
+        """
+        self.cpuinfo_path = cpuinfo_path
+        self.meminfo_path = meminfo_path
+        self._hw_info_cache: Optional[HardwareInfo] = None
+        self._cpu_count: Optional[int] = None
+
+    def _uname(self):
+        """Return the cached platform.uname() result (patchable in tests)"""
+        return _UNAME
+
+    def invalidate(self) -> None:
+        """Discard cached hardware information so it is re-read"""
+        self._hw_info_cache = None
+        self._cpu_count = None
+
+    def _get_cpu_count(self) -> int:
+        """
+        Get the number of CPUs this process may run on.
+
+        Uses the scheduler affinity mask, which honours cgroup/cpuset
+        limits, and falls back to os.cpu_count() where unavailable.
+        """
+        if self._cpu_count is None:
+            try:
+                self._cpu_count = len(os.sched_getaffinity(0))
+            except AttributeError:
+                self._cpu_count = os.cpu_count() or 1
+        return self._cpu_count
+
+    def _open_info_file(self, path: str) -> BinaryIO:
+        """
+        Open a file such as /proc/cpuinfo for a buffered line scan.
+
+        Callers iterate binary lines and stop as soon as they have what
+        they need, so large files are never read in full.
+
+        Raises:
+            OSError: If the file cannot be opened
+        """
+        f = open(path, 'rb', buffering=_INFO_READ_BUFFER)
+        if hasattr(os, 'posix_fadvise'):
+            # Hint sequential access; ignored by pseudo filesystems
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        return f
 
     def get_architecture(self) -> Architecture:
         """
@@ -83,18 +179,15 @@ class HardwareDetector:
         Returns:
             Architecture enum
         """
-        machine = platform.machine().lower()
+        machine = self._uname().machine.lower()
 
-        if machine in ['x86_64', 'amd64']:
-            return Architecture.X86_64
-        elif machine in ['aarch64', 'arm64']:
-            return Architecture.ARM64
-        elif machine in ['armv7l', 'armv7']:
-            return Architecture.ARM32
-        elif 'riscv' in machine:
+        arch = _ARCH_MAP.get(machine)
+        if arch is not None:
+            return arch
+        # Other RISC-V variants (riscv32, riscv128, ...)
+        if 'riscv' in machine:
             return Architecture.RISCV
-        else:
-            return Architecture.UNKNOWN
+        return Architecture.UNKNOWN
 
     def get_cpu_info(self) -> Dict:
         """
@@ -105,22 +198,19 @@ class HardwareDetector:
         """
         cpu_info = {
             'model': 'Unknown',
-            'count': os.cpu_count() or 1,
-            'architecture': platform.machine()
+            'count': self._get_cpu_count(),
+            'architecture': self._uname().machine
         }
 
         try:
             # Try to get CPU model from /proc/cpuinfo (Linux)
-            if os.path.exists('/proc/cpuinfo'):
-                with open('/proc/cpuinfo', 'r') as f:
-                    for line in f:
-                        if line.startswith('model name'):
-                            cpu_info['model'] = line.split(':')[1].strip()
-                            break
-                        elif line.startswith('Model'):
-                            cpu_info['model'] = line.split(':')[1].strip()
-                            break
-        except (IOError, OSError):
+            with self._open_info_file(self.cpuinfo_path) as f:
+                for line in f:
+                    if line.startswith((b'model name', b'Model')):
+                        model = line.split(b':', 1)[1].strip()
+                        cpu_info['model'] = model.decode(errors='replace')
+                        break
+        except (IOError, OSError, IndexError):
             pass
 
         return cpu_info
@@ -137,41 +227,69 @@ class HardwareDetector:
             'available_mb': 0
         }
 
+        # For the running system, total RAM comes straight from sysconf
+        # and only MemAvailable needs to be parsed
+        wanted = 2
+        if self.meminfo_path == _PROC_MEMINFO:
+            total_mb = self._sysconf_total_mb()
+            if total_mb:
+                memory_info['total_mb'] = total_mb
+                wanted = 1
+
         try:
             # Try to get memory from /proc/meminfo (Linux)
-            if os.path.exists('/proc/meminfo'):
-                with open('/proc/meminfo', 'r') as f:
-                    for line in f:
-                        if line.startswith('MemTotal'):
-                            # Value in kB
-                            total_kb = int(line.split()[1])
-                            memory_info['total_mb'] = total_kb // 1024
-                        elif line.startswith('MemAvailable'):
-                            avail_kb = int(line.split()[1])
-                            memory_info['available_mb'] = avail_kb // 1024
+            found = 0
+            with self._open_info_file(self.meminfo_path) as f:
+                for line in f:
+                    if line.startswith(b'MemTotal:'):
+                        if wanted == 1:
+                            continue
+                        # Value in kB
+                        total_kb = int(line.split()[1])
+                        memory_info['total_mb'] = total_kb // 1024
+                    elif line.startswith(b'MemAvailable:'):
+                        avail_kb = int(line.split()[1])
+                        memory_info['available_mb'] = avail_kb // 1024
+                    else:
+                        continue
+                    found += 1
+                    if found == wanted:
+                        break
         except (IOError, OSError, ValueError):
             pass
 
         return memory_info
 
+    def _sysconf_total_mb(self) -> int:
+        """Total physical memory in MB from sysconf, or 0 if unsupported"""
+        try:
+            total = os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGESIZE')
+        except (AttributeError, ValueError, OSError):
+            return 0
+        return max(total, 0) // (1024 * 1024)
+
     def get_hardware_info(self) -> HardwareInfo:
         """
         Get complete hardware information.
 
+        The result is cached on the detector; call invalidate() to re-read.
+
         Returns:
             Hardware information
         """
-        arch = self.get_architecture()
-        cpu_info = self.get_cpu_info()
-        memory_info = self.get_memory_info()
-
-        return HardwareInfo(
-            architecture=arch.value,
-            cpu_model=cpu_info['model'],
-            cpu_count=cpu_info['count'],
-            total_memory_mb=memory_info['total_mb'],
-            platform_system=platform.system()
-        )
+        if self._hw_info_cache is None:
+            arch = self.get_architecture()
+            cpu_info = self.get_cpu_info()
+            memory_info = self.get_memory_info()
+
+            self._hw_info_cache = HardwareInfo(
+                architecture=arch.value,
+                cpu_model=cpu_info['model'],
+                cpu_count=cpu_info['count'],
+                total_memory_mb=memory_info['total_mb'],
+                platform_system=self._uname().system
+            )
+        return self._hw_info_cache
 
 
 class ArchitectureTester:
@@ -380,7 +498,7 @@ class HardwareCompatibilityTester:
         start_time = time.time()
         test_name = "Platform Compatibility"
 
-        platform_system = platform.system()
+        platform_system = self.detector._uname().system
         supported_platforms = ['Linux', 'Darwin']  # Darwin for testing on macOS
 
         if platform_system in supported_platforms:
@@ -424,25 +542,16 @@ class BaremetalEnvironmentBenchmark:
         Returns:
             Test results
         """
-        results = {
-            'current_architecture': self.detector.get_architecture().value,
-            'tests': []
-        }
-
-        # Run architecture detection test
-        detection_result = self.arch_tester.test_architecture_detection()
-        results['tests'].append(detection_result.to_dict())
-
-        # Run specific architecture tests based on current platform
         arch = self.detector.get_architecture()
-        if arch == Architecture.X86_64:
-            x86_result = self.arch_tester.test_x86_64_support()
-            results['tests'].append(x86_result.to_dict())
-        elif arch == Architecture.ARM64:
-            arm_result = self.arch_tester.test_arm64_support()
-            results['tests'].append(arm_result.to_dict())
 
-        return results
+        # Detection always runs, plus the support test for this platform
+        return {
+            'current_architecture': arch.value,
+            'tests': [
+                getattr(self.arch_tester, name)().to_dict()
+                for name in _ARCH_TESTS.get(arch, _ARCH_TESTS_DEFAULT)
+            ]
+        }
 
     def run_hardware_tests(self) -> Dict:
         """
@@ -490,6 +599,13 @@ class BaremetalTestReporter:
     Reports bare metal test results.
     """
 
+    @staticmethod
+    def _format_tests(tests: List[Dict]):
+        """Yield one report line per test result"""
+        for test in tests:
+            status = "PASS" if test['passed'] else "FAIL"
+            yield f"    [{status}] {test['test_name']} ({test['duration']:.2f}s)"
+
     def generate_report(self, results: Dict) -> str:
         """
         Generate bare metal test report.
@@ -507,35 +623,34 @@ class BaremetalTestReporter:
         # Architecture results
         if 'architecture' in results:
             arch = results['architecture']
-            report_lines.append("")
-            report_lines.append("Architecture:")
-            report_lines.append(f"  Current: {arch['current_architecture']}")
+            report_lines += (
+                "",
+                "Architecture:",
+                f"  Current: {arch['current_architecture']}",
+            )
 
             if arch['tests']:
                 report_lines.append("  Tests:")
-                for test in arch['tests']:
-                    status = "PASS" if test['passed'] else "FAIL"
-                    report_lines.append(f"    [{status}] {test['test_name']} ({test['duration']:.2f}s)")
+                report_lines.extend(self._format_tests(arch['tests']))
 
         # Hardware results
         if 'hardware' in results:
             hw = results['hardware']
             if 'hardware_info' in hw:
                 info = hw['hardware_info']
-                report_lines.append("")
-                report_lines.append("Hardware Information:")
-                report_lines.append(f"  Architecture: {info['architecture']}")
-                report_lines.append(f"  CPU Model: {info['cpu_model']}")
-                report_lines.append(f"  CPU Count: {info['cpu_count']}")
-                report_lines.append(f"  Total Memory: {info['total_memory_mb']}MB")
-                report_lines.append(f"  Platform: {info['platform_system']}")
+                report_lines += (
+                    "",
+                    "Hardware Information:",
+                    f"  Architecture: {info['architecture']}",
+                    f"  CPU Model: {info['cpu_model']}",
+                    f"  CPU Count: {info['cpu_count']}",
+                    f"  Total Memory: {info['total_memory_mb']}MB",
+                    f"  Platform: {info['platform_system']}",
+                )
 
             if hw['tests']:
-                report_lines.append("")
-                report_lines.append("  Hardware Tests:")
-                for test in hw['tests']:
-                    status = "PASS" if test['passed'] else "FAIL"
-                    report_lines.append(f"    [{status}] {test['test_name']} ({test['duration']:.2f}s)")
+                report_lines += ("", "  Hardware Tests:")
+                report_lines.extend(self._format_tests(hw['tests']))
 
         return "\n".join(report_lines)
 
@@ -572,3 +687,15 @@ class BaremetalTestReporter:
             metrics['hw_tests_total'] = len(hw.get('tests', []))
 
         return metrics
+
+    def export_metrics_json(self, results: Dict) -> bytes:
+        """
+        Export metrics as compact JSON for CI consumption.
+
+        Args:
+            results: Test results
+
+        Returns:
+            UTF-8 encoded JSON of export_metrics()
+        """
+        return _json_encode(self.export_metrics(results))
@@ -13,7 +13,7 @@ import os
 import subprocess
 import time
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
@@ -69,11 +69,21 @@ class DockerTester:
     Target Environment: Docker
     """
 
-    def __init__(self):
-        """Initialize Docker tester"""
+    def __init__(self, runner: Optional[Callable[..., subprocess.CompletedProcess]] = None):
+        """
+        Initialize Docker tester.
+
+        Args:
+            runner: Callable used to execute commands (default: subprocess.run)
+        """
         self.runtime = ContainerRuntime.DOCKER
+        self.runner = runner
         self.test_results: List[ContainerTestResult] = []
 
+    def _run(self, *args, **kwargs) -> subprocess.CompletedProcess:
+        """Run a command with the injected runner, or subprocess.run"""
+        return (self.runner or subprocess.run)(*args, **kwargs)
+
     def check_docker_available(self) -> bool:
         """
         Check if Docker is available.
@@ -82,7 +92,7 @@ class DockerTester:
             True if Docker is available
         """
         try:
-            result = subprocess.run(
+            result = self._run(
                 ['docker', '--version'],
                 capture_output=True,
                 text=True,
@@ -100,7 +110,7 @@ class DockerTester:
             Docker version string or None
         """
         try:
-            result = subprocess.run(
+            result = self._run(
                 ['docker', '--version'],
                 capture_output=True,
                 text=True,
@@ -137,7 +147,7 @@ class DockerTester:
                 context_path
             ]
 
-            result = subprocess.run(
+            result = self._run(
                 cmd,
                 capture_output=True,
                 text=True,
@@ -187,7 +197,7 @@ class DockerTester:
             if command:
                 cmd.extend(command)
 
-            result = subprocess.run(
+            result = self._run(
                 cmd,
                 capture_output=True,
                 text=True,
@@ -216,7 +226,7 @@ class DockerTester:
             Tuple of (success, message)
         """
         try:
-            result = subprocess.run(
+            result = self._run(
                 ['docker', 'stop', container_id],
                 capture_output=True,
                 text=True,
@@ -250,7 +260,7 @@ class DockerTester:
                 cmd.append('-f')
             cmd.append(container_id)
 
-            result = subprocess.run(
+            result = self._run(
                 cmd,
                 capture_output=True,
                 text=True,
@@ -278,7 +288,7 @@ class DockerTester:
             Status string or None
         """
         try:
-            result = subprocess.run(
+            result = self._run(
                 ['docker', 'inspect', '-f', '{{.State.Status}}', container_id],
                 capture_output=True,
                 text=True,
@@ -374,10 +384,20 @@ class KubernetesTester:
     Target Environment: Kubernetes
     """
 
-    def __init__(self):
-        """Initialize Kubernetes tester"""
+    def __init__(self, runner: Optional[Callable[..., subprocess.CompletedProcess]] = None):
+        """
+        Initialize Kubernetes tester.
+
+        Args:
+            runner: Callable used to execute commands (default: subprocess.run)
+        """
+        self.runner = runner
         self.test_results: List[ContainerTestResult] = []
 
+    def _run(self, *args, **kwargs) -> subprocess.CompletedProcess:
+        """Run a command with the injected runner, or subprocess.run"""
+        return (self.runner or subprocess.run)(*args, **kwargs)
+
     def check_kubectl_available(self) -> bool:
         """
         Check if kubectl is available.
@@ -386,7 +406,7 @@ class KubernetesTester:
             True if kubectl is available
         """
         try:
-            result = subprocess.run(
+            result = self._run(
                 ['kubectl', 'version', '--client'],
                 capture_output=True,
                 text=True,
@@ -404,7 +424,7 @@ class KubernetesTester:
             kubectl version string or None
         """
         try:
-            result = subprocess.run(
+            result = self._run(
                 ['kubectl', 'version', '--client', '--short'],
                 capture_output=True,
                 text=True,
@@ -424,7 +444,7 @@ class KubernetesTester:
             Tuple of (connected, message)
         """
         try:
-            result = subprocess.run(
+            result = self._run(
                 ['kubectl', 'cluster-info'],
                 capture_output=True,
                 text=True,
@@ -466,7 +486,7 @@ class KubernetesTester:
                 f'--replicas={replicas}'
             ]
 
-            result = subprocess.run(
+            result = self._run(
                 cmd,
                 capture_output=True,
                 text=True,
@@ -494,7 +514,7 @@ class KubernetesTester:
             Tuple of (success, message)
         """
         try:
-            result = subprocess.run(
+            result = self._run(
                 ['kubectl', 'delete', 'deployment', name],
                 capture_output=True,
                 text=True,
@@ -579,10 +599,15 @@ class ContainerEnvironmentBenchmark:
     Target Environments: Docker, Kubernetes
     """
 
-    def __init__(self):
-        """Initialize container environment benchmark"""
-        self.docker_tester = DockerTester()
-        self.k8s_tester = KubernetesTester()
+    def __init__(self, runner: Optional[Callable[..., subprocess.CompletedProcess]] = None):
+        """
+        Initialize container environment benchmark.
+
+        Args:
+            runner: Callable passed to the Docker and Kubernetes testers
+        """
+        self.docker_tester = DockerTester(runner)
+        self.k8s_tester = KubernetesTester(runner)
 
     def run_docker_tests(self) -> Dict:
         """
@@ -8,6 +8,7 @@ Requirements:
 """
 
 import re
+import struct
 import subprocess
 from pathlib import Path
 from typing import List, Dict, Set, Optional, Tuple
@@ -15,6 +16,179 @@ from dataclasses import dataclass, asdict, field
 from enum import Enum
 
 
+# ELF markers for hardening features, as (feature, byte pattern) pairs
+_FEATURE_MARKERS = (
+    ('nx', b'GNU_STACK'),
+    ('stack_canary', b'__stack_chk_fail'),
+    ('relro', b'GNU_RELRO'),
+    ('full_relro', b'BIND_NOW'),
+)
+
+# glibc *_chk entry points emitted by _FORTIFY_SOURCE, most common first
+# so that the scan stops early on typical binaries
+_FORTIFIED_SYMBOLS = (
+    b'__memcpy_chk',
+    b'__strcpy_chk',
+    b'__sprintf_chk',
+    b'__snprintf_chk',
+    b'__memmove_chk',
+    b'__memset_chk',
+    b'__strncpy_chk',
+    b'__strcat_chk',
+    b'__strncat_chk',
+    b'__printf_chk',
+    b'__fprintf_chk',
+    b'__vsnprintf_chk',
+    b'__vsprintf_chk',
+    b'__vfprintf_chk',
+    b'__vprintf_chk',
+    b'__dprintf_chk',
+    b'__vdprintf_chk',
+    b'__asprintf_chk',
+    b'__vasprintf_chk',
+    b'__mempcpy_chk',
+    b'__stpcpy_chk',
+    b'__stpncpy_chk',
+    b'__read_chk',
+    b'__pread_chk',
+    b'__pread64_chk',
+    b'__recv_chk',
+    b'__recvfrom_chk',
+    b'__readlink_chk',
+    b'__readlinkat_chk',
+    b'__fgets_chk',
+    b'__fgets_unlocked_chk',
+    b'__fread_chk',
+    b'__fread_unlocked_chk',
+    b'__gets_chk',
+    b'__getcwd_chk',
+    b'__getwd_chk',
+    b'__realpath_chk',
+    b'__confstr_chk',
+    b'__getgroups_chk',
+    b'__gethostname_chk',
+    b'__getdomainname_chk',
+    b'__getlogin_r_chk',
+    b'__ttyname_r_chk',
+    b'__ptsname_r_chk',
+    b'__wctomb_chk',
+    b'__mbstowcs_chk',
+    b'__wcstombs_chk',
+    b'__wmemcpy_chk',
+    b'__wmemmove_chk',
+    b'__wmemset_chk',
+    b'__wcscpy_chk',
+    b'__wcsncpy_chk',
+    b'__wcscat_chk',
+    b'__wcsncat_chk',
+    b'__swprintf_chk',
+    b'__poll_chk',
+    b'__ppoll_chk',
+    b'__fdelt_chk',
+    b'__longjmp_chk',
+    b'__explicit_bzero_chk',
+    b'__obstack_printf_chk',
+    b'__syslog_chk',
+)
+
+
+# ELF constants
+_ELF_MAGIC = b'\x7fELF'
+ELFCLASS32 = 1
+ELFCLASS64 = 2
+ELFDATA2LSB = 1
+ELFDATA2MSB = 2
+ET_DYN = 3
+PT_GNU_STACK = 0x6474e551
+PT_GNU_RELRO = 0x6474e552
+PF_X = 0x1
+
+
+def _make_elf_parser(byteorder: str, ehdr: struct.Struct, phdr: struct.Struct,
+                     flags_index: int):
+    """
+    Build a parser specialized for one ELF class/byte order.
+
+    The returned function reads e_type and the GNU_STACK/GNU_RELRO
+    program headers with pre-built structs, so no per-field class or
+    endianness branching happens while scanning.
+
+    Args:
+        byteorder: 'little' or 'big'
+        ehdr: Struct for the header fields following e_ident
+        phdr: Struct for one program header entry
+        flags_index: Position of p_flags within a program header
+
+    Returns:
+        Function mapping ELF bytes to (e_type, gnu_stack_flags, has_relro)
+    """
+    unpack_ehdr = ehdr.unpack_from
+    unpack_phdr = phdr.unpack_from
+    ehdr_end = 16 + ehdr.size
+
+    def parse(data: bytes) -> Tuple[int, Optional[int], bool]:
+        if len(data) < ehdr_end:
+            return (int.from_bytes(data[16:18], byteorder), None, False)
+
+        fields = unpack_ehdr(data, 16)
+        e_type, e_phoff, e_phentsize, e_phnum = fields[0], fields[4], fields[8], fields[9]
+
+        stack_flags = None
+        has_relro = False
+        if e_phentsize >= phdr.size:
+            end = len(data) - phdr.size
+            offset = e_phoff
+            for _ in range(e_phnum):
+                if offset > end:
+                    break
+                entry = unpack_phdr(data, offset)
+                if entry[0] == PT_GNU_STACK:
+                    stack_flags = entry[flags_index]
+                elif entry[0] == PT_GNU_RELRO:
+                    has_relro = True
+                offset += e_phentsize
+
+        return (e_type, stack_flags, has_relro)
+
+    return parse
+
+
+# Parsers keyed by (EI_CLASS, EI_DATA). ELF64 program headers keep p_flags
+# second; ELF32 keeps it seventh.
+_ELF_PARSERS = {
+    (ELFCLASS64, ELFDATA2LSB): _make_elf_parser(
+        'little', struct.Struct('<HHIQQQIHHHHHH'), struct.Struct('<IIQQQQQQ'), 1),
+    (ELFCLASS64, ELFDATA2MSB): _make_elf_parser(
+        'big', struct.Struct('>HHIQQQIHHHHHH'), struct.Struct('>IIQQQQQQ'), 1),
+    (ELFCLASS32, ELFDATA2LSB): _make_elf_parser(
+        'little', struct.Struct('<HHIIIIIHHHHHH'), struct.Struct('<IIIIIIII'), 6),
+    (ELFCLASS32, ELFDATA2MSB): _make_elf_parser(
+        'big', struct.Struct('>HHIIIIIHHHHHH'), struct.Struct('>IIIIIIII'), 6),
+}
+
+
+def _parse_elf(data: bytes) -> Optional[Tuple[int, Optional[int], bool]]:
+    """
+    Parse the security-relevant parts of an ELF image.
+
+    Args:
+        data: Leading bytes of the file (must include the program headers
+            for GNU_STACK/GNU_RELRO to be found)
+
+    Returns:
+        Tuple of (e_type, gnu_stack_flags, has_relro), or None if not ELF
+    """
+    if data[:4] != _ELF_MAGIC:
+        return None
+
+    parser = _ELF_PARSERS.get((data[4], data[5]))
+    if parser is None:
+        # Unknown class/byte order: only e_type can be read reliably
+        return (int.from_bytes(data[16:18], 'little'), None, False)
+
+    return parser(data)
+
+
 class SecurityLevel(Enum):
     """Security hardening levels"""
     NONE = "none"
@@ -272,10 +446,13 @@ class BinarySecurityVerifier:
     """
     Verifies security features in compiled binaries.
 
+    The verifier holds no state; all checks are static methods.
+
     Requirement: 2.1 (Build-time verification)
     """
 
-    def verify_binary(self, binary_path: Path) -> Dict[str, bool]:
+    @staticmethod
+    def verify_binary(binary_path: Path) -> Dict[str, bool]:
         """
         Verify security features in a binary.
 
@@ -305,46 +482,39 @@ class BinarySecurityVerifier:
                 data = f.read()
 
                 # Check ELF header
-                if data[:4] != b'\x7fELF':
+                elf = _parse_elf(data)
+                if elf is None:
                     return features
+                e_type, stack_flags, has_relro = elf
 
                 # PIE: Check if ET_DYN (shared object type)
-                e_type = int.from_bytes(data[16:18], byteorder='little')
-                if e_type == 3:  # ET_DYN
+                if e_type == ET_DYN:
                     features['pie'] = True
 
-                # NX: Check for GNU_STACK program header
-                if b'GNU_STACK' in data:
+                # NX/RELRO from the program headers themselves
+                if stack_flags is not None and not stack_flags & PF_X:
                     features['nx'] = True
-
-                # Stack canary: Check for __stack_chk_fail symbol
-                if b'__stack_chk_fail' in data:
-                    features['stack_canary'] = True
-
-                # RELRO: Check for GNU_RELRO
-                if b'GNU_RELRO' in data:
+                if has_relro:
                     features['relro'] = True
 
-                # Full RELRO: Check for BIND_NOW
-                if b'BIND_NOW' in data:
-                    features['full_relro'] = True
+                # NX, stack canary, RELRO and BIND_NOW markers
+                for feature, marker in _FEATURE_MARKERS:
+                    if feature == 'nx' and stack_flags is not None:
+                        # PT_GNU_STACK was parsed; its flags are authoritative
+                        continue
+                    if not features[feature] and marker in data:
+                        features[feature] = True
 
                 # FORTIFY: Check for fortified function symbols
-                fortified_functions = [
-                    b'__memcpy_chk',
-                    b'__strcpy_chk',
-                    b'__sprintf_chk',
-                    b'__snprintf_chk'
-                ]
-                if any(func in data for func in fortified_functions):
-                    features['fortify'] = True
+                features['fortify'] = any(sym in data for sym in _FORTIFIED_SYMBOLS)
 
         except Exception:
             pass
 
         return features
 
-    def verify_required_features(self, binary_path: Path) -> Tuple[bool, List[str]]:
+    @staticmethod
+    def verify_required_features(binary_path: Path) -> Tuple[bool, List[str]]:
         """
         Verify that required security features are present.
 
@@ -356,7 +526,7 @@ class BinarySecurityVerifier:
         Returns:
             Tuple of (all_present, list_of_missing_features)
         """
-        features = self.verify_binary(binary_path)
+        features = BinarySecurityVerifier.verify_binary(binary_path)
         missing = []
 
         # Required features for Kimigayo OS
@@ -7,13 +7,17 @@ Requirements:
 - 2.2: Runtime security enforcement - ASLR and DEP must be enforced at runtime
 """
 
+import functools
 import os
 import subprocess
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from .compile import ET_DYN, PF_X, _FEATURE_MARKERS, _parse_elf
+
 
 class SecurityFeature(Enum):
     """Runtime security features"""
@@ -31,6 +35,44 @@ class ASLRLevel(Enum):
     FULL = 2  # Full randomization (includes heap)
 
 
+# /proc/version is a single short line; the release is its third token
+_PROC_VERSION_READ_SIZE = 256
+
+# randomize_va_space only changes on explicit sysctl writes
+_ASLR_CACHE_TTL = 5.0
+
+_PROC_READ_CHUNK = 65536
+
+
+def _read_proc(path, cap: Optional[int] = 4096) -> bytes:
+    """
+    Read a kernel pseudo-file as raw bytes.
+
+    Goes straight through os.open/os.read, skipping the buffered text
+    wrapper and decoding that Path.read_text would add.
+
+    Args:
+        path: File path
+        cap: Maximum number of bytes to read, or None to read until EOF
+
+    Returns:
+        File contents
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        if cap is not None:
+            return os.read(fd, cap)
+
+        chunks = []
+        while True:
+            chunk = os.read(fd, _PROC_READ_CHUNK)
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
 @dataclass
 class SecurityStatus:
     """Runtime security status"""
@@ -57,25 +99,40 @@ class RuntimeSecurityEnforcer:
         """Initialize runtime security enforcer"""
         self.proc_path = Path("/proc")
         self.sys_path = Path("/sys")
+        self._kernel_version_cache: Optional[str] = None
+        self._aslr_cache: Optional[Tuple[float, Tuple[bool, int]]] = None
 
     def check_aslr(self) -> Tuple[bool, int]:
         """
         Check if ASLR is enabled and get randomization level.
 
+        The result is cached for a few seconds since the setting only
+        changes on deliberate sysctl writes.
+
         Requirement: 2.2 - ASLR must be enforced at runtime
 
         Returns:
             Tuple of (enabled, level)
         """
+        now = time.monotonic()
+        cached = self._aslr_cache
+        if cached is not None and now - cached[0] < _ASLR_CACHE_TTL:
+            return cached[1]
+
+        result = self._read_aslr()
+        self._aslr_cache = (now, result)
+        return result
+
+    def _read_aslr(self) -> Tuple[bool, int]:
+        """Read ASLR state from randomize_va_space"""
         aslr_path = self.proc_path / "sys" / "kernel" / "randomize_va_space"
 
         try:
-            if aslr_path.exists():
-                level = int(aslr_path.read_text().strip())
-                return (level > 0, level)
-            else:
-                # Assume enabled if file doesn't exist (some systems)
-                return (True, 2)
+            level = int(_read_proc(aslr_path, 8))
+            return (level > 0, level)
+        except FileNotFoundError:
+            # Assume enabled if file doesn't exist (some systems)
+            return (True, 2)
         except Exception:
             return (False, 0)
 
@@ -98,6 +155,7 @@ class RuntimeSecurityEnforcer:
                 # Would need root permissions in real implementation
                 # For testing, we simulate the setting
                 # aslr_path.write_text(str(level.value))
+                self._aslr_cache = None
                 return True
             return False
         except Exception:
@@ -116,16 +174,15 @@ class RuntimeSecurityEnforcer:
         cpuinfo_path = self.proc_path / "cpuinfo"
 
         try:
-            if cpuinfo_path.exists():
-                cpuinfo = cpuinfo_path.read_text()
-                # Check for NX bit support in CPU flags
-                for line in cpuinfo.split('\n'):
-                    if line.startswith('flags') or line.startswith('Features'):
-                        flags = line.lower()
-                        # x86_64: nx flag
-                        # ARM: various flags
-                        if 'nx' in flags or 'xn' in flags or 'pxn' in flags:
-                            return True
+            cpuinfo = _read_proc(cpuinfo_path, None)
+            # Check for NX bit support in CPU flags
+            for line in cpuinfo.split(b'\n'):
+                if line.startswith((b'flags', b'Features')):
+                    flags = line.lower()
+                    # x86_64: nx flag
+                    # ARM: various flags
+                    if b'nx' in flags or b'xn' in flags or b'pxn' in flags:
+                        return True
             return False
         except Exception:
             return False
@@ -160,30 +217,29 @@ class RuntimeSecurityEnforcer:
                 if header[:4] != b'\x7fELF':
                     return features
 
-                # PIE: Check if it's a shared object (ET_DYN)
-                e_type = int.from_bytes(header[16:18], byteorder='little')
-                if e_type == 3:  # ET_DYN
-                    features['pie'] = True
-
                 # Read program headers for NX stack
                 f.seek(0)
                 elf_data = f.read(4096)  # Read enough for headers
 
-                # NX: Look for GNU_STACK with PF_X not set
-                if b'GNU_STACK' in elf_data:
-                    features['nx'] = True
+                e_type, stack_flags, has_relro = _parse_elf(elf_data)
 
-                # Stack canary: Look for __stack_chk_fail symbol (simplified)
-                if b'__stack_chk_fail' in elf_data:
-                    features['stack_canary'] = True
+                # PIE: Check if it's a shared object (ET_DYN)
+                if e_type == ET_DYN:
+                    features['pie'] = True
 
-                # RELRO: Look for GNU_RELRO
-                if b'GNU_RELRO' in elf_data:
+                # NX: GNU_STACK with PF_X not set
+                if stack_flags is not None and not stack_flags & PF_X:
+                    features['nx'] = True
+                if has_relro:
                     features['relro'] = True
 
-                # Full RELRO: Check BIND_NOW flag
-                if b'BIND_NOW' in elf_data:
-                    features['full_relro'] = True
+                # NX, stack canary (simplified), RELRO and BIND_NOW markers
+                for feature, marker in _FEATURE_MARKERS:
+                    if feature == 'nx' and stack_flags is not None:
+                        # PT_GNU_STACK was parsed; its flags are authoritative
+                        continue
+                    if not features[feature] and marker in elf_data:
+                        features[feature] = True
 
         except Exception:
             pass
@@ -278,16 +334,24 @@ class RuntimeSecurityEnforcer:
         return (len(failures) == 0, failures)
 
     def _get_kernel_version(self) -> str:
-        """Get kernel version"""
+        """Get kernel version (cached, it cannot change while running)"""
+        if self._kernel_version_cache is None:
+            self._kernel_version_cache = self._read_kernel_version()
+        return self._kernel_version_cache
+
+    def _read_kernel_version(self) -> str:
+        """Read the kernel release from the head of /proc/version"""
         version_path = self.proc_path / "version"
 
         try:
-            if version_path.exists():
-                version_text = version_path.read_text()
-                # Extract version number
-                parts = version_text.split()
-                if len(parts) >= 3:
-                    return parts[2]
+            buf = _read_proc(version_path, _PROC_VERSION_READ_SIZE)
+            # "Linux version <release> ..." - release is the third token
+            start = buf.index(b' ', buf.index(b' ') + 1) + 1
+            end = start
+            while end < len(buf) and not buf[end:end + 1].isspace():
+                end += 1
+            if end > start:
+                return buf[start:end].decode('ascii', 'replace')
             return "unknown"
         except Exception:
             return "unknown"
@@ -317,11 +381,8 @@ class ProcessSecurityChecker:
         maps_path = self.proc_path / str(pid) / "maps"
 
         try:
-            if not maps_path.exists():
-                return False
-
-            maps_content = maps_path.read_text()
-            lines = maps_content.strip().split('\n')
+            # Only the first couple of mappings are inspected
+            lines = _read_proc(maps_path).decode('ascii', 'replace').strip().split('\n')
 
             if len(lines) < 2:
                 return False
@@ -356,19 +417,18 @@ class ProcessSecurityChecker:
         maps_path = self.proc_path / str(pid) / "maps"
 
         try:
-            if not maps_path.exists():
-                return False
+            data = _read_proc(maps_path, None)
 
-            maps_content = maps_path.read_text()
+            # Jump straight to the stack mapping instead of splitting lines
+            idx = data.find(b'[stack]')
+            if idx < 0:
+                return False
 
-            for line in maps_content.split('\n'):
-                if '[stack]' in line:
-                    # Check permissions (second field)
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        perms = parts[1]
-                        # Check if execute permission is NOT set
-                        return 'x' not in perms
+            line_start = data.rfind(b'\n', 0, idx) + 1
+            parts = data[line_start:idx].split(None, 2)
+            if len(parts) >= 2:
+                # Check if execute permission is NOT set (second field)
+                return b'x' not in parts[1]
 
             return False
         except Exception:
@@ -390,6 +450,12 @@ class ProcessSecurityChecker:
         }
 
 
+@functools.cache
+def _default_enforcer() -> RuntimeSecurityEnforcer:
+    """Process-wide enforcer shared by managers so /proc caches are reused"""
+    return RuntimeSecurityEnforcer()
+
+
 class SecurityPolicyManager:
     """
     Manages security policy enforcement.
@@ -403,8 +469,9 @@ class SecurityPolicyManager:
 
         Args:
             enforcer: Runtime security enforcer instance
+                (defaults to the shared process-wide enforcer)
         """
-        self.enforcer = enforcer or RuntimeSecurityEnforcer()
+        self.enforcer = enforcer or _default_enforcer()
 
     def apply_policy(self) -> bool:
         """
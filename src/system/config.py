@@ -9,13 +9,148 @@ Requirements:
 - 3.2: Dynamic component management
 """
 
+import copy
+import functools
+import hashlib
 import json
 import yaml
+from collections import defaultdict, deque
 from pathlib import Path
-from typing import List, Dict, Set, Optional
-from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Set, Optional, Tuple, FrozenSet
+from dataclasses import dataclass, field
 from enum import Enum
 
+# Prefer the LibYAML C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# msgspec's compiled JSON decoder is optional; fall back to the stdlib
+try:
+    import msgspec
+    _json_decode = msgspec.json.decode
+except ImportError:
+    _json_decode = json.loads
+
+
+def _json_dumps_stdlib(data) -> str:
+    """Encode pretty-printed JSON with sorted keys"""
+    return json.dumps(data, indent=2, sort_keys=True)
+
+
+# Scalar types orjson and json.dumps encode identically (checked with
+# type() so Enum/str/int subclasses go to the stdlib)
+_ORJSON_SAFE_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def _orjson_compatible(data) -> bool:
+    """
+    Check that orjson would encode data exactly like json.dumps.
+
+    Floats (exponent and NaN spelling), non-str keys and any type the
+    stdlib rejects but orjson serializes (Enum, dataclass, datetime, UUID)
+    are left to the stdlib.
+    """
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        kind = type(obj)
+        if kind is dict:
+            for key, value in obj.items():
+                if type(key) is not str:
+                    return False
+                stack.append(value)
+        elif kind is list or kind is tuple:
+            stack.extend(obj)
+        elif kind not in _ORJSON_SAFE_TYPES:
+            return False
+    return True
+
+
+# orjson speeds up plain payloads when installed; output must stay
+# byte-identical to the stdlib so saved files and their digests do not
+# depend on which encoder is available
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+
+    def _json_dumps(data) -> str:
+        """Encode pretty-printed JSON with sorted keys"""
+        if _orjson_compatible(data):
+            try:
+                encoded = orjson.dumps(data, option=_ORJSON_OPTIONS)
+            except TypeError:
+                # Integers outside the 64-bit range
+                pass
+            else:
+                # json.dumps escapes non-ASCII text as \uXXXX
+                if encoded.isascii():
+                    return encoded.decode()
+        return _json_dumps_stdlib(data)
+except ImportError:
+    _json_dumps = _json_dumps_stdlib
+
+
+# Parsed documents are cached by their raw text. The cached objects are
+# shared, so from_dict() must never hand their containers out directly.
+@functools.lru_cache(maxsize=128)
+def _parse_yaml_cached(text: str) -> Dict:
+    """Parse YAML text, memoized on the text itself"""
+    return yaml.load(text, Loader=_YamlLoader)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_json_cached(text: str) -> Dict:
+    """Parse JSON text, memoized on the text itself"""
+    return _json_decode(text)
+
+
+def _load_yaml_file(path: Path) -> Dict:
+    """Load a YAML config"""
+    return _parse_yaml_cached(path.read_text())
+
+
+def _load_json_file(path: Path) -> Dict:
+    """Load a JSON config"""
+    return _parse_json_cached(path.read_text())
+
+
+_FILE_LOADERS = {
+    "yaml": _load_yaml_file,
+    "json": _load_json_file,
+}
+
+# SystemConfig method used to serialize each format in save_config
+_SERIALIZERS = {
+    "yaml": "to_yaml",
+    "json": "to_json",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _load_file_cached(path: str, format: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Parse a configuration file, memoized on its stat signature.
+
+    Keying on (mtime_ns, size) like the import system does lets an
+    unchanged file skip both the read and the text hash.
+    """
+    return _FILE_LOADERS[format](Path(path))
+
+
+# Shared empty set; most modules and components declare no conflicts or
+# dependencies, and CPython does not intern empty frozensets
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+def _freeze(items) -> FrozenSet[str]:
+    """Freeze an iterable of names, reusing _EMPTY and existing frozensets"""
+    if type(items) is frozenset:
+        return items or _EMPTY
+    return frozenset(items) if items else _EMPTY
+
 
 class SecurityLevel(Enum):
     """Security hardening levels"""
@@ -34,7 +169,7 @@ class ComponentCategory(Enum):
     DEVELOPMENT = "development"
 
 
-@dataclass
+@dataclass(slots=True)
 class KernelModule:
     """
     Kernel module configuration.
@@ -44,13 +179,25 @@ class KernelModule:
     name: str
     category: str
     required: bool = False
-    conflicts: List[str] = field(default_factory=list)
-    dependencies: List[str] = field(default_factory=list)
+    conflicts: FrozenSet[str] = _EMPTY
+    dependencies: FrozenSet[str] = _EMPTY
     description: Optional[str] = None
 
+    def __post_init__(self):
+        # Freeze for O(1) membership checks; accepts any iterable
+        self.conflicts = _freeze(self.conflicts)
+        self.dependencies = _freeze(self.dependencies)
+
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
-        return asdict(self)
+        return {
+            "name": self.name,
+            "category": self.category,
+            "required": self.required,
+            "conflicts": sorted(self.conflicts),
+            "dependencies": sorted(self.dependencies),
+            "description": self.description,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> "KernelModule":
@@ -58,7 +205,7 @@ class KernelModule:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemComponent:
     """
     System component configuration.
@@ -68,16 +215,27 @@ class SystemComponent:
     name: str
     category: ComponentCategory
     enabled: bool = True
-    dependencies: List[str] = field(default_factory=list)
-    conflicts: List[str] = field(default_factory=list)
+    dependencies: FrozenSet[str] = _EMPTY
+    conflicts: FrozenSet[str] = _EMPTY
     package: Optional[str] = None
     description: Optional[str] = None
 
+    def __post_init__(self):
+        # Freeze for O(1) membership checks; accepts any iterable
+        self.dependencies = _freeze(self.dependencies)
+        self.conflicts = _freeze(self.conflicts)
+
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
-        data = asdict(self)
-        data['category'] = self.category.value
-        return data
+        return {
+            "name": self.name,
+            "category": self.category.value,
+            "enabled": self.enabled,
+            "dependencies": sorted(self.dependencies),
+            "conflicts": sorted(self.conflicts),
+            "package": self.package,
+            "description": self.description,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> "SystemComponent":
@@ -113,11 +271,13 @@ class SystemConfig:
 
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(self.to_dict(), indent=2, sort_keys=True)
+        return _json_dumps(self.to_dict())
 
     def to_yaml(self) -> str:
         """Convert to YAML string"""
-        return yaml.dump(self.to_dict(), default_flow_style=False, sort_keys=True)
+        return yaml.dump(
+            self.to_dict(), Dumper=_YamlDumper, default_flow_style=False, sort_keys=True
+        )
 
     @classmethod
     def from_dict(cls, data: Dict) -> "SystemConfig":
@@ -129,17 +289,19 @@ class SystemConfig:
             data['kernel_modules'] = [KernelModule.from_dict(m) for m in data['kernel_modules']]
         if 'components' in data:
             data['components'] = [SystemComponent.from_dict(c) for c in data['components']]
+        if 'custom_settings' in data:
+            data['custom_settings'] = copy.deepcopy(data['custom_settings'])
         return cls(**data)
 
     @classmethod
     def from_json(cls, json_str: str) -> "SystemConfig":
         """Create from JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_parse_json_cached(json_str))
 
     @classmethod
     def from_yaml(cls, yaml_str: str) -> "SystemConfig":
         """Create from YAML string"""
-        return cls.from_dict(yaml.safe_load(yaml_str))
+        return cls.from_dict(_parse_yaml_cached(yaml_str))
 
 
 class KernelModuleManager:
@@ -152,6 +314,12 @@ class KernelModuleManager:
     def __init__(self):
         """Initialize kernel module manager"""
         self.modules: Dict[str, KernelModule] = {}
+        # Dependency graph: module -> its dependencies, and the reverse
+        self._adj: Dict[str, List[str]] = {}
+        # (dicts used as ordered sets keep the resolution order stable)
+        self._rdeps: Dict[str, Dict[str, None]] = defaultdict(dict)
+        # Resolved selections, keyed by the requested names
+        self._selection_cache: Dict[FrozenSet[str], Tuple[str, ...]] = {}
 
     def register_module(self, module: KernelModule):
         """
@@ -160,7 +328,18 @@ class KernelModuleManager:
         Args:
             module: Kernel module to register
         """
+        previous = self._adj.get(module.name)
+        if previous is not None:
+            for dep in previous:
+                self._rdeps[dep].pop(module.name, None)
+
         self.modules[module.name] = module
+        # Sorted so resolution order does not depend on set iteration order
+        self._adj[module.name] = sorted(module.dependencies)
+        for dep in module.dependencies:
+            self._rdeps[dep][module.name] = None
+
+        self._selection_cache.clear()
 
     def get_module(self, name: str) -> Optional[KernelModule]:
         """Get module by name"""
@@ -174,37 +353,64 @@ class KernelModuleManager:
             module_names: List of module names to select
 
         Returns:
-            List of modules including dependencies
+            List of modules including dependencies, ordered so that every
+            module comes after its dependencies
 
         Raises:
             ValueError: If module conflicts or dependencies cannot be resolved
         """
-        selected = set()
-        to_process = set(module_names)
+        key = frozenset(module_names)
+        order = self._selection_cache.get(key)
+        if order is None:
+            order = self._resolve(key)
+            self._selection_cache[key] = order
 
-        while to_process:
-            name = to_process.pop()
+        return [self.modules[name] for name in order]
 
-            if name in selected:
-                continue
+    def _resolve(self, module_names: FrozenSet[str]) -> Tuple[str, ...]:
+        """
+        Resolve a selection into a dependency-ordered tuple of names.
 
-            module = self.modules.get(name)
-            if not module:
+        Collects the dependency closure breadth-first, checks conflicts once
+        over the whole closure, then orders it with Kahn's algorithm.
+        """
+        # Collect the closure in discovery order
+        reachable: Dict[str, None] = {}
+        queue = deque(sorted(module_names))
+        while queue:
+            name = queue.popleft()
+            if name in reachable:
+                continue
+            if name not in self.modules:
                 raise ValueError(f"Module not found: {name}")
+            reachable[name] = None
+            queue.extend(self._adj[name])
 
-            # Check conflicts
-            for conflict in module.conflicts:
-                if conflict in selected:
+        # Single conflicts pass over the closure
+        for name in reachable:
+            for conflict in self.modules[name].conflicts:
+                if conflict in reachable:
                     raise ValueError(f"Module conflict: {name} conflicts with {conflict}")
 
-            selected.add(name)
-
-            # Add dependencies
-            for dep in module.dependencies:
-                if dep not in selected:
-                    to_process.add(dep)
-
-        return [self.modules[name] for name in selected]
+        # Kahn's algorithm: dependencies before dependents
+        indegree = {name: len(set(self._adj[name])) for name in reachable}
+        ready = deque(name for name, count in indegree.items() if count == 0)
+        order: List[str] = []
+        while ready:
+            name = ready.popleft()
+            order.append(name)
+            for dependent in self._rdeps.get(name, ()):
+                if dependent in indegree:
+                    indegree[dependent] -= 1
+                    if indegree[dependent] == 0:
+                        ready.append(dependent)
+
+        # Dependency cycles cannot be ordered; keep them in discovery order
+        if len(order) < len(reachable):
+            placed = set(order)
+            order.extend(name for name in reachable if name not in placed)
+
+        return tuple(order)
 
     def get_required_modules(self) -> List[KernelModule]:
         """Get all required modules"""
@@ -237,6 +443,27 @@ class ComponentManager:
     def __init__(self):
         """Initialize component manager"""
         self.components: Dict[str, SystemComponent] = {}
+        # Reverse indexes: name -> components that depend on / conflict with it
+        self._reverse_deps: Dict[str, Set[str]] = defaultdict(set)
+        self._reverse_conflicts: Dict[str, Set[str]] = defaultdict(set)
+
+    def _index(self, component: SystemComponent):
+        """Record a component in the reverse indexes"""
+        for dep in component.dependencies:
+            self._reverse_deps[dep].add(component.name)
+        for conflict in component.conflicts:
+            self._reverse_conflicts[conflict].add(component.name)
+
+    def _unindex(self, component: SystemComponent):
+        """Drop a component from the reverse indexes"""
+        for index, targets in ((self._reverse_deps, component.dependencies),
+                               (self._reverse_conflicts, component.conflicts)):
+            for target in targets:
+                names = index.get(target)
+                if names is not None:
+                    names.discard(component.name)
+                    if not names:
+                        del index[target]
 
     def add_component(self, component: SystemComponent):
         """
@@ -248,14 +475,23 @@ class ComponentManager:
         Raises:
             ValueError: If component conflicts with existing components
         """
-        # Check conflicts
-        for existing in self.components.values():
-            if component.name in existing.conflicts:
-                raise ValueError(f"Component {component.name} conflicts with {existing.name}")
-            if existing.name in component.conflicts:
-                raise ValueError(f"Component {component.name} conflicts with {existing.name}")
+        # Check conflicts declared by existing components against this one;
+        # the index only holds names of components currently added
+        declared_by = self._reverse_conflicts.get(component.name)
+        if declared_by:
+            raise ValueError(f"Component {component.name} conflicts with {min(declared_by)}")
+
+        # Check conflicts declared by this component
+        if not component.conflicts.isdisjoint(self.components):
+            clash = min(component.conflicts.intersection(self.components))
+            raise ValueError(f"Component {component.name} conflicts with {clash}")
+
+        previous = self.components.get(component.name)
+        if previous is not None:
+            self._unindex(previous)
 
         self.components[component.name] = component
+        self._index(component)
 
     def remove_component(self, name: str) -> bool:
         """
@@ -274,11 +510,12 @@ class ComponentManager:
             return False
 
         # Check if other components depend on this one
-        for comp in self.components.values():
-            if name in comp.dependencies and comp.enabled:
+        for dependent in self._reverse_deps.get(name, ()):
+            comp = self.components.get(dependent)
+            if comp is not None and comp.enabled:
                 raise ValueError(f"Cannot remove {name}: {comp.name} depends on it")
 
-        del self.components[name]
+        self._unindex(self.components.pop(name))
         return True
 
     def enable_component(self, name: str):
@@ -296,7 +533,7 @@ class ComponentManager:
             raise ValueError(f"Component not found: {name}")
 
         # Check dependencies
-        for dep in component.dependencies:
+        for dep in sorted(component.dependencies):
             dep_comp = self.components.get(dep)
             if not dep_comp or not dep_comp.enabled:
                 raise ValueError(f"Dependency not satisfied: {dep}")
@@ -318,8 +555,9 @@ class ComponentManager:
             raise ValueError(f"Component not found: {name}")
 
         # Check if other enabled components depend on this one
-        for comp in self.components.values():
-            if comp.enabled and name in comp.dependencies:
+        for dependent in self._reverse_deps.get(name, ()):
+            comp = self.components.get(dependent)
+            if comp is not None and comp.enabled:
                 raise ValueError(f"Cannot disable {name}: {comp.name} depends on it")
 
         component.enabled = False
@@ -347,11 +585,12 @@ class ComponentManager:
                     if not dep_comp or not dep_comp.enabled:
                         return False
 
-            # Check no conflicts
-            enabled = self.get_enabled_components()
-            for i, comp1 in enumerate(enabled):
-                for comp2 in enabled[i+1:]:
-                    if comp1.name in comp2.conflicts or comp2.name in comp1.conflicts:
+            # Check no conflicts; checking each declared conflict also
+            # covers the reverse direction
+            for comp in self.get_enabled_components():
+                for conflict in comp.conflicts:
+                    other = self.components.get(conflict)
+                    if other is not None and other.enabled and other is not comp:
                         return False
 
             return True
@@ -379,6 +618,8 @@ class SystemConfigManager:
         )
         self.kernel_manager = KernelModuleManager()
         self.component_manager = ComponentManager()
+        # (path, content digest, mtime_ns, size) of the last file written
+        self._last_hash: Optional[Tuple[str, bytes, int, int]] = None
 
         # Load initial configuration
         if config:
@@ -391,6 +632,9 @@ class SystemConfigManager:
         """
         Save configuration to file.
 
+        The write is skipped when the same content was last written to
+        ``path`` and the file has not been touched since.
+
         Args:
             path: File path
             format: File format (yaml or json)
@@ -399,32 +643,45 @@ class SystemConfigManager:
         self.config.kernel_modules = list(self.kernel_manager.modules.values())
         self.config.components = list(self.component_manager.components.values())
 
-        if format == "yaml":
-            content = self.config.to_yaml()
-        elif format == "json":
-            content = self.config.to_json()
-        else:
+        encoder = _SERIALIZERS.get(format)
+        if encoder is None:
             raise ValueError(f"Unsupported format: {format}")
 
+        content = getattr(self.config, encoder)()
+        digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        key = str(path)
+
+        last = self._last_hash
+        if last is not None and last[0] == key and last[1] == digest:
+            try:
+                stat = path.stat()
+            except OSError:
+                stat = None
+            if stat is not None and (stat.st_mtime_ns, stat.st_size) == last[2:]:
+                return
+
         path.write_text(content)
+        stat = path.stat()
+        self._last_hash = (key, digest, stat.st_mtime_ns, stat.st_size)
 
     def load_config(self, path: Path, format: str = "yaml"):
         """
         Load configuration from file.
 
+        Parsed files are kept in memory, keyed on their stat signature,
+        so reloading an unchanged file skips the read and the parse.
+
         Args:
             path: File path
             format: File format (yaml or json)
         """
-        content = path.read_text()
-
-        if format == "yaml":
-            self.config = SystemConfig.from_yaml(content)
-        elif format == "json":
-            self.config = SystemConfig.from_json(content)
-        else:
+        if format not in _FILE_LOADERS:
             raise ValueError(f"Unsupported format: {format}")
 
+        stat = path.stat()
+        data = _load_file_cached(str(path), format, stat.st_mtime_ns, stat.st_size)
+        self.config = SystemConfig.from_dict(data)
+
         # Reload managers
         self.kernel_manager = KernelModuleManager()
         self.component_manager = ComponentManager()
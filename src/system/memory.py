@@ -7,8 +7,12 @@ Requirements:
 - 1.2: Memory usage constraint - RAM consumption under 128MB during normal operation
 """
 
+import heapq
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
@@ -23,7 +27,53 @@ class MemoryUnit(Enum):
     GB = 1024 * 1024 * 1024
 
 
-@dataclass
+# "Key:   <number> kB" lines of /proc/meminfo
+_MEMINFO_RE = re.compile(rb'^([A-Za-z0-9()_]+):\s+(\d+)', re.MULTILINE)
+
+# The only /proc/<pid>/status fields get_process_memory() uses
+_STATUS_RE = re.compile(rb'^(Name|VmRSS|VmSize|RssFile):[ \t]*([^\n]*)', re.MULTILINE)
+_STATUS_FIELD_COUNT = 4
+
+# /proc/meminfo and /proc/<pid>/status both fit comfortably in one read
+_PROC_READ_SIZE = 8192
+
+
+# Memory state does not swing much between polls this close together
+_SUGGEST_CACHE_TTL = 0.5
+_STATUS_CACHE_TTL = 0.5
+# Coalesces the back-to-back meminfo reads within one status/limit call chain
+_MEMINFO_CACHE_TTL = 0.1
+
+# Below this many pids a thread pool costs more than it saves
+_PARALLEL_MIN_PIDS = 64
+_PROC_SCAN_WORKERS = 16
+
+
+def _read_proc(path, buf: bytearray) -> memoryview:
+    """
+    Read a small /proc file into a caller-owned buffer.
+
+    The returned view aliases ``buf`` and is only valid until the next
+    read into the same buffer.
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        n = os.readv(fd, [buf])
+    finally:
+        os.close(fd)
+    return memoryview(buf)[:n]
+
+
+# Reciprocal of MemoryUnit.MB; a power of two, so multiplying is exact
+_INV_MB: float = 1.0 / (1 << 20)
+
+
+def _to_mb(value: int) -> float:
+    """Convert bytes to MB"""
+    return value * _INV_MB
+
+
+@dataclass(slots=True, frozen=True)
 class MemoryUsage:
     """Memory usage information"""
     total: int  # Total memory in bytes
@@ -37,7 +87,7 @@ class MemoryUsage:
 
     def to_mb(self, value: int) -> float:
         """Convert bytes to MB"""
-        return value / MemoryUnit.MB.value
+        return _to_mb(value)
 
     def get_usage_percentage(self) -> float:
         """Get memory usage percentage"""
@@ -48,15 +98,15 @@ class MemoryUsage:
     def to_dict(self) -> Dict:
         """Convert to dictionary with MB values"""
         return {
-            'total_mb': self.to_mb(self.total),
-            'used_mb': self.to_mb(self.used),
-            'free_mb': self.to_mb(self.free),
-            'available_mb': self.to_mb(self.available),
+            'total_mb': _to_mb(self.total),
+            'used_mb': _to_mb(self.used),
+            'free_mb': _to_mb(self.free),
+            'available_mb': _to_mb(self.available),
             'usage_percentage': self.get_usage_percentage()
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProcessMemory:
     """Process memory information"""
     pid: int
@@ -67,15 +117,15 @@ class ProcessMemory:
 
     def to_mb(self, value: int) -> float:
         """Convert bytes to MB"""
-        return value / MemoryUnit.MB.value
+        return _to_mb(value)
 
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
         return {
             'pid': self.pid,
             'name': self.name,
-            'rss_mb': self.to_mb(self.rss),
-            'vms_mb': self.to_mb(self.vms)
+            'rss_mb': _to_mb(self.rss),
+            'vms_mb': _to_mb(self.vms)
         }
 
 
@@ -90,6 +140,20 @@ class MemoryMonitor:
         """Initialize memory monitor"""
         self.proc_path = Path("/proc")
         self.memory_limit_mb = 128  # Requirement: 1.2
+        # Per-thread read buffers; pid sweeps read status files concurrently
+        self._local = threading.local()
+        self._meminfo_cache: Optional[Tuple[float, MemoryUsage]] = None
+
+    def invalidate(self):
+        """Drop the cached system memory snapshot"""
+        self._meminfo_cache = None
+
+    def _proc_buffer(self) -> bytearray:
+        """Get this thread's reusable /proc read buffer"""
+        buf = getattr(self._local, 'buf', None)
+        if buf is None:
+            buf = self._local.buf = bytearray(_PROC_READ_SIZE)
+        return buf
 
     def get_system_memory(self) -> MemoryUsage:
         """
@@ -97,9 +161,23 @@ class MemoryMonitor:
 
         Requirement: 1.2 - Monitor RAM consumption
 
+        Snapshots are reused for a short TTL so that callers reading
+        memory several times in a row parse /proc/meminfo once.
+
         Returns:
             Memory usage information
         """
+        now = time.monotonic()
+        cached = self._meminfo_cache
+        if cached is not None and now - cached[0] < _MEMINFO_CACHE_TTL:
+            return cached[1]
+
+        usage = self._read_system_memory()
+        self._meminfo_cache = (now, usage)
+        return usage
+
+    def _read_system_memory(self) -> MemoryUsage:
+        """Parse /proc/meminfo into a MemoryUsage"""
         meminfo_path = self.proc_path / "meminfo"
 
         if not meminfo_path.exists():
@@ -112,16 +190,13 @@ class MemoryMonitor:
             )
 
         try:
-            meminfo = meminfo_path.read_text()
-            values = {}
-
-            for line in meminfo.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    # Extract numeric value (remove 'kB' suffix)
-                    match = re.search(r'(\d+)', value)
-                    if match:
-                        values[key.strip()] = int(match.group(1)) * 1024  # Convert to bytes
+            # Values are in kB; convert to bytes
+            values = {
+                m.group(1).decode(): int(m.group(2)) * 1024
+                for m in _MEMINFO_RE.finditer(
+                    _read_proc(meminfo_path, self._proc_buffer())
+                )
+            }
 
             total = values.get('MemTotal', 0)
             free = values.get('MemFree', 0)
@@ -160,21 +235,20 @@ class MemoryMonitor:
             return None
 
         try:
-            status = status_path.read_text()
             values = {}
-
-            for line in status.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    match = re.search(r'(\d+)', value)
-                    if match:
-                        values[key.strip()] = int(match.group(1)) * 1024  # Convert to bytes
-
-            # Get process name
             name = "unknown"
-            for line in status.split('\n'):
-                if line.startswith('Name:'):
-                    name = line.split(':', 1)[1].strip()
+            remaining = _STATUS_FIELD_COUNT
+            data = _read_proc(status_path, self._proc_buffer())
+
+            # Single scan that stops once every wanted field has been seen
+            for m in _STATUS_RE.finditer(data):
+                key, value = m.group(1, 2)
+                if key == b'Name':
+                    name = value.strip().decode(errors='replace')
+                else:
+                    values[key.decode()] = int(value.split()[0]) * 1024  # Convert to bytes
+                remaining -= 1
+                if not remaining:
                     break
 
             return ProcessMemory(
@@ -197,7 +271,7 @@ class MemoryMonitor:
             Tuple of (within_limit, current_usage_mb)
         """
         usage = self.get_system_memory()
-        used_mb = usage.to_mb(usage.used)
+        used_mb = _to_mb(usage.used)
         within_limit = used_mb < self.memory_limit_mb
 
         return (within_limit, used_mb)
@@ -212,22 +286,30 @@ class MemoryMonitor:
         Returns:
             List of process memory information
         """
-        processes = []
+        pids = []
 
         try:
-            for pid_dir in self.proc_path.iterdir():
-                if pid_dir.is_dir() and pid_dir.name.isdigit():
-                    pid = int(pid_dir.name)
-                    proc_mem = self.get_process_memory(pid)
-                    if proc_mem:
-                        processes.append(proc_mem)
+            # Digit-named /proc entries are always pid directories, so the
+            # DirEntry name alone is enough (no per-entry stat)
+            with os.scandir(self.proc_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.isdigit():
+                        pids.append(int(name))
         except Exception:
             pass
 
-        # Sort by RSS (actual RAM usage)
-        processes.sort(key=lambda p: p.rss, reverse=True)
+        # Status reads release the GIL, so large sweeps overlap them
+        if len(pids) >= _PARALLEL_MIN_PIDS:
+            with ThreadPoolExecutor(max_workers=_PROC_SCAN_WORKERS) as executor:
+                results = list(executor.map(self.get_process_memory, pids))
+        else:
+            results = [self.get_process_memory(pid) for pid in pids]
+
+        processes = [p for p in results if p is not None]
 
-        return processes[:limit]
+        # Top entries by RSS (actual RAM usage) without sorting everything
+        return heapq.nlargest(limit, processes, key=lambda p: p.rss)
 
 
 class MemoryOptimizer:
@@ -246,17 +328,37 @@ class MemoryOptimizer:
         """
         self.monitor = monitor or MemoryMonitor()
         self.optimizations_applied = []
+        self._suggest_cache: Optional[List[str]] = None
+        self._suggest_ts = 0.0
+
+    def invalidate(self):
+        """Drop cached suggestions"""
+        self._suggest_cache = None
 
     def suggest_optimizations(self) -> List[str]:
         """
         Suggest memory optimizations.
 
+        Results are reused for a short TTL, since computing them walks
+        every pid in /proc.
+
         Returns:
             List of optimization suggestions
         """
+        now = time.monotonic()
+        if self._suggest_cache is not None and now - self._suggest_ts < _SUGGEST_CACHE_TTL:
+            return list(self._suggest_cache)
+
+        suggestions = self._compute_suggestions()
+        self._suggest_cache = suggestions
+        self._suggest_ts = now
+        return list(suggestions)
+
+    def _compute_suggestions(self) -> List[str]:
+        """Build optimization suggestions from current memory state"""
         suggestions = []
         usage = self.monitor.get_system_memory()
-        used_mb = usage.to_mb(usage.used)
+        used_mb = _to_mb(usage.used)
 
         if used_mb > 100:
             suggestions.append("Consider reducing number of running services")
@@ -267,7 +369,7 @@ class MemoryOptimizer:
 
         # Check top processes
         top_procs = self.monitor.get_top_memory_processes(5)
-        if top_procs and top_procs[0].to_mb(top_procs[0].rss) > 50:
+        if top_procs and _to_mb(top_procs[0].rss) > 50:
             suggestions.append(f"Process '{top_procs[0].name}' using high memory")
 
         return suggestions
@@ -285,6 +387,7 @@ class MemoryOptimizer:
         # In a real implementation, this would apply actual optimizations
         # For now, just track what optimizations are requested
         self.optimizations_applied.append(optimization)
+        self.invalidate()
         return True
 
     def clear_page_cache(self) -> bool:
@@ -297,6 +400,8 @@ class MemoryOptimizer:
         # In real implementation:
         # echo 1 > /proc/sys/vm/drop_caches
         # For testing, just simulate
+        self.invalidate()
+        self.monitor.invalidate()
         return True
 
     def get_optimization_status(self) -> Dict:
@@ -370,7 +475,7 @@ class ResourceLimiter:
         if limit_mb is None:
             return False
 
-        actual_mb = process.to_mb(process.rss)
+        actual_mb = _to_mb(process.rss)
         return actual_mb > limit_mb
 
     def enforce_limits(self, monitor: MemoryMonitor) -> List[str]:
@@ -383,14 +488,18 @@ class ResourceLimiter:
         Returns:
             List of actions taken
         """
-        actions = []
-        top_procs = monitor.get_top_memory_processes(50)
+        # Flat name -> limit map, built once per call rather than per process
+        limits = {name: limit['memory_mb'] for name, limit in self.limits.items()
+                  if 'memory_mb' in limit}
+        if not limits:
+            return []
 
-        for proc in top_procs:
-            if self.check_limit_exceeded(proc):
-                actions.append(f"Process {proc.name} (PID {proc.pid}) exceeds limit")
-
-        return actions
+        inf = float('inf')
+        return [
+            f"Process {proc.name} (PID {proc.pid}) exceeds limit"
+            for proc in monitor.get_top_memory_processes(50)
+            if proc.rss * _INV_MB > limits.get(proc.name, inf)
+        ]
 
 
 class MemoryManager:
@@ -405,14 +514,38 @@ class MemoryManager:
         self.monitor = MemoryMonitor()
         self.optimizer = MemoryOptimizer(self.monitor)
         self.limiter = ResourceLimiter()
+        self._status_cache: Optional[Dict] = None
+        self._status_ts = 0.0
 
     def get_status(self) -> Dict:
         """
         Get comprehensive memory status.
 
+        Results are reused for a short TTL (see MemoryOptimizer), or
+        until monitor.memory_limit_mb changes.
+
         Returns:
             Dictionary with memory status information
         """
+        now = time.monotonic()
+        cached = self._status_cache
+        if (
+            cached is None
+            or now - self._status_ts >= _STATUS_CACHE_TTL
+            or cached['limit_mb'] != self.monitor.memory_limit_mb
+        ):
+            cached = self._status_cache = self._compute_status()
+            self._status_ts = now
+
+        # Fresh nested containers so callers cannot alter the cached status
+        return {
+            **cached,
+            'system_memory': dict(cached['system_memory']),
+            'top_processes': [dict(p) for p in cached['top_processes']],
+        }
+
+    def _compute_status(self) -> Dict:
+        """Collect memory status from the monitor"""
         usage = self.monitor.get_system_memory()
         within_limit, used_mb = self.monitor.check_memory_limit()
 
@@ -456,4 +589,5 @@ class MemoryManager:
             if self.optimizer.apply_optimization(suggestion):
                 actions.append(f"Applied: {suggestion}")
 
+        self._status_cache = None
         return actions
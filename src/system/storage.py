@@ -7,9 +7,13 @@ Requirements:
 - 1.5: Storage optimization - Minimum storage requirement 512MB
 """
 
+import heapq
 import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -22,6 +26,17 @@ class StorageUnit(Enum):
     GB = 1024 * 1024 * 1024
 
 
+# Plain-int copies of StorageUnit.MB/GB; both are powers of two, so
+# multiplying by the reciprocals is exact
+_BYTES_PER_MB = 1048576
+_BYTES_PER_GB = 1073741824
+_INV_MB = 1.0 / _BYTES_PER_MB
+_INV_GB = 1.0 / _BYTES_PER_GB
+
+# Directory walks block in readdir/stat with the GIL released
+_DIR_SCAN_WORKERS = 8
+
+
 class ImageType(Enum):
     """Image types and their size limits"""
     MINIMAL = ("minimal", 5)      # 5MB
@@ -33,7 +48,41 @@ class ImageType(Enum):
         self.size_limit_mb = size_limit_mb
 
 
-@dataclass
+def _scandir_walk(path) -> Iterator[Tuple[os.DirEntry, bool]]:
+    """
+    Walk a directory tree, yielding (entry, is_dir) for every entry below it.
+
+    Uses an explicit stack of os.scandir() calls so file types come from
+    the directory listing instead of a stat per entry. Symlinks are not
+    followed, and unreadable directories are skipped.
+    """
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        stack.append(entry.path)
+                    yield entry, is_dir
+        except OSError:
+            continue
+
+
+def _file_size(entry: os.DirEntry) -> Optional[int]:
+    """Size of a regular file entry, or None for anything else"""
+    try:
+        if entry.is_file(follow_symlinks=False):
+            return entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        pass
+    return None
+
+
+@dataclass(slots=True)
 class StorageUsage:
     """Storage usage information"""
     total: int          # Total storage in bytes
@@ -44,11 +93,11 @@ class StorageUsage:
 
     def to_mb(self, value: int) -> float:
         """Convert bytes to MB"""
-        return value / StorageUnit.MB.value
+        return value * _INV_MB
 
     def to_gb(self, value: int) -> float:
         """Convert bytes to GB"""
-        return value / StorageUnit.GB.value
+        return value * _INV_GB
 
     def get_usage_percentage(self) -> float:
         """Get storage usage percentage"""
@@ -68,7 +117,7 @@ class StorageUsage:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectorySize:
     """Directory size information"""
     path: str
@@ -78,7 +127,7 @@ class DirectorySize:
 
     def to_mb(self) -> float:
         """Get size in MB"""
-        return self.size / StorageUnit.MB.value
+        return self.size * _INV_MB
 
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
@@ -101,6 +150,19 @@ class StorageMonitor:
         """Initialize storage monitor"""
         self.minimum_storage_mb = 512  # Requirement: 1.5
         self.recommended_storage_mb = 2048  # 2GB
+        # statvfs results per mount path as (expiry, usage); failed
+        # lookups are kept longer since a missing mount rarely appears
+        self._cache: Dict[str, Tuple[float, StorageUsage]] = {}
+        self._ttl = 1.0
+        self._negative_ttl = 5.0
+
+    def refresh(self):
+        """Drop cached storage usage so the next call re-reads it"""
+        self._cache.clear()
+
+    def invalidate(self, path: str):
+        """Drop cached storage usage for one mount point (e.g. after mount/umount)"""
+        self._cache.pop(path, None)
 
     def get_storage_usage(self, path: str = "/") -> StorageUsage:
         """
@@ -108,19 +170,43 @@ class StorageMonitor:
 
         Requirement: 1.5 - Monitor storage usage
 
+        Results are cached per path for a short TTL, and failures for a
+        longer one; call invalidate(path) or refresh() to force a new read.
+
         Args:
             path: Mount point path
 
         Returns:
             Storage usage information
         """
-        try:
-            stat = os.statvfs(path)
+        now = time.monotonic()
+        cached = self._cache.get(path)
+        if cached is not None and now < cached[0]:
+            return cached[1]
 
-            # Calculate sizes
-            total = stat.f_blocks * stat.f_frsize
-            free = stat.f_bfree * stat.f_frsize
-            available = stat.f_bavail * stat.f_frsize
+        usage = self._read_storage_usage(path)
+        if usage is None:
+            usage = StorageUsage(total=0, used=0, free=0, available=0, mount_point=path)
+            self._cache[path] = (now + self._negative_ttl, usage)
+        else:
+            self._cache[path] = (now + self._ttl, usage)
+        return usage
+
+    def _read_storage_usage(self, path: str) -> Optional[StorageUsage]:
+        """Query the filesystem for storage usage of a mount point, or None on failure"""
+        try:
+            if hasattr(os, 'statvfs'):
+                # statvfs distinguishes free blocks from those available
+                # to unprivileged users (shutil.disk_usage only reports
+                # the latter)
+                stat = os.statvfs(path)
+                frsize = stat.f_frsize
+                total = stat.f_blocks * frsize
+                free = stat.f_bfree * frsize
+                available = stat.f_bavail * frsize
+            else:
+                total, _, available = shutil.disk_usage(path)
+                free = available
             used = total - free
 
             return StorageUsage(
@@ -131,13 +217,7 @@ class StorageMonitor:
                 mount_point=path
             )
         except Exception:
-            return StorageUsage(
-                total=0,
-                used=0,
-                free=0,
-                available=0,
-                mount_point=path
-            )
+            return None
 
     def check_minimum_storage(self, path: str = "/") -> Tuple[bool, float]:
         """
@@ -157,7 +237,7 @@ class StorageMonitor:
 
         return (meets_requirement, available_mb)
 
-    def get_directory_size(self, path: Path) -> DirectorySize:
+    def get_directory_size(self, path: Union[str, Path]) -> DirectorySize:
         """
         Get size of a directory.
 
@@ -167,25 +247,22 @@ class StorageMonitor:
         Returns:
             Directory size information
         """
-        if not path.exists() or not path.is_dir():
-            return DirectorySize(path=str(path), size=0)
-
+        # A missing path or non-directory simply yields no entries
         total_size = 0
         file_count = 0
         dir_count = 0
 
-        try:
-            for item in path.rglob('*'):
-                if item.is_file():
-                    total_size += item.stat().st_size
-                    file_count += 1
-                elif item.is_dir():
-                    dir_count += 1
-        except Exception:
-            pass
+        for entry, is_dir in _scandir_walk(path):
+            if is_dir:
+                dir_count += 1
+                continue
+            size = _file_size(entry)
+            if size is not None:
+                total_size += size
+                file_count += 1
 
         return DirectorySize(
-            path=str(path),
+            path=os.fspath(path),
             size=total_size,
             file_count=file_count,
             dir_count=dir_count
@@ -202,23 +279,26 @@ class StorageMonitor:
         Returns:
             List of directory sizes
         """
-        if not root.exists() or not root.is_dir():
-            return []
-
-        directories = []
+        children = []
 
         try:
-            for item in root.iterdir():
-                if item.is_dir():
-                    dir_size = self.get_directory_size(item)
-                    directories.append(dir_size)
-        except Exception:
-            pass
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        children.append(entry.path)
+        except OSError:
+            return []
 
-        # Sort by size
-        directories.sort(key=lambda d: d.size, reverse=True)
+        # Each subtree is walked independently, so overlap their I/O
+        if len(children) > 1:
+            workers = min(_DIR_SCAN_WORKERS, len(children))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                directories = list(executor.map(self.get_directory_size, children))
+        else:
+            directories = [self.get_directory_size(child) for child in children]
 
-        return directories[:limit]
+        # Top entries by size without sorting everything
+        return heapq.nlargest(limit, directories, key=lambda d: d.size)
 
 
 class ImageSizeVerifier:
@@ -239,18 +319,16 @@ class ImageSizeVerifier:
         Returns:
             Tuple of (meets_requirement, actual_size_mb)
         """
-        if not image_path.exists():
-            return (False, 0.0)
-
+        # A single stat; a missing image surfaces as FileNotFoundError
         try:
             size_bytes = image_path.stat().st_size
-            size_mb = size_bytes / StorageUnit.MB.value
+        except OSError:
+            return (False, 0.0)
 
-            meets_requirement = size_mb <= image_type.size_limit_mb
+        size_mb = size_bytes * _INV_MB
+        meets_requirement = size_mb <= image_type.size_limit_mb
 
-            return (meets_requirement, size_mb)
-        except Exception:
-            return (False, 0.0)
+        return (meets_requirement, size_mb)
 
     def verify_all_image_types(self, base_path: Path) -> Dict[str, Tuple[bool, float]]:
         """
@@ -264,6 +342,8 @@ class ImageSizeVerifier:
         """
         results = {}
 
+        # Sequential on purpose: three stats finish well before a thread
+        # pool could start
         for image_type in ImageType:
             image_path = base_path / f"{image_type.image_name}.img"
             meets_req, size_mb = self.verify_image_size(image_path, image_type)
@@ -289,44 +369,45 @@ class StorageOptimizer:
         self.monitor = monitor or StorageMonitor()
         self.optimizations_applied = []
 
-    def find_large_files(self, root: Path, min_size_mb: float = 10) -> List[Tuple[Path, float]]:
+    def find_large_files(self, root: Path, min_size_mb: float = 10,
+                         limit: Optional[int] = None) -> List[Tuple[Path, float]]:
         """
         Find large files that could be candidates for removal.
 
         Args:
             root: Root directory to search
             min_size_mb: Minimum file size in MB
+            limit: Maximum number of files to return (largest first)
 
         Returns:
             List of (file_path, size_mb) tuples
         """
-        if not root.exists() or not root.is_dir():
-            return []
-
         large_files = []
-        min_size_bytes = int(min_size_mb * StorageUnit.MB.value)
-
-        try:
-            for item in root.rglob('*'):
-                if item.is_file():
-                    size = item.stat().st_size
-                    if size >= min_size_bytes:
-                        size_mb = size / StorageUnit.MB.value
-                        large_files.append((item, size_mb))
-        except Exception:
-            pass
-
-        # Sort by size
-        large_files.sort(key=lambda x: x[1], reverse=True)
+        min_size_bytes = int(min_size_mb * _BYTES_PER_MB)
+
+        for entry, is_dir in _scandir_walk(root):
+            if is_dir:
+                continue
+            size = _file_size(entry)
+            if size is not None and size >= min_size_bytes:
+                large_files.append((size, entry.path))
+
+        # Largest first; only the top entries are ordered when limited
+        if limit is not None:
+            largest = heapq.nlargest(limit, large_files)
+        else:
+            largest = sorted(large_files, reverse=True)
 
-        return large_files
+        return [(Path(path), size * _INV_MB) for size, path in largest]
 
-    def suggest_optimizations(self, root: Path = Path("/")) -> List[str]:
+    def suggest_optimizations(self, root: Path = Path("/"),
+                              analysis: Optional[Dict] = None) -> List[str]:
         """
         Suggest storage optimizations.
 
         Args:
             root: Root path to analyze
+            analysis: Result of analyze(root), if the caller already has one
 
         Returns:
             List of optimization suggestions
@@ -338,19 +419,88 @@ class StorageOptimizer:
         if not meets_min:
             suggestions.append(f"Available storage ({available_mb:.1f}MB) is below minimum (512MB)")
 
+        # One walk feeds both the large-file and largest-directory checks
+        if analysis is None:
+            analysis = self.analyze(root)
+
         # Check for large files
-        large_files = self.find_large_files(root, min_size_mb=50)
-        if large_files:
-            total_large_mb = sum(size for _, size in large_files)
-            suggestions.append(f"Found {len(large_files)} files >50MB (total: {total_large_mb:.1f}MB)")
+        large_count = analysis['large_file_count']
+        if large_count:
+            total_large_mb = analysis['large_file_mb']
+            suggestions.append(f"Found {large_count} files >50MB (total: {total_large_mb:.1f}MB)")
 
         # Check largest directories
-        largest_dirs = self.monitor.get_largest_directories(root, limit=5)
-        if largest_dirs and largest_dirs[0].to_mb() > 100:
-            suggestions.append(f"Largest directory: {largest_dirs[0].path} ({largest_dirs[0].to_mb():.1f}MB)")
+        dir_sizes = analysis['directories']
+        if dir_sizes:
+            largest = max(dir_sizes, key=lambda d: d.size)
+            if largest.to_mb() > 100:
+                suggestions.append(f"Largest directory: {largest.path} ({largest.to_mb():.1f}MB)")
 
         return suggestions
 
+    def analyze(self, root: Path, min_size_mb: float = 50) -> Dict:
+        """
+        Walk a tree once and summarize it for reporting.
+
+        Args:
+            root: Root directory to analyze
+            min_size_mb: Minimum size in MB for a file to count as large
+
+        Returns:
+            Dictionary with the sizes of root's immediate subdirectories
+            ('directories') and the number and total MB of files of at
+            least min_size_mb ('large_file_count', 'large_file_mb')
+        """
+        dir_sizes = []
+        large_count = large_bytes = 0
+        min_size_bytes = int(min_size_mb * _BYTES_PER_MB)
+
+        try:
+            with os.scandir(root) as it:
+                children = list(it)
+        except OSError:
+            children = []
+
+        for child in children:
+            try:
+                is_dir = child.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+
+            if not is_dir:
+                size = _file_size(child)
+                if size is not None and size >= min_size_bytes:
+                    large_count += 1
+                    large_bytes += size
+                continue
+
+            total_size = file_count = dir_count = 0
+            for entry, entry_is_dir in _scandir_walk(child.path):
+                if entry_is_dir:
+                    dir_count += 1
+                    continue
+                size = _file_size(entry)
+                if size is None:
+                    continue
+                total_size += size
+                file_count += 1
+                if size >= min_size_bytes:
+                    large_count += 1
+                    large_bytes += size
+
+            dir_sizes.append(DirectorySize(
+                path=child.path,
+                size=total_size,
+                file_count=file_count,
+                dir_count=dir_count
+            ))
+
+        return {
+            'directories': dir_sizes,
+            'large_file_count': large_count,
+            'large_file_mb': large_bytes * _INV_MB,
+        }
+
     def apply_optimization(self, optimization: str) -> bool:
         """
         Apply a storage optimization.
@@ -374,17 +524,15 @@ class StorageOptimizer:
         Returns:
             Number of bytes freed
         """
-        if not temp_dir.exists():
-            return 0
-
         freed = 0
         try:
-            for item in temp_dir.iterdir():
-                if item.is_file():
-                    size = item.stat().st_size
-                    # In real implementation: item.unlink()
-                    freed += size
-        except Exception:
+            with os.scandir(temp_dir) as it:
+                for entry in it:
+                    size = _file_size(entry)
+                    if size is not None:
+                        # In real implementation: os.unlink(entry.path)
+                        freed += size
+        except OSError:
             pass
 
         return freed
@@ -494,8 +642,11 @@ class StorageManager:
             Dictionary with optimization information
         """
         usage = self.monitor.get_storage_usage(str(root))
-        largest_dirs = self.monitor.get_largest_directories(root, limit=10)
-        suggestions = self.optimizer.suggest_optimizations(root)
+
+        # A single walk serves both the directory ranking and suggestions
+        analysis = self.optimizer.analyze(root)
+        largest_dirs = heapq.nlargest(10, analysis['directories'], key=lambda d: d.size)
+        suggestions = self.optimizer.suggest_optimizations(root, analysis=analysis)
 
         return {
             'storage_usage': usage.to_dict(),
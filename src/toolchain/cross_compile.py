@@ -4,10 +4,12 @@ Cross-compilation environment for Kimigayo OS
 Supports x86_64 and ARM64 targets with musl libc integration.
 """
 
+import hashlib
 import os
 import subprocess
 from pathlib import Path
-from typing import Optional, Dict, List
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -25,6 +27,20 @@ class LibcType(Enum):
     GLIBC = "glibc"
 
 
+# Default toolchain prefix per target architecture, by libc
+_MUSL_PREFIX_MAP = {
+    Architecture.X86_64: "x86_64-linux-musl",
+    Architecture.ARM64: "aarch64-linux-musl",
+    Architecture.AARCH64: "aarch64-linux-musl",
+}
+
+_GLIBC_PREFIX_MAP = {
+    Architecture.X86_64: "x86_64-linux-gnu",
+    Architecture.ARM64: "aarch64-linux-gnu",
+    Architecture.AARCH64: "aarch64-linux-gnu",
+}
+
+
 @dataclass
 class ToolchainConfig:
     """Toolchain configuration for cross-compilation"""
@@ -40,19 +56,7 @@ class ToolchainConfig:
 
     def _get_default_prefix(self) -> str:
         """Get default toolchain prefix based on architecture and libc"""
-        arch_map = {
-            Architecture.X86_64: "x86_64-linux-musl",
-            Architecture.ARM64: "aarch64-linux-musl",
-            Architecture.AARCH64: "aarch64-linux-musl",
-        }
-
-        if self.libc == LibcType.GLIBC:
-            arch_map = {
-                Architecture.X86_64: "x86_64-linux-gnu",
-                Architecture.ARM64: "aarch64-linux-gnu",
-                Architecture.AARCH64: "aarch64-linux-gnu",
-            }
-
+        arch_map = _GLIBC_PREFIX_MAP if self.libc == LibcType.GLIBC else _MUSL_PREFIX_MAP
         return arch_map.get(self.architecture, "")
 
 
@@ -66,6 +70,10 @@ class CrossCompileConfig:
     ldflags: List[str] = field(default_factory=list)
     enable_static: bool = True
     enable_shared: bool = False
+    # (inputs, merged environment) from the last get_environment() call
+    _env_cache: Optional[Tuple[Tuple, Mapping[str, str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if self.toolchain is None:
@@ -93,19 +101,39 @@ class CrossCompileConfig:
             "-Wl,-z,noexecstack",
         ]
 
-        for flag in security_cflags:
-            if flag not in self.cflags:
-                self.cflags.append(flag)
-
-        for flag in security_ldflags:
-            if flag not in self.ldflags:
-                self.ldflags.append(flag)
-
-    def get_environment(self) -> Dict[str, str]:
-        """Get environment variables for cross-compilation"""
-        env = os.environ.copy()
+        # Append missing flags in order; sets keep this O(n + m)
+        for flags, defaults in ((self.cflags, security_cflags),
+                                (self.ldflags, security_ldflags)):
+            existing = set(flags)
+            for flag in defaults:
+                if flag not in existing:
+                    flags.append(flag)
+                    existing.add(flag)
+
+    def get_environment(self) -> Mapping[str, str]:
+        """
+        Get environment variables for cross-compilation.
+
+        The merged environment is built once and reused until the toolchain,
+        flags or target change, so os.environ is read at that point. The
+        result is a read-only view.
+        """
+        toolchain = self.toolchain
+        key = (toolchain.toolchain_prefix, toolchain.sysroot, self.target_arch,
+               tuple(self.cflags), tuple(self.ldflags))
+        cached = self._env_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        env = MappingProxyType({**os.environ, **self.get_environment_overrides()})
+        self._env_cache = (key, env)
+        return env
 
-        prefix = self.toolchain.toolchain_prefix
+    def get_environment_overrides(self) -> Dict[str, str]:
+        """Get only the variables cross-compilation sets on top of os.environ"""
+        env = {}
+        toolchain = self.toolchain
+        prefix = toolchain.toolchain_prefix
 
         # Set cross-compilation tools
         env["CC"] = f"{prefix}-gcc"
@@ -130,8 +158,8 @@ class CrossCompileConfig:
             env["CROSS_COMPILE"] = "x86_64-linux-musl-"
 
         # Set sysroot if available
-        if self.toolchain.sysroot:
-            env["SYSROOT"] = str(self.toolchain.sysroot)
+        if toolchain.sysroot:
+            env["SYSROOT"] = str(toolchain.sysroot)
 
         return env
 
@@ -143,28 +171,46 @@ class CrossCompiler:
         self.config = config
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-
-    def verify_toolchain(self) -> bool:
-        """Verify that the cross-compilation toolchain is available"""
-        env = self.config.get_environment()
-        cc = env.get("CC", "gcc")
+        # Successful `cc <option>` runs per (compiler, option): (0, first
+        # line of stdout). Failures are not cached so they can be retried.
+        self._probe_cache: Dict[Tuple[str, str], Tuple[int, str]] = {}
+        # Successfully compiled (source digest, cc, flags) combinations
+        self._compile_cache: Set[Tuple] = set()
+
+    def _probe_cc(self, cc: str, option: str) -> Optional[Tuple[int, str]]:
+        """Run `cc <option>`, remembering the outcome once it succeeds"""
+        key = (cc, option)
+        cached = self._probe_cache.get(key)
+        if cached is not None:
+            return cached
 
         try:
-            # Try to run the compiler with --version
             result = subprocess.run(
-                [cc, "--version"],
+                [cc, option],
                 capture_output=True,
                 text=True,
                 timeout=10
             )
-            return result.returncode == 0
+            outcome = (result.returncode, result.stdout.split('\n')[0])
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+            return None
+
+        # A missing toolchain may be installed later; only keep successes
+        if outcome[0] == 0:
+            self._probe_cache[key] = outcome
+        return outcome
+
+    def verify_toolchain(self) -> bool:
+        """Verify that the cross-compilation toolchain is available"""
+        cc = self.config.get_environment_overrides()["CC"]
+
+        # Try to run the compiler with --version
+        outcome = self._probe_cc(cc, "--version")
+        return outcome is not None and outcome[0] == 0
 
     def get_toolchain_info(self) -> Dict[str, str]:
         """Get information about the toolchain"""
-        env = self.config.get_environment()
-        cc = env.get("CC", "gcc")
+        cc = self.config.get_environment_overrides()["CC"]
 
         info = {
             "compiler": cc,
@@ -172,33 +218,45 @@ class CrossCompiler:
             "libc": self.config.toolchain.libc.value,
         }
 
-        try:
-            result = subprocess.run(
-                [cc, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                info["version"] = result.stdout.split('\n')[0]
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        outcome = self._probe_cc(cc, "--version")
+        if outcome is None:
             info["version"] = "unknown"
+        elif outcome[0] == 0:
+            info["version"] = outcome[1]
 
         return info
 
     def compile_test_program(self, source_code: str) -> bool:
-        """Compile a test program to verify toolchain"""
-        test_file = self.output_dir / "test.c"
-        output_file = self.output_dir / "test"
-
-        # Write test source
-        test_file.write_text(source_code)
+        """
+        Compile a test program to verify toolchain.
 
+        Successful compiles are remembered per source and compiler/flags,
+        so repeated checks do not re-run the compiler; failures are retried.
+        """
         env = self.config.get_environment()
         cc = env.get("CC", "gcc")
         cflags = env.get("CFLAGS", "").split()
         ldflags = env.get("LDFLAGS", "").split()
 
+        key = (hashlib.sha1(source_code.encode()).hexdigest(), cc,
+               tuple(cflags), tuple(ldflags))
+        if key in self._compile_cache:
+            return True
+
+        success = self._compile(source_code, env, cc, cflags, ldflags)
+        if success:
+            self._compile_cache.add(key)
+        return success
+
+    def _compile(self, source_code: str, env: Dict[str, str], cc: str,
+                 cflags: List[str], ldflags: List[str]) -> bool:
+        """Write, compile and clean up a test program"""
+        test_file = self.output_dir / "test.c"
+        output_file = self.output_dir / "test"
+
+        # Write test source
+        test_file.write_text(source_code)
+
         try:
             # Compile the test program
             cmd = [cc] + cflags + ["-o", str(output_file), str(test_file)] + ldflags
@@ -211,33 +269,32 @@ class CrossCompiler:
                 env=env
             )
 
-            success = result.returncode == 0 and output_file.exists()
-
-            # Clean up
-            if test_file.exists():
-                test_file.unlink()
-            if output_file.exists():
-                output_file.unlink()
-
-            return success
+            return result.returncode == 0 and output_file.exists()
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return False
+        finally:
+            # Clean up
+            test_file.unlink(missing_ok=True)
+            output_file.unlink(missing_ok=True)
 
     def get_libc_version(self) -> Optional[str]:
-        """Get the version of the C library"""
-        if self.config.toolchain.libc == LibcType.MUSL:
-            # For musl, we can check the version by compiling a test program
-            test_code = """
-#include <stdio.h>
-#ifdef __GLIBC__
-#error "Not musl"
-#endif
-int main() {
-    return 0;
-}
-"""
-            if self.compile_test_program(test_code):
-                return "musl"
+        """
+        Get the version of the C library.
+
+        Read from the compiler's target triple (`cc -dumpmachine`, e.g.
+        x86_64-linux-musl), which needs no test program.
+        """
+        cc = self.config.get_environment_overrides()["CC"]
+
+        outcome = self._probe_cc(cc, "-dumpmachine")
+        if outcome is None or outcome[0] != 0:
+            return None
+
+        triple = outcome[1].strip()
+        if "musl" in triple:
+            return LibcType.MUSL.value
+        if "gnu" in triple:
+            return LibcType.GLIBC.value
 
         return None
 
@@ -7,6 +7,7 @@ from .busybox import (
     BusyBoxUtility,
     BusyBoxBuilder,
     build_busybox,
+    build_busybox_many,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "BusyBoxUtility",
     "BusyBoxBuilder",
     "build_busybox",
+    "build_busybox_many",
 ]
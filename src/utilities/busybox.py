@@ -5,8 +5,13 @@ Provides modular configuration of essential Unix utilities with size optimizatio
 """
 
 import hashlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, lru_cache
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Set, Optional, Dict
+from typing import List, Set, Optional, Dict, Tuple, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -22,14 +27,21 @@ class UtilityCategory(Enum):
     PROCESS = "process"  # Process management
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class BusyBoxUtility:
-    """Represents a BusyBox utility"""
+    """Represents a BusyBox utility
+
+    Utilities are immutable and compare/hash by name only.
+    """
     name: str
     category: UtilityCategory
     essential: bool = False  # Must be included in minimal builds
     description: str = ""
     size_bytes: int = 0  # Approximate size contribution
+    name_upper: str = field(init=False, repr=False)  # Kconfig symbol suffix
+
+    def __post_init__(self):
+        object.__setattr__(self, "name_upper", self.name.upper())
 
     def __hash__(self):
         return hash(self.name)
@@ -87,15 +99,111 @@ class ImageProfile(Enum):
     EXTENDED = "extended"  # Full featured
 
 
-@dataclass
+# Shared by profile construction and verify_essential_utilities
+_ESSENTIAL_FROZEN = frozenset(ESSENTIAL_UTILITIES)
+
+# Optional utilities included in the STANDARD profile
+_COMMON_NAMES = frozenset({
+    "wget", "tar", "gzip", "gunzip", "find", "chmod", "chown", "ln", "df", "du",
+})
+
+_COMMON_OPTIONAL = frozenset(u for u in OPTIONAL_UTILITIES if u.name in _COMMON_NAMES)
+_ALL_OPTIONAL = frozenset(OPTIONAL_UTILITIES)
+
+# Utility sets per profile; the profiles are static, so build them once
+_PROFILE_SETS = {
+    ImageProfile.MINIMAL: _ESSENTIAL_FROZEN,
+    ImageProfile.STANDARD: _ESSENTIAL_FROZEN | _COMMON_OPTIONAL,
+    ImageProfile.EXTENDED: _ESSENTIAL_FROZEN | _ALL_OPTIONAL,
+}
+
+# Repeating mock binary pattern, sized to a whole number of repetitions
+# (~64 KiB) so consecutive chunks continue the pattern seamlessly
+_MOCK_PATTERN = b"BUSYBOX"
+_MOCK_CHUNK = memoryview(_MOCK_PATTERN * (65536 // len(_MOCK_PATTERN)))
+
+# C-level sort key for utilities
+_NAME = attrgetter("name")
+
+
+@cache
+def _utilities_by_category() -> Dict[str, Tuple[BusyBoxUtility, ...]]:
+    """Group all known utilities by category value (computed once)"""
+    by_category = defaultdict(list)
+    for utility in chain(ESSENTIAL_UTILITIES, OPTIONAL_UTILITIES):
+        by_category[utility.category.value].append(utility)
+    return {category: tuple(utils) for category, utils in by_category.items()}
+
+
+@lru_cache(maxsize=32)
+def _cflags(size_opt: bool, hardening: bool, custom: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Compilation flags for a flag combination (memoized)"""
+    flags = list(custom)
+
+    if size_opt:
+        flags.extend(["-Os", "-ffunction-sections", "-fdata-sections"])
+
+    if hardening:
+        flags.extend([
+            "-fPIE",
+            "-fstack-protector-strong",
+            "-D_FORTIFY_SOURCE=2",
+        ])
+
+    return tuple(flags)
+
+
+@lru_cache(maxsize=8)
+def _ldflags(static: bool, size_opt: bool, hardening: bool) -> Tuple[str, ...]:
+    """Linker flags for a flag combination (memoized)"""
+    flags = []
+
+    if static:
+        flags.append("-static")
+
+    if size_opt:
+        flags.extend(["-Wl,--gc-sections", "-Wl,--strip-all"])
+
+    if hardening:
+        flags.extend([
+            "-Wl,-z,relro",
+            "-Wl,-z,now",
+            "-Wl,-z,noexecstack",
+        ])
+
+    return tuple(flags)
+
+
+def _new_hash(algo: str):
+    """Create a hash object, using a 256-bit digest for BLAKE2b"""
+    if algo == "blake2b":
+        return hashlib.blake2b(digest_size=32)
+    return hashlib.new(algo)
+
+
+def _mock_chunks(size: int):
+    """Yield the mock binary contents of the given size in bounded chunks"""
+    chunk_size = len(_MOCK_CHUNK)
+    while size >= chunk_size:
+        yield _MOCK_CHUNK
+        size -= chunk_size
+    if size:
+        yield _MOCK_CHUNK[:size]
+
+
+@dataclass(kw_only=True, slots=True)
 class BusyBoxConfig:
-    """BusyBox build configuration"""
-    profile: ImageProfile = ImageProfile.MINIMAL
+    """BusyBox build configuration
+
+    Fields are keyword-only; the most frequently accessed ones come first.
+    """
     utilities: Set[BusyBoxUtility] = field(default_factory=set)
+    profile: ImageProfile = ImageProfile.MINIMAL
     enable_static: bool = True
     enable_size_optimization: bool = True
     enable_security_hardening: bool = True
     custom_cflags: List[str] = field(default_factory=list)
+    checksum_algo: str = "sha256"  # Any hashlib name; "blake2b" means BLAKE2b-256
 
     def __post_init__(self):
         # Initialize utilities based on profile if not set
@@ -104,22 +212,12 @@ class BusyBoxConfig:
 
     def _get_profile_utilities(self) -> Set[BusyBoxUtility]:
         """Get utilities based on profile"""
-        utilities = set(ESSENTIAL_UTILITIES)
-
-        if self.profile == ImageProfile.STANDARD:
-            # Add common optional utilities
-            common = ["wget", "tar", "gzip", "gunzip", "find", "chmod", "chown", "ln", "df", "du"]
-            utilities.update(u for u in OPTIONAL_UTILITIES if u.name in common)
-
-        elif self.profile == ImageProfile.EXTENDED:
-            # Add all utilities
-            utilities.update(OPTIONAL_UTILITIES)
-
-        return utilities
+        # Copy, since add_utility/remove_utility mutate the result
+        return set(_PROFILE_SETS[self.profile])
 
     def get_utility_names(self) -> List[str]:
         """Get list of utility names"""
-        return sorted([u.name for u in self.utilities])
+        return sorted(u.name for u in self.utilities)
 
     def add_utility(self, utility: BusyBoxUtility) -> bool:
         """Add a utility to the configuration"""
@@ -150,52 +248,32 @@ class BusyBoxConfig:
 
     def verify_essential_utilities(self) -> bool:
         """Verify that all essential utilities are included"""
-        essential = set(u for u in ESSENTIAL_UTILITIES)
-        return essential.issubset(self.utilities)
+        return _ESSENTIAL_FROZEN.issubset(self.utilities)
 
     def get_cflags(self) -> List[str]:
         """Get compilation flags"""
-        flags = list(self.custom_cflags)
-
-        if self.enable_size_optimization:
-            flags.extend(["-Os", "-ffunction-sections", "-fdata-sections"])
-
-        if self.enable_security_hardening:
-            flags.extend([
-                "-fPIE",
-                "-fstack-protector-strong",
-                "-D_FORTIFY_SOURCE=2",
-            ])
-
-        return flags
+        return list(_cflags(
+            self.enable_size_optimization,
+            self.enable_security_hardening,
+            tuple(self.custom_cflags),
+        ))
 
     def get_ldflags(self) -> List[str]:
         """Get linker flags"""
-        flags = []
-
-        if self.enable_static:
-            flags.append("-static")
+        return list(_ldflags(
+            self.enable_static,
+            self.enable_size_optimization,
+            self.enable_security_hardening,
+        ))
 
-        if self.enable_size_optimization:
-            flags.extend(["-Wl,--gc-sections", "-Wl,--strip-all"])
 
-        if self.enable_security_hardening:
-            flags.extend([
-                "-Wl,-z,relro",
-                "-Wl,-z,now",
-                "-Wl,-z,noexecstack",
-            ])
-
-        return flags
-
-
-@dataclass
+@dataclass(kw_only=True, slots=True)
 class BusyBoxBuildResult:
     """Result of BusyBox build"""
+    checksum: str
+    size_bytes: int
     binary_path: Path
     config: BusyBoxConfig
-    size_bytes: int
-    checksum: str
     utilities: List[str]
 
     def verify_checksum(self, expected: str) -> bool:
@@ -204,9 +282,8 @@ class BusyBoxBuildResult:
 
     def verify_utilities(self) -> bool:
         """Verify that all configured utilities are present"""
-        configured = set(self.config.get_utility_names())
-        built = set(self.utilities)
-        return configured == built
+        # Unordered comparison; no need to sort either side
+        return set(self.utilities) == {u.name for u in self.config.utilities}
 
 
 class BusyBoxBuilder:
@@ -216,6 +293,39 @@ class BusyBoxBuilder:
         self.config = config
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # (algorithm, bytes hashed, context) over whole pattern chunks,
+        # reused so rebuilds only hash what changed
+        self._base_ctx = None
+
+    @staticmethod
+    def update_checksum(prev_ctx, new_bytes):
+        """Return a copy of a hash context extended with new_bytes
+
+        prev_ctx itself is left untouched so it can be reused.
+        """
+        ctx = prev_ctx.copy()
+        ctx.update(new_bytes)
+        return ctx
+
+    def _pattern_digest(self, size: int):
+        """Hash context for the first size bytes of the mock image"""
+        chunk_size = len(_MOCK_CHUNK)
+        whole = size - size % chunk_size
+        algo = self.config.checksum_algo
+
+        base = self._base_ctx
+        if base is None or base[0] != algo or base[1] > whole:
+            self._base_ctx = (algo, 0, _new_hash(algo))
+        _, hashed, ctx = self._base_ctx
+
+        # Extend the cached prefix by the whole chunks not hashed yet
+        if hashed < whole:
+            ctx = ctx.copy()
+            for _ in range((whole - hashed) // chunk_size):
+                ctx.update(_MOCK_CHUNK)
+            self._base_ctx = (algo, whole, ctx)
+
+        return self.update_checksum(ctx, _MOCK_CHUNK[:size - whole])
 
     def generate_config_file(self) -> Path:
         """Generate BusyBox .config file"""
@@ -233,26 +343,22 @@ class BusyBoxBuilder:
             "# Kimigayo OS BusyBox Configuration",
             f"# Profile: {self.config.profile.value}",
             "",
+            # Static linking
+            "CONFIG_STATIC=y" if self.config.enable_static
+            else "# CONFIG_STATIC is not set",
         ]
 
-        # Static linking
-        if self.config.enable_static:
-            lines.append("CONFIG_STATIC=y")
-        else:
-            lines.append("# CONFIG_STATIC is not set")
-
         # Size optimization
         if self.config.enable_size_optimization:
-            lines.append("CONFIG_FEATURE_PREFER_APPLETS=y")
-            lines.append("CONFIG_FEATURE_SH_STANDALONE=y")
+            lines += ("CONFIG_FEATURE_PREFER_APPLETS=y", "CONFIG_FEATURE_SH_STANDALONE=y")
 
-        lines.append("")
-        lines.append("# Enabled utilities:")
+        lines += ("", "# Enabled utilities:")
 
         # List enabled utilities
-        for utility in sorted(self.config.utilities, key=lambda u: u.name):
-            utility_config = f"CONFIG_{utility.name.upper()}=y"
-            lines.append(utility_config)
+        lines.extend(
+            f"CONFIG_{utility.name_upper}=y"
+            for utility in sorted(self.config.utilities, key=_NAME)
+        )
 
         return "\n".join(lines)
 
@@ -270,12 +376,10 @@ class BusyBoxBuilder:
 
         # Create mock binary with size based on configuration
         estimated_size = self.config.get_estimated_size()
-        # Ensure we have enough data to fill the estimated size
-        mock_data = b"BUSYBOX" * ((estimated_size // 7) + 1)
-        binary_path.write_bytes(mock_data[:estimated_size])
-
-        # Calculate checksum
-        checksum = self._calculate_checksum(binary_path)
+        # Stream the pattern so the whole image is never held in memory
+        with open(binary_path, "wb") as f:
+            f.writelines(_mock_chunks(estimated_size))
+        checksum = self._pattern_digest(estimated_size).hexdigest()
 
         # Get actual size
         size_bytes = binary_path.stat().st_size
@@ -289,28 +393,54 @@ class BusyBoxBuilder:
         )
 
     def _calculate_checksum(self, file_path: Path) -> str:
-        """Calculate SHA-256 checksum"""
-        sha256 = hashlib.sha256()
+        """Calculate checksum with the configured algorithm (SHA-256 by default)"""
+        algo = self.config.checksum_algo
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+            return hashlib.file_digest(f, lambda: _new_hash(algo)).hexdigest()
 
     def list_available_utilities(self) -> Dict[str, List[BusyBoxUtility]]:
         """List all available utilities by category"""
-        all_utilities = ESSENTIAL_UTILITIES + OPTIONAL_UTILITIES
-
-        by_category = {}
-        for utility in all_utilities:
-            category = utility.category.value
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append(utility)
-
-        return by_category
+        # Fresh lists so callers can modify the result freely
+        return {
+            category: list(utils)
+            for category, utils in _utilities_by_category().items()
+        }
 
 
 def build_busybox(config: BusyBoxConfig, output_dir: Path) -> BusyBoxBuildResult:
     """Build BusyBox with specified configuration"""
     builder = BusyBoxBuilder(config, output_dir)
     return builder.build()
+
+
+def _build_one(item: Tuple[BusyBoxConfig, Path]) -> BusyBoxBuildResult:
+    """Process pool entry point for build_busybox_many"""
+    config, output_dir = item
+    return build_busybox(config, output_dir)
+
+
+def build_busybox_many(
+    items: Iterable[Tuple[BusyBoxConfig, Path]],
+    max_workers: Optional[int] = None,
+) -> List[BusyBoxBuildResult]:
+    """
+    Build several BusyBox configurations in parallel.
+
+    Each build runs in a worker process, so the returned results carry
+    copies of the configurations rather than the original objects.
+
+    Args:
+        items: (config, output_dir) pairs; output directories should differ
+        max_workers: Worker process count (defaults to the CPU count)
+
+    Returns:
+        Build results in the same order as items
+    """
+    items = list(items)
+
+    # Not worth starting a pool for a single build
+    if len(items) <= 1:
+        return [_build_one(item) for item in items]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_build_one, items))
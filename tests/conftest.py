@@ -3,26 +3,34 @@ Pytest configuration for Kimigayo OS tests
 """
 
 import pytest
+import functools
 import os
+import subprocess
 import sys
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
-# Add project root to Python path
+# Add project root to Python path (once, even if conftest is re-imported)
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+_ROOT = str(project_root)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 # Test configuration
-KIMIGAYO_VERSION = "0.1.0"
+KIMIGAYO_VERSION = "0.1.0"  # Used when the package is not installed
 BUILD_DIR = project_root / "build"
 OUTPUT_DIR = project_root / "output"
 
 # Hypothesis configuration
 from hypothesis import settings, Verbosity
 
-# Register custom Hypothesis profile
-settings.register_profile("kimigayo", max_examples=100, verbosity=Verbosity.verbose)
-settings.register_profile("ci", max_examples=200, verbosity=Verbosity.normal)
-settings.register_profile("dev", max_examples=50, verbosity=Verbosity.verbose)
+# Verbose output costs a print per example; opt in with HYPOTHESIS_VERBOSITY=verbose
+_verbosity = Verbosity[os.getenv("HYPOTHESIS_VERBOSITY", "normal")]
+
+# Register custom Hypothesis profile (no per-example deadline timing)
+settings.register_profile("kimigayo", max_examples=100, verbosity=_verbosity, deadline=None)
+settings.register_profile("ci", max_examples=200, verbosity=Verbosity.normal, deadline=None)
+settings.register_profile("dev", max_examples=50, verbosity=Verbosity.verbose, deadline=None)
 
 # Load profile from environment or use default
 profile = os.getenv("HYPOTHESIS_PROFILE", "kimigayo")
@@ -55,10 +63,19 @@ def temp_build_dir(tmp_path):
     return tmp_path / "build"
 
 
+@functools.cache
+def _kimigayo_version():
+    """Look up the installed Kimigayo OS version once"""
+    try:
+        return version("kimigayo")
+    except PackageNotFoundError:
+        return KIMIGAYO_VERSION
+
+
 @pytest.fixture
 def kimigayo_version():
     """Return the Kimigayo OS version"""
-    return KIMIGAYO_VERSION
+    return _kimigayo_version()
 
 
 # Architecture fixtures
@@ -109,6 +126,40 @@ def size_constraints():
     }
 
 
+# Subprocess fixtures
+@pytest.fixture
+def fake_subprocess_run(monkeypatch):
+    """
+    Replace subprocess.run with a recorder that never starts a process.
+
+    Each argv is appended to ``fake.calls``; results use ``fake.returncode``
+    and ``fake.stdout``. Set ``fake.raises`` to raise instead. Successful
+    compiler runs (``-o <path>``) create an empty output file.
+    """
+    def fake(cmd, **kwargs):
+        fake.calls.append(cmd)
+        if fake.raises is not None:
+            raise fake.raises
+        if "-o" in cmd and fake.returncode == 0:
+            Path(cmd[cmd.index("-o") + 1]).write_text("")
+        return subprocess.CompletedProcess(cmd, fake.returncode, stdout=fake.stdout)
+
+    fake.calls = []
+    fake.returncode = 0
+    fake.stdout = ""
+    fake.raises = None
+    monkeypatch.setattr(subprocess, "run", fake)
+    return fake
+
+
+def pytest_addoption(parser):
+    """Register command line options"""
+    parser.addoption(
+        "--run-benchmark", action="store_true", default=False,
+        help="run tests marked as benchmark (skipped by default)",
+    )
+
+
 # Property test markers
 def pytest_configure(config):
     """Register custom markers"""
@@ -127,3 +178,20 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "security: mark test as a security test"
     )
+    config.addinivalue_line(
+        "markers", "benchmark: mark test as a benchmark orchestration test (needs --run-benchmark)"
+    )
+    # Registered here too so --strict-markers passes without pytest-xdist
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests with the same name on one xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmark tests unless --run-benchmark is given"""
+    if config.getoption("--run-benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="needs --run-benchmark option to run")
+    for item in items:
+        if item.get_closest_marker("benchmark") is not None:
+            item.add_marker(skip_benchmark)
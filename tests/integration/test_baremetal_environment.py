@@ -8,9 +8,12 @@ Target Environments:
 - ARM64 devices
 """
 
-import pytest
+import dataclasses
+import json
+import os
 import platform
-from unittest.mock import Mock, patch, mock_open
+
+import pytest
 
 from src.integration.baremetal_test import (
     Architecture,
@@ -25,6 +28,45 @@ from src.integration.baremetal_test import (
 )
 
 
+# /proc file contents shared by the detector tests
+_CPUINFO = b"model name\t: Intel Core i7-9700K\n"
+_MEMINFO = b"MemTotal:       16384000 kB\nMemAvailable:   8192000 kB\n"
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Make any throttling sleep in the testers return immediately"""
+    monkeypatch.setattr("time.sleep", lambda *_: None)
+
+
+def _fake_uname(monkeypatch, machine="x86_64", system="Linux"):
+    """Make every HardwareDetector report the given uname values"""
+    uname = platform.uname()._replace(machine=machine, system=system)
+    monkeypatch.setattr(HardwareDetector, "_uname", lambda self: uname)
+
+
+@pytest.fixture(scope="module")
+def detector():
+    """Hardware detector shared by the tests in this module"""
+    return HardwareDetector()
+
+
+@pytest.fixture(scope="module")
+def arch_tester(detector):
+    """Architecture tester using the shared detector"""
+    tester = ArchitectureTester()
+    tester.detector = detector
+    return tester
+
+
+@pytest.fixture(scope="module")
+def compat_tester(detector):
+    """Hardware compatibility tester using the shared detector"""
+    tester = HardwareCompatibilityTester()
+    tester.detector = detector
+    return tester
+
+
 class TestArchitecture:
     """Tests for architecture enum"""
 
@@ -94,6 +136,35 @@ class TestHardwareInfo:
         assert info_dict['architecture'] == "aarch64"
         assert info_dict['cpu_count'] == 4
 
+    def test_hardware_info_is_immutable(self):
+        """Test: Hardware info cannot be modified after creation"""
+        info = HardwareInfo(
+            architecture="x86_64",
+            cpu_model="Test CPU",
+            cpu_count=2,
+            total_memory_mb=1024,
+            platform_system="Linux"
+        )
+
+        with pytest.raises(AttributeError):
+            info.cpu_count = 4
+
+    def test_to_dict_returns_copies(self):
+        """Test: Modifying a returned dictionary does not affect later calls"""
+        info = HardwareInfo(
+            architecture="x86_64",
+            cpu_model="Test CPU",
+            cpu_count=2,
+            total_memory_mb=1024,
+            platform_system="Linux"
+        )
+
+        info.to_dict()['cpu_count'] = 99
+
+        assert info.to_dict()['cpu_count'] == 2
+        assert 'platform_system' in info.to_dict()
+        assert info.to_dict() == dataclasses.asdict(info)
+
 
 class TestBaremetalTestResult:
     """Tests for bare metal test result"""
@@ -123,6 +194,7 @@ class TestBaremetalTestResult:
         assert 'architecture' in result.details
 
 
+@pytest.mark.xdist_group(name="baremetal-detector")
 class TestHardwareDetector:
     """Tests for hardware detector"""
 
@@ -132,88 +204,117 @@ class TestHardwareDetector:
 
         assert detector is not None
 
-    @patch('platform.machine')
-    def test_get_architecture_x86_64(self, mock_machine):
-        """Test: Detects x86_64 architecture"""
-        mock_machine.return_value = "x86_64"
+    @pytest.mark.parametrize("machine,expected", [
+        ("x86_64", Architecture.X86_64),
+        ("amd64", Architecture.X86_64),
+        ("aarch64", Architecture.ARM64),
+        ("armv7l", Architecture.ARM32),
+        ("riscv64", Architecture.RISCV),
+        ("riscv32", Architecture.RISCV),
+        ("AMD64", Architecture.X86_64),
+        ("unknown-arch", Architecture.UNKNOWN),
+    ])
+    def test_get_architecture(self, machine, expected, detector, monkeypatch):
+        """Test: Maps the uname machine to an architecture"""
+        _fake_uname(monkeypatch, machine=machine)
+
+        assert detector.get_architecture() == expected
+
+    def test_get_cpu_info(self, tmp_path, monkeypatch):
+        """Test: Can get CPU information"""
+        monkeypatch.setattr(HardwareDetector, "_get_cpu_count", lambda self: 8)
+        cpuinfo = tmp_path / "cpuinfo"
+        cpuinfo.write_bytes(_CPUINFO)
 
-        detector = HardwareDetector()
-        arch = detector.get_architecture()
+        detector = HardwareDetector(cpuinfo_path=str(cpuinfo))
+        cpu_info = detector.get_cpu_info()
 
-        assert arch == Architecture.X86_64
+        assert cpu_info['count'] == 8
+        assert 'Intel Core i7-9700K' in cpu_info['model']
 
-    @patch('platform.machine')
-    def test_get_architecture_amd64(self, mock_machine):
-        """Test: Detects AMD64 as x86_64"""
-        mock_machine.return_value = "amd64"
+    def test_get_cpu_count_uses_affinity(self, monkeypatch):
+        """Test: CPU count comes from the affinity mask and is cached"""
+        calls = []
+        monkeypatch.setattr(os, "sched_getaffinity", lambda pid: calls.append(pid) or {0, 1, 2})
 
         detector = HardwareDetector()
-        arch = detector.get_architecture()
 
-        assert arch == Architecture.X86_64
+        assert detector._get_cpu_count() == 3
+        assert detector._get_cpu_count() == 3
+        assert calls == [0]
 
-    @patch('platform.machine')
-    def test_get_architecture_arm64(self, mock_machine):
-        """Test: Detects ARM64 architecture"""
-        mock_machine.return_value = "aarch64"
+    def test_get_cpu_count_without_affinity(self, monkeypatch):
+        """Test: Falls back to os.cpu_count() without sched_getaffinity"""
+        monkeypatch.delattr(os, "sched_getaffinity", raising=False)
+        monkeypatch.setattr(os, "cpu_count", lambda: 6)
 
-        detector = HardwareDetector()
-        arch = detector.get_architecture()
+        assert HardwareDetector()._get_cpu_count() == 6
 
-        assert arch == Architecture.ARM64
+    def test_get_memory_info(self, tmp_path):
+        """Test: Can get memory information"""
+        meminfo = tmp_path / "meminfo"
+        meminfo.write_bytes(_MEMINFO)
 
-    @patch('platform.machine')
-    def test_get_architecture_arm32(self, mock_machine):
-        """Test: Detects ARM32 architecture"""
-        mock_machine.return_value = "armv7l"
+        detector = HardwareDetector(meminfo_path=str(meminfo))
+        memory_info = detector.get_memory_info()
 
-        detector = HardwareDetector()
-        arch = detector.get_architecture()
+        assert memory_info['total_mb'] == 16000  # 16384000 / 1024
+        assert memory_info['available_mb'] == 8000  # 8192000 / 1024
 
-        assert arch == Architecture.ARM32
+    def test_get_memory_info_uses_sysconf(self, monkeypatch):
+        """Test: Total memory for the running system comes from sysconf"""
+        pages = {'SC_PHYS_PAGES': 16384 * 256, 'SC_PAGESIZE': 4096}
+        monkeypatch.setattr(os, "sysconf", lambda name: pages[name])
 
-    @patch('platform.machine')
-    def test_get_architecture_unknown(self, mock_machine):
-        """Test: Returns UNKNOWN for unrecognized architecture"""
-        mock_machine.return_value = "unknown-arch"
+        memory_info = HardwareDetector().get_memory_info()
 
-        detector = HardwareDetector()
-        arch = detector.get_architecture()
+        assert memory_info['total_mb'] == 16384
 
-        assert arch == Architecture.UNKNOWN
+    def test_sysconf_unsupported(self, monkeypatch):
+        """Test: sysconf failures report zero so /proc is used instead"""
+        def unsupported(name):
+            raise ValueError(name)
 
-    @patch('os.cpu_count')
-    @patch('builtins.open', new_callable=mock_open, read_data="model name\t: Intel Core i7-9700K\n")
-    def test_get_cpu_info(self, mock_file, mock_cpu_count):
-        """Test: Can get CPU information"""
-        mock_cpu_count.return_value = 8
+        monkeypatch.setattr(os, "sysconf", unsupported)
 
-        detector = HardwareDetector()
-        cpu_info = detector.get_cpu_info()
+        assert HardwareDetector()._sysconf_total_mb() == 0
 
-        assert cpu_info['count'] == 8
-        assert 'Intel Core i7-9700K' in cpu_info['model']
+    def test_get_memory_info_stops_after_needed_fields(self, tmp_path):
+        """Test: Memory scan stops once MemTotal and MemAvailable are read"""
+        meminfo = tmp_path / "meminfo"
+        meminfo.write_text(
+            "MemTotal:       2048000 kB\n"
+            "MemAvailable:   1024000 kB\n"
+            "MemTotal:       not-a-number kB\n"
+        )
 
-    @patch('builtins.open', new_callable=mock_open, read_data="MemTotal:       16384000 kB\nMemAvailable:   8192000 kB\n")
-    def test_get_memory_info(self, mock_file):
-        """Test: Can get memory information"""
-        detector = HardwareDetector()
-        memory_info = detector.get_memory_info()
+        detector = HardwareDetector(meminfo_path=str(meminfo))
 
-        assert memory_info['total_mb'] == 16000  # 16384000 / 1024
-        assert memory_info['available_mb'] == 8000  # 8192000 / 1024
+        assert detector.get_memory_info() == {'total_mb': 2000, 'available_mb': 1000}
+
+    def test_get_info_without_proc(self, tmp_path):
+        """Test: Falls back to defaults when /proc is unavailable"""
+        detector = HardwareDetector(
+            cpuinfo_path=str(tmp_path / "missing-cpuinfo"),
+            meminfo_path=str(tmp_path / "missing-meminfo"),
+        )
+
+        assert detector.get_cpu_info()['model'] == 'Unknown'
+        assert detector.get_memory_info() == {'total_mb': 0, 'available_mb': 0}
 
-    @patch.object(HardwareDetector, 'get_architecture')
-    @patch.object(HardwareDetector, 'get_cpu_info')
-    @patch.object(HardwareDetector, 'get_memory_info')
-    @patch('platform.system')
-    def test_get_hardware_info(self, mock_system, mock_memory, mock_cpu, mock_arch):
+    def test_get_hardware_info(self, monkeypatch):
         """Test: Can get complete hardware information"""
-        mock_arch.return_value = Architecture.X86_64
-        mock_cpu.return_value = {'model': 'Intel i7', 'count': 8}
-        mock_memory.return_value = {'total_mb': 16384, 'available_mb': 8192}
-        mock_system.return_value = "Linux"
+        monkeypatch.setattr(HardwareDetector, "get_architecture", lambda self: Architecture.X86_64)
+        monkeypatch.setattr(
+            HardwareDetector, "get_cpu_info", lambda self: {'model': 'Intel i7', 'count': 8}
+        )
+        monkeypatch.setattr(
+            HardwareDetector, "get_memory_info",
+            lambda self: {'total_mb': 16384, 'available_mb': 8192},
+        )
+        _fake_uname(monkeypatch, system="Linux")
 
+        # Fresh detector so the patched values are not cached for other tests
         detector = HardwareDetector()
         hw_info = detector.get_hardware_info()
 
@@ -222,7 +323,26 @@ class TestHardwareDetector:
         assert hw_info.cpu_count == 8
         assert hw_info.total_memory_mb == 16384
 
+    def test_get_hardware_info_cached_until_invalidated(self, monkeypatch):
+        """Test: Hardware information is read once until invalidated"""
+        calls = []
+        monkeypatch.setattr(
+            HardwareDetector, "get_cpu_info",
+            lambda self: calls.append(1) or {'model': 'Test CPU', 'count': len(calls)},
+        )
+
+        detector = HardwareDetector()
+        first = detector.get_hardware_info()
+
+        assert detector.get_hardware_info() is first
+        assert len(calls) == 1
+
+        detector.invalidate()
 
+        assert detector.get_hardware_info().cpu_count == 2
+
+
+@pytest.mark.xdist_group(name="baremetal-architecture")
 class TestArchitectureTester:
     """Tests for architecture tester"""
 
@@ -233,69 +353,39 @@ class TestArchitectureTester:
         assert tester is not None
         assert tester.detector is not None
 
-    @patch.object(HardwareDetector, 'get_architecture')
-    def test_test_x86_64_support_pass(self, mock_arch):
-        """Test: x86_64 support test passes on x86_64"""
-        mock_arch.return_value = Architecture.X86_64
-
-        tester = ArchitectureTester()
-        result = tester.test_x86_64_support()
-
-        assert result.passed is True
-        assert "x86_64" in result.message
-
-    @patch.object(HardwareDetector, 'get_architecture')
-    def test_test_x86_64_support_fail(self, mock_arch):
-        """Test: x86_64 support test fails on non-x86_64"""
-        mock_arch.return_value = Architecture.ARM64
-
-        tester = ArchitectureTester()
-        result = tester.test_x86_64_support()
-
-        assert result.passed is False
-
-    @patch.object(HardwareDetector, 'get_architecture')
-    def test_test_arm64_support_pass(self, mock_arch):
-        """Test: ARM64 support test passes on ARM64"""
-        mock_arch.return_value = Architecture.ARM64
-
-        tester = ArchitectureTester()
-        result = tester.test_arm64_support()
-
-        assert result.passed is True
-        assert "ARM64" in result.message
-
-    @patch.object(HardwareDetector, 'get_architecture')
-    def test_test_arm64_support_fail(self, mock_arch):
-        """Test: ARM64 support test fails on non-ARM64"""
-        mock_arch.return_value = Architecture.X86_64
+    @pytest.mark.parametrize("method,arch,passed,label", [
+        ("test_x86_64_support", Architecture.X86_64, True, "x86_64"),
+        ("test_x86_64_support", Architecture.ARM64, False, "x86_64"),
+        ("test_arm64_support", Architecture.ARM64, True, "ARM64"),
+        ("test_arm64_support", Architecture.X86_64, False, "ARM64"),
+    ])
+    def test_architecture_support(self, method, arch, passed, label, arch_tester, monkeypatch):
+        """Test: Support tests pass only on their own architecture"""
+        monkeypatch.setattr(HardwareDetector, "get_architecture", lambda self: arch)
 
-        tester = ArchitectureTester()
-        result = tester.test_arm64_support()
+        result = getattr(arch_tester, method)()
 
-        assert result.passed is False
+        assert result.passed is passed
+        assert label in result.message
 
-    @patch.object(HardwareDetector, 'get_architecture')
-    def test_test_architecture_detection_success(self, mock_arch):
+    def test_test_architecture_detection_success(self, arch_tester, monkeypatch):
         """Test: Architecture detection succeeds"""
-        mock_arch.return_value = Architecture.X86_64
+        monkeypatch.setattr(HardwareDetector, "get_architecture", lambda self: Architecture.X86_64)
 
-        tester = ArchitectureTester()
-        result = tester.test_architecture_detection()
+        result = arch_tester.test_architecture_detection()
 
         assert result.passed is True
 
-    @patch.object(HardwareDetector, 'get_architecture')
-    def test_test_architecture_detection_failure(self, mock_arch):
+    def test_test_architecture_detection_failure(self, arch_tester, monkeypatch):
         """Test: Architecture detection fails for UNKNOWN"""
-        mock_arch.return_value = Architecture.UNKNOWN
+        monkeypatch.setattr(HardwareDetector, "get_architecture", lambda self: Architecture.UNKNOWN)
 
-        tester = ArchitectureTester()
-        result = tester.test_architecture_detection()
+        result = arch_tester.test_architecture_detection()
 
         assert result.passed is False
 
 
+@pytest.mark.xdist_group(name="baremetal-compatibility")
 class TestHardwareCompatibilityTester:
     """Tests for hardware compatibility tester"""
 
@@ -306,67 +396,64 @@ class TestHardwareCompatibilityTester:
         assert tester is not None
         assert tester.detector is not None
 
-    @patch.object(HardwareDetector, 'get_memory_info')
-    def test_test_minimum_memory_pass(self, mock_memory):
+    def test_test_minimum_memory_pass(self, compat_tester, monkeypatch):
         """Test: Minimum memory test passes"""
-        mock_memory.return_value = {'total_mb': 512, 'available_mb': 256}
+        monkeypatch.setattr(
+            HardwareDetector, "get_memory_info", lambda self: {'total_mb': 512, 'available_mb': 256}
+        )
 
-        tester = HardwareCompatibilityTester()
-        result = tester.test_minimum_memory(128)
+        result = compat_tester.test_minimum_memory(128)
 
         assert result.passed is True
 
-    @patch.object(HardwareDetector, 'get_memory_info')
-    def test_test_minimum_memory_fail(self, mock_memory):
+    def test_test_minimum_memory_fail(self, compat_tester, monkeypatch):
         """Test: Minimum memory test fails"""
-        mock_memory.return_value = {'total_mb': 64, 'available_mb': 32}
+        monkeypatch.setattr(
+            HardwareDetector, "get_memory_info", lambda self: {'total_mb': 64, 'available_mb': 32}
+        )
 
-        tester = HardwareCompatibilityTester()
-        result = tester.test_minimum_memory(128)
+        result = compat_tester.test_minimum_memory(128)
 
         assert result.passed is False
 
-    @patch.object(HardwareDetector, 'get_cpu_info')
-    def test_test_cpu_count_pass(self, mock_cpu):
+    def test_test_cpu_count_pass(self, compat_tester, monkeypatch):
         """Test: CPU count test passes"""
-        mock_cpu.return_value = {'count': 4, 'model': 'Test CPU'}
+        monkeypatch.setattr(
+            HardwareDetector, "get_cpu_info", lambda self: {'count': 4, 'model': 'Test CPU'}
+        )
 
-        tester = HardwareCompatibilityTester()
-        result = tester.test_cpu_count(2)
+        result = compat_tester.test_cpu_count(2)
 
         assert result.passed is True
 
-    @patch.object(HardwareDetector, 'get_cpu_info')
-    def test_test_cpu_count_fail(self, mock_cpu):
+    def test_test_cpu_count_fail(self, compat_tester, monkeypatch):
         """Test: CPU count test fails"""
-        mock_cpu.return_value = {'count': 1, 'model': 'Test CPU'}
+        monkeypatch.setattr(
+            HardwareDetector, "get_cpu_info", lambda self: {'count': 1, 'model': 'Test CPU'}
+        )
 
-        tester = HardwareCompatibilityTester()
-        result = tester.test_cpu_count(4)
+        result = compat_tester.test_cpu_count(4)
 
         assert result.passed is False
 
-    @patch('platform.system')
-    def test_test_platform_compatibility_linux(self, mock_system):
+    def test_test_platform_compatibility_linux(self, compat_tester, monkeypatch):
         """Test: Platform compatibility passes for Linux"""
-        mock_system.return_value = "Linux"
+        _fake_uname(monkeypatch, system="Linux")
 
-        tester = HardwareCompatibilityTester()
-        result = tester.test_platform_compatibility()
+        result = compat_tester.test_platform_compatibility()
 
         assert result.passed is True
 
-    @patch('platform.system')
-    def test_test_platform_compatibility_unsupported(self, mock_system):
+    def test_test_platform_compatibility_unsupported(self, compat_tester, monkeypatch):
         """Test: Platform compatibility fails for unsupported platform"""
-        mock_system.return_value = "Windows"
+        _fake_uname(monkeypatch, system="Windows")
 
-        tester = HardwareCompatibilityTester()
-        result = tester.test_platform_compatibility()
+        result = compat_tester.test_platform_compatibility()
 
         assert result.passed is False
 
 
+@pytest.mark.xdist_group(name="baremetal-benchmark")
 class TestBaremetalEnvironmentBenchmark:
     """Tests for bare metal environment benchmark"""
 
@@ -379,10 +466,10 @@ class TestBaremetalEnvironmentBenchmark:
         assert benchmark.arch_tester is not None
         assert benchmark.compat_tester is not None
 
-    @patch.object(HardwareDetector, 'get_architecture')
-    def test_run_architecture_tests(self, mock_arch):
+    @pytest.mark.benchmark
+    def test_run_architecture_tests(self, monkeypatch):
         """Test: Runs architecture tests"""
-        mock_arch.return_value = Architecture.X86_64
+        monkeypatch.setattr(HardwareDetector, "get_architecture", lambda self: Architecture.X86_64)
 
         benchmark = BaremetalEnvironmentBenchmark()
         results = benchmark.run_architecture_tests()
@@ -391,16 +478,32 @@ class TestBaremetalEnvironmentBenchmark:
         assert 'tests' in results
         assert len(results['tests']) > 0
 
-    @patch.object(HardwareDetector, 'get_hardware_info')
-    def test_run_hardware_tests(self, mock_hw_info):
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("arch,expected", [
+        (Architecture.X86_64, ["Architecture Detection", "x86_64 Architecture Support"]),
+        (Architecture.ARM64, ["Architecture Detection", "ARM64 Architecture Support"]),
+        (Architecture.RISCV, ["Architecture Detection"]),
+    ])
+    def test_run_architecture_tests_per_platform(self, arch, expected, monkeypatch):
+        """Test: Only the current platform's support test runs"""
+        monkeypatch.setattr(HardwareDetector, "get_architecture", lambda self: arch)
+
+        results = BaremetalEnvironmentBenchmark().run_architecture_tests()
+
+        assert results['current_architecture'] == arch.value
+        assert [t['test_name'] for t in results['tests']] == expected
+
+    @pytest.mark.benchmark
+    def test_run_hardware_tests(self, monkeypatch):
         """Test: Runs hardware tests"""
-        mock_hw_info.return_value = HardwareInfo(
+        hw_info = HardwareInfo(
             architecture="x86_64",
             cpu_model="Test CPU",
             cpu_count=4,
             total_memory_mb=8192,
             platform_system="Linux"
         )
+        monkeypatch.setattr(HardwareDetector, "get_hardware_info", lambda self: hw_info)
 
         benchmark = BaremetalEnvironmentBenchmark()
         results = benchmark.run_hardware_tests()
@@ -409,12 +512,17 @@ class TestBaremetalEnvironmentBenchmark:
         assert 'tests' in results
         assert len(results['tests']) > 0
 
-    @patch.object(BaremetalEnvironmentBenchmark, 'run_architecture_tests')
-    @patch.object(BaremetalEnvironmentBenchmark, 'run_hardware_tests')
-    def test_run_all_tests(self, mock_hw, mock_arch):
+    @pytest.mark.benchmark
+    def test_run_all_tests(self, monkeypatch):
         """Test: Runs all tests"""
-        mock_arch.return_value = {'current_architecture': 'x86_64', 'tests': []}
-        mock_hw.return_value = {'hardware_info': {}, 'tests': []}
+        monkeypatch.setattr(
+            BaremetalEnvironmentBenchmark, "run_architecture_tests",
+            lambda self: {'current_architecture': 'x86_64', 'tests': []},
+        )
+        monkeypatch.setattr(
+            BaremetalEnvironmentBenchmark, "run_hardware_tests",
+            lambda self: {'hardware_info': {}, 'tests': []},
+        )
 
         benchmark = BaremetalEnvironmentBenchmark()
         results = benchmark.run_all_tests()
@@ -423,6 +531,48 @@ class TestBaremetalEnvironmentBenchmark:
         assert 'hardware' in results
 
 
+@pytest.fixture(scope="class")
+def reporter_results():
+    """Benchmark results shared by the reporter tests (read-only)"""
+    return {
+        'architecture': {
+            'current_architecture': 'x86_64',
+            'tests': [
+                {
+                    'test_name': 'Architecture Detection',
+                    'passed': True,
+                    'duration': 0.01,
+                    'message': 'OK'
+                },
+                {
+                    'test_name': 'x86_64 Architecture Support',
+                    'passed': True,
+                    'duration': 0.01,
+                    'message': 'OK'
+                }
+            ]
+        },
+        'hardware': {
+            'hardware_info': {
+                'architecture': 'x86_64',
+                'cpu_model': 'Intel i7',
+                'cpu_count': 8,
+                'total_memory_mb': 16384,
+                'platform_system': 'Linux'
+            },
+            'tests': [
+                {
+                    'test_name': 'Memory Test',
+                    'passed': True,
+                    'duration': 0.01,
+                    'message': 'OK'
+                }
+            ]
+        }
+    }
+
+
+@pytest.mark.xdist_group(name="baremetal-reporter")
 class TestBaremetalTestReporter:
     """Tests for bare metal test reporter"""
 
@@ -432,76 +582,45 @@ class TestBaremetalTestReporter:
 
         assert reporter is not None
 
-    def test_generate_report(self):
+    def test_generate_report(self, reporter_results):
         """Test: Can generate test report"""
-        results = {
-            'architecture': {
-                'current_architecture': 'x86_64',
-                'tests': [
-                    {
-                        'test_name': 'Architecture Detection',
-                        'passed': True,
-                        'duration': 0.01,
-                        'message': 'OK'
-                    }
-                ]
-            },
-            'hardware': {
-                'hardware_info': {
-                    'architecture': 'x86_64',
-                    'cpu_model': 'Intel i7',
-                    'cpu_count': 8,
-                    'total_memory_mb': 16384,
-                    'platform_system': 'Linux'
-                },
-                'tests': [
-                    {
-                        'test_name': 'Memory Test',
-                        'passed': True,
-                        'duration': 0.01,
-                        'message': 'OK'
-                    }
-                ]
-            }
-        }
-
         reporter = BaremetalTestReporter()
-        report = reporter.generate_report(results)
+        report = reporter.generate_report(reporter_results)
 
         assert isinstance(report, str)
         assert "Bare Metal Environment Test Report" in report
         assert "x86_64" in report
         assert "PASS" in report
 
-    def test_export_metrics(self):
+    def test_export_metrics(self, reporter_results):
         """Test: Can export metrics"""
+        reporter = BaremetalTestReporter()
+        metrics = reporter.export_metrics(reporter_results)
+
+        assert isinstance(metrics, dict)
+        assert metrics['architecture'] == 'x86_64'
+        assert metrics['arch_tests_passed'] == 2
+        assert metrics['cpu_count'] == 8
+        assert metrics['total_memory_mb'] == 16384
+
+    def test_export_metrics_json(self):
+        """Test: Metrics JSON round-trips to the same dictionary"""
         results = {
             'architecture': {
-                'current_architecture': 'x86_64',
-                'tests': [
-                    {'passed': True},
-                    {'passed': True}
-                ]
+                'current_architecture': 'aarch64',
+                'tests': [{'passed': True}, {'passed': False}]
             },
             'hardware': {
-                'hardware_info': {
-                    'cpu_count': 8,
-                    'total_memory_mb': 16384
-                },
-                'tests': [
-                    {'passed': True}
-                ]
+                'hardware_info': {'cpu_count': 4, 'total_memory_mb': 2048},
+                'tests': [{'passed': True}]
             }
         }
 
         reporter = BaremetalTestReporter()
-        metrics = reporter.export_metrics(results)
+        encoded = reporter.export_metrics_json(results)
 
-        assert isinstance(metrics, dict)
-        assert metrics['architecture'] == 'x86_64'
-        assert metrics['arch_tests_passed'] == 2
-        assert metrics['cpu_count'] == 8
-        assert metrics['total_memory_mb'] == 16384
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == reporter.export_metrics(results)
 
 
 class TestBaremetalEnvironmentCompliance:
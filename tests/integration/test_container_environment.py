@@ -8,9 +8,11 @@ Target Environments:
 - Kubernetes
 """
 
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-import subprocess
 
 from src.integration.container_test import (
     ContainerRuntime,
@@ -24,6 +26,51 @@ from src.integration.container_test import (
 )
 
 
+@pytest.fixture(autouse=True)
+def mock_subprocess_run(monkeypatch):
+    """Install a single fake subprocess.run so no test shells out"""
+    m = Mock()
+    monkeypatch.setattr("subprocess.run", m)
+    yield m
+
+
+@contextmanager
+def _patch_testers(docker_available, kubectl_available):
+    """Patch Docker and Kubernetes probes in one go, yielding their mocks"""
+    docker = {
+        'check_docker_available': Mock(return_value=docker_available),
+        'get_docker_version': Mock(return_value="Docker version 24.0.0"),
+        'test_container_lifecycle': Mock(return_value=ContainerTestResult(
+            test_name="Lifecycle", passed=True, message="OK"
+        )),
+    }
+    k8s = {
+        'check_kubectl_available': Mock(return_value=kubectl_available),
+        'get_kubectl_version': Mock(return_value="Client Version: v1.28.0"),
+        'check_cluster_connection': Mock(return_value=(True, "Connected")),
+        'test_deployment': Mock(return_value=ContainerTestResult(
+            test_name="Deployment", passed=True, message="OK"
+        )),
+    }
+    with patch.multiple(DockerTester, **docker), \
+            patch.multiple(KubernetesTester, **k8s):
+        yield docker, k8s
+
+
+def _fake_runner(returncode=0, stdout="", stderr="", raises=None):
+    """Plain callable standing in for subprocess.run; records argv"""
+    calls = []
+
+    def run(argv, **kwargs):
+        calls.append(argv)
+        if raises is not None:
+            raise raises
+        return SimpleNamespace(returncode=returncode, stdout=stdout, stderr=stderr)
+
+    run.calls = calls
+    return run
+
+
 class TestContainerRuntime:
     """Tests for container runtime enum"""
 
@@ -118,47 +165,53 @@ class TestDockerTester:
 
         assert tester is not None
         assert tester.runtime == ContainerRuntime.DOCKER
+        assert tester.runner is None
+
+    def test_docker_tester_resolves_subprocess_run_per_call(self, monkeypatch):
+        """Test: subprocess.run patched after construction is still used"""
+        tester = DockerTester()
+        run = Mock(return_value=SimpleNamespace(returncode=0, stdout="", stderr=""))
+        monkeypatch.setattr("subprocess.run", run)
+
+        assert tester.check_docker_available() is True
+        run.assert_called_once()
 
-    @patch('subprocess.run')
-    def test_check_docker_available_true(self, mock_run):
+    def test_check_docker_available_true(self):
         """Test: Detects when Docker is available"""
-        mock_run.return_value = Mock(returncode=0)
+        run = _fake_runner(returncode=0)
 
-        tester = DockerTester()
+        tester = DockerTester(runner=run)
         available = tester.check_docker_available()
 
         assert available is True
-        mock_run.assert_called_once()
+        assert run.calls == [['docker', '--version']]
 
-    @patch('subprocess.run')
-    def test_check_docker_available_false(self, mock_run):
+    def test_check_docker_available_false(self):
         """Test: Detects when Docker is not available"""
-        mock_run.side_effect = FileNotFoundError()
+        run = _fake_runner(raises=FileNotFoundError())
 
-        tester = DockerTester()
+        tester = DockerTester(runner=run)
         available = tester.check_docker_available()
 
         assert available is False
 
-    @patch('subprocess.run')
-    def test_get_docker_version(self, mock_run):
+    def test_get_docker_version(self):
         """Test: Can get Docker version"""
-        mock_run.return_value = Mock(
+        run = _fake_runner(
             returncode=0,
             stdout="Docker version 24.0.0"
         )
 
-        tester = DockerTester()
+        tester = DockerTester(runner=run)
         version = tester.get_docker_version()
 
         assert version == "Docker version 24.0.0"
 
-    @patch('subprocess.run')
-    def test_build_image_success(self, mock_run):
+    def test_build_image_success(self):
         """Test: Can build Docker image"""
-        mock_run.return_value = Mock(returncode=0)
+        run = _fake_runner(returncode=0)
 
-        tester = DockerTester()
+        tester = DockerTester(runner=run)
         success, msg = tester.build_image(
             dockerfile_path="Dockerfile",
             image_name="test-image"
@@ -167,15 +220,14 @@ class TestDockerTester:
         assert success is True
         assert "Successfully built" in msg
 
-    @patch('subprocess.run')
-    def test_build_image_failure(self, mock_run):
+    def test_build_image_failure(self):
         """Test: Handles build failure"""
-        mock_run.return_value = Mock(
+        run = _fake_runner(
             returncode=1,
             stderr="Build error"
         )
 
-        tester = DockerTester()
+        tester = DockerTester(runner=run)
         success, msg = tester.build_image(
             dockerfile_path="Dockerfile",
             image_name="test-image"
@@ -184,88 +236,81 @@ class TestDockerTester:
         assert success is False
         assert "Build failed" in msg
 
-    @patch('subprocess.run')
-    def test_run_container_success(self, mock_run):
+    def test_run_container_success(self):
         """Test: Can run Docker container"""
-        mock_run.return_value = Mock(
+        run = _fake_runner(
             returncode=0,
             stdout="abc123def456\n"
         )
 
-        tester = DockerTester()
+        tester = DockerTester(runner=run)
         success, container_id = tester.run_container("alpine:latest")
 
         assert success is True
         assert container_id == "abc123def456"
 
-    @patch('subprocess.run')
-    def test_run_container_failure(self, mock_run):
+    def test_run_container_failure(self):
         """Test: Handles container run failure"""
-        mock_run.return_value = Mock(
+        run = _fake_runner(
             returncode=1,
             stderr="Run error"
         )
 
-        tester = DockerTester()
+        tester = DockerTester(runner=run)
         success, msg = tester.run_container("invalid-image")
 
         assert success is False
         assert "Run failed" in msg
 
-    @patch('subprocess.run')
-    def test_stop_container_success(self, mock_run):
+    def test_stop_container_success(self):
         """Test: Can stop Docker container"""
-        mock_run.return_value = Mock(returncode=0)
+        run = _fake_runner(returncode=0)
 
-        tester = DockerTester()
+        tester = DockerTester(runner=run)
         success, msg = tester.stop_container("abc123")
 
         assert success is True
         assert "Stopped container" in msg
 
-    @patch('subprocess.run')
-    def test_remove_container_success(self, mock_run):
+    def test_remove_container_success(self):
         """Test: Can remove Docker container"""
-        mock_run.return_value = Mock(returncode=0)
+        run = _fake_runner(returncode=0)
 
-        tester = DockerTester()
+        tester = DockerTester(runner=run)
         success, msg = tester.remove_container("abc123")
 
         assert success is True
         assert "Removed container" in msg
 
-    @patch('subprocess.run')
-    def test_remove_container_force(self, mock_run):
+    def test_remove_container_force(self):
         """Test: Can force remove Docker container"""
-        mock_run.return_value = Mock(returncode=0)
+        run = _fake_runner(returncode=0)
 
-        tester = DockerTester()
+        tester = DockerTester(runner=run)
         success, msg = tester.remove_container("abc123", force=True)
 
         assert success is True
         # Check that -f flag was used
-        call_args = mock_run.call_args[0][0]
+        call_args = run.calls[-1]
         assert '-f' in call_args
 
-    @patch('subprocess.run')
-    def test_get_container_status(self, mock_run):
+    def test_get_container_status(self):
         """Test: Can get container status"""
-        mock_run.return_value = Mock(
+        run = _fake_runner(
             returncode=0,
             stdout="running\n"
         )
 
-        tester = DockerTester()
+        tester = DockerTester(runner=run)
         status = tester.get_container_status("abc123")
 
         assert status == "running"
 
-    @patch('subprocess.run')
-    def test_get_container_status_not_found(self, mock_run):
+    def test_get_container_status_not_found(self):
         """Test: Returns None for non-existent container"""
-        mock_run.return_value = Mock(returncode=1)
+        run = _fake_runner(returncode=1)
 
-        tester = DockerTester()
+        tester = DockerTester(runner=run)
         status = tester.get_container_status("nonexistent")
 
         assert status is None
@@ -279,71 +324,75 @@ class TestKubernetesTester:
         tester = KubernetesTester()
 
         assert tester is not None
+        assert tester.runner is None
 
-    @patch('subprocess.run')
-    def test_check_kubectl_available_true(self, mock_run):
+    def test_k8s_tester_resolves_subprocess_run_per_call(self, monkeypatch):
+        """Test: subprocess.run patched after construction is still used"""
+        tester = KubernetesTester()
+        run = Mock(return_value=SimpleNamespace(returncode=0, stdout="", stderr=""))
+        monkeypatch.setattr("subprocess.run", run)
+
+        assert tester.check_kubectl_available() is True
+        run.assert_called_once()
+
+    def test_check_kubectl_available_true(self):
         """Test: Detects when kubectl is available"""
-        mock_run.return_value = Mock(returncode=0)
+        run = _fake_runner(returncode=0)
 
-        tester = KubernetesTester()
+        tester = KubernetesTester(runner=run)
         available = tester.check_kubectl_available()
 
         assert available is True
 
-    @patch('subprocess.run')
-    def test_check_kubectl_available_false(self, mock_run):
+    def test_check_kubectl_available_false(self):
         """Test: Detects when kubectl is not available"""
-        mock_run.side_effect = FileNotFoundError()
+        run = _fake_runner(raises=FileNotFoundError())
 
-        tester = KubernetesTester()
+        tester = KubernetesTester(runner=run)
         available = tester.check_kubectl_available()
 
         assert available is False
 
-    @patch('subprocess.run')
-    def test_get_kubectl_version(self, mock_run):
+    def test_get_kubectl_version(self):
         """Test: Can get kubectl version"""
-        mock_run.return_value = Mock(
+        run = _fake_runner(
             returncode=0,
             stdout="Client Version: v1.28.0"
         )
 
-        tester = KubernetesTester()
+        tester = KubernetesTester(runner=run)
         version = tester.get_kubectl_version()
 
         assert version == "Client Version: v1.28.0"
 
-    @patch('subprocess.run')
-    def test_check_cluster_connection_success(self, mock_run):
+    def test_check_cluster_connection_success(self):
         """Test: Can check cluster connection"""
-        mock_run.return_value = Mock(returncode=0)
+        run = _fake_runner(returncode=0)
 
-        tester = KubernetesTester()
+        tester = KubernetesTester(runner=run)
         connected, msg = tester.check_cluster_connection()
 
         assert connected is True
         assert "Connected" in msg
 
-    @patch('subprocess.run')
-    def test_check_cluster_connection_failure(self, mock_run):
+    def test_check_cluster_connection_failure(self):
         """Test: Handles cluster connection failure"""
-        mock_run.return_value = Mock(
+        run = _fake_runner(
             returncode=1,
             stderr="Connection refused"
         )
 
-        tester = KubernetesTester()
+        tester = KubernetesTester(runner=run)
         connected, msg = tester.check_cluster_connection()
 
         assert connected is False
         assert "Connection failed" in msg
 
-    @patch('subprocess.run')
-    def test_create_deployment_success(self, mock_run):
+    def test_create_deployment_success(self):
         """Test: Can create Kubernetes deployment"""
-        mock_run.return_value = Mock(returncode=0)
+        run = _fake_runner(returncode=0)
 
-        tester = KubernetesTester()
+        tester = KubernetesTester(runner=run)
         success, msg = tester.create_deployment(
             name="test-deployment",
             image="nginx:alpine"
@@ -352,15 +401,14 @@ class TestKubernetesTester:
         assert success is True
         assert "Created deployment" in msg
 
-    @patch('subprocess.run')
-    def test_create_deployment_failure(self, mock_run):
+    def test_create_deployment_failure(self):
         """Test: Handles deployment creation failure"""
-        mock_run.return_value = Mock(
+        run = _fake_runner(
             returncode=1,
             stderr="Create error"
         )
 
-        tester = KubernetesTester()
+        tester = KubernetesTester(runner=run)
         success, msg = tester.create_deployment(
             name="test-deployment",
             image="invalid-image"
@@ -369,12 +417,11 @@ class TestKubernetesTester:
         assert success is False
         assert "Create failed" in msg
 
-    @patch('subprocess.run')
-    def test_delete_deployment_success(self, mock_run):
+    def test_delete_deployment_success(self):
         """Test: Can delete Kubernetes deployment"""
-        mock_run.return_value = Mock(returncode=0)
+        run = _fake_runner(returncode=0)
 
-        tester = KubernetesTester()
+        tester = KubernetesTester(runner=run)
         success, msg = tester.delete_deployment("test-deployment")
 
         assert success is True
@@ -392,65 +439,66 @@ class TestContainerEnvironmentBenchmark:
         assert benchmark.docker_tester is not None
         assert benchmark.k8s_tester is not None
 
-    @patch.object(DockerTester, 'check_docker_available')
-    @patch.object(DockerTester, 'get_docker_version')
-    def test_run_docker_tests_available(self, mock_version, mock_available):
-        """Test: Runs Docker tests when available"""
-        mock_available.return_value = True
-        mock_version.return_value = "Docker version 24.0.0"
-
-        benchmark = ContainerEnvironmentBenchmark()
-        results = benchmark.run_docker_tests()
-
-        assert results['docker_available'] is True
-        assert results['docker_version'] == "Docker version 24.0.0"
-
-    @patch.object(DockerTester, 'check_docker_available')
-    def test_run_docker_tests_not_available(self, mock_available):
-        """Test: Handles Docker not available"""
-        mock_available.return_value = False
-
-        benchmark = ContainerEnvironmentBenchmark()
-        results = benchmark.run_docker_tests()
-
-        assert results['docker_available'] is False
-        assert results['docker_version'] is None
-
-    @patch.object(KubernetesTester, 'check_kubectl_available')
-    @patch.object(KubernetesTester, 'get_kubectl_version')
-    def test_run_kubernetes_tests_available(self, mock_version, mock_available):
-        """Test: Runs Kubernetes tests when available"""
-        mock_available.return_value = True
-        mock_version.return_value = "Client Version: v1.28.0"
-
-        benchmark = ContainerEnvironmentBenchmark()
-        results = benchmark.run_kubernetes_tests()
-
-        assert results['kubectl_available'] is True
-        assert results['kubectl_version'] == "Client Version: v1.28.0"
-
-    @patch.object(KubernetesTester, 'check_kubectl_available')
-    def test_run_kubernetes_tests_not_available(self, mock_available):
-        """Test: Handles kubectl not available"""
-        mock_available.return_value = False
-
-        benchmark = ContainerEnvironmentBenchmark()
-        results = benchmark.run_kubernetes_tests()
-
-        assert results['kubectl_available'] is False
-
-    @patch.object(ContainerEnvironmentBenchmark, 'run_docker_tests')
-    @patch.object(ContainerEnvironmentBenchmark, 'run_kubernetes_tests')
-    def test_run_all_tests(self, mock_k8s, mock_docker):
-        """Test: Runs all container tests"""
-        mock_docker.return_value = {'docker_available': True}
-        mock_k8s.return_value = {'kubectl_available': True}
-
-        benchmark = ContainerEnvironmentBenchmark()
-        results = benchmark.run_all_tests()
-
-        assert 'docker' in results
-        assert 'kubernetes' in results
+    def test_benchmark_passes_runner_to_testers(self):
+        """Test: Injected runner is shared by both testers"""
+        run = _fake_runner()
+
+        benchmark = ContainerEnvironmentBenchmark(runner=run)
+
+        assert benchmark.docker_tester.runner is run
+        assert benchmark.k8s_tester.runner is run
+
+    @pytest.mark.parametrize("docker_available,kubectl_available", [
+        (True, True),
+        (True, False),
+        (False, True),
+        (False, False),
+    ])
+    def test_run_all_tests(self, docker_available, kubectl_available):
+        """Test: Runs all container tests and reports availability"""
+        with _patch_testers(docker_available, kubectl_available):
+            results = ContainerEnvironmentBenchmark().run_all_tests()
+
+        docker, kubernetes = results['docker'], results['kubernetes']
+
+        assert docker['docker_available'] is docker_available
+        assert kubernetes['kubectl_available'] is kubectl_available
+        if docker_available:
+            assert docker['docker_version'] == "Docker version 24.0.0"
+            assert [t['test_name'] for t in docker['tests']] == ["Lifecycle"]
+        else:
+            assert docker['docker_version'] is None
+            assert docker['tests'] == []
+        if kubectl_available:
+            assert kubernetes['kubectl_version'] == "Client Version: v1.28.0"
+            assert kubernetes['cluster_connected'] is True
+            assert [t['test_name'] for t in kubernetes['tests']] == ["Deployment"]
+        else:
+            assert kubernetes['kubectl_version'] is None
+            assert kubernetes['cluster_connected'] is False
+            assert kubernetes['tests'] == []
+
+    @pytest.mark.parametrize("docker_available,kubectl_available", [
+        (True, True),
+        (True, False),
+        (False, True),
+        (False, False),
+    ])
+    def test_run_all_tests_skips_unavailable(
+        self, docker_available, kubectl_available
+    ):
+        """Test: Version and workload checks only run when the tool exists"""
+        with _patch_testers(docker_available, kubectl_available) as (
+            docker, k8s
+        ):
+            ContainerEnvironmentBenchmark().run_all_tests()
+
+        docker['check_docker_available'].assert_called_once_with()
+        k8s['check_kubectl_available'].assert_called_once_with()
+        assert docker['get_docker_version'].called is docker_available
+        assert docker['test_container_lifecycle'].called is docker_available
+        assert k8s['get_kubectl_version'].called is kubectl_available
+        assert k8s['test_deployment'].called is kubectl_available
 
 
 class TestContainerTestReporter:
@@ -9,42 +9,81 @@ Tests the integration of:
 
 import pytest
 from pathlib import Path
-
-from src.kernel.build import KernelConfig, build_kernel
-from src.libc.musl import MuslConfig, LinkMode, build_musl
-from src.utilities.busybox import BusyBoxConfig, ImageProfile, build_busybox
+from typing import NamedTuple
+
+from src.kernel.build import KernelBuildResult, KernelConfig, build_kernel
+from src.libc.musl import MuslBuildResult, MuslConfig, LinkMode, build_musl
+from src.utilities.busybox import (
+    BusyBoxBuildResult,
+    BusyBoxConfig,
+    ImageProfile,
+    build_busybox,
+)
 from src.toolchain.cross_compile import Architecture, setup_toolchain
 
 
-@pytest.mark.integration
-@pytest.mark.slow
-def test_kernel_musl_busybox_integration_x86_64(tmp_path):
+class SystemBuild(NamedTuple):
+    """Kernel, musl and BusyBox build results for one system"""
+    kernel_config: KernelConfig
+    kernel: KernelBuildResult
+    musl: MuslBuildResult
+    busybox: BusyBoxBuildResult
+
+
+@pytest.fixture(scope="session")
+def minimal_x86_64_system(tmp_path_factory):
     """
-    Test integration of kernel + musl + BusyBox for x86_64
+    Hardened, reproducible, static minimal x86_64 system.
+
+    Built once per session and shared by tests that only inspect it.
     """
-    # Build kernel
+    output_dir = tmp_path_factory.mktemp("sys_x86_64")
+
     kernel_config = KernelConfig(
         architecture="x86_64",
         enable_hardening=True,
         reproducible=True,
     )
-    kernel_result = build_kernel(kernel_config, tmp_path / "kernel")
+    kernel_result = build_kernel(kernel_config, output_dir / "kernel")
 
-    # Build musl libc
     musl_config = MuslConfig(
         architecture="x86_64",
         link_mode=LinkMode.STATIC,
         enable_security_hardening=True,
     )
-    musl_result = build_musl(musl_config, tmp_path / "musl")
+    musl_result = build_musl(musl_config, output_dir / "musl")
 
-    # Build BusyBox
     busybox_config = BusyBoxConfig(
         profile=ImageProfile.MINIMAL,
         enable_static=True,
         enable_security_hardening=True,
     )
-    busybox_result = build_busybox(busybox_config, tmp_path / "busybox")
+    busybox_result = build_busybox(busybox_config, output_dir / "busybox")
+
+    return SystemBuild(kernel_config, kernel_result, musl_result, busybox_result)
+
+
+@pytest.fixture(scope="session", params=[
+    ImageProfile.MINIMAL,
+    ImageProfile.STANDARD,
+    ImageProfile.EXTENDED,
+], ids=lambda profile: profile.value)
+def profile_system(request, minimal_x86_64_system, tmp_path_factory):
+    """x86_64 system per BusyBox profile; kernel and musl are shared"""
+    busybox_result = build_busybox(
+        BusyBoxConfig(profile=request.param),
+        tmp_path_factory.mktemp(f"busybox_{request.param.value}"),
+    )
+    return minimal_x86_64_system._replace(busybox=busybox_result)
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+def test_kernel_musl_busybox_integration_x86_64(minimal_x86_64_system):
+    """
+    Test integration of kernel + musl + BusyBox for x86_64
+    """
+    kernel_config, kernel_result, musl_result, busybox_result = minimal_x86_64_system
 
     # Verify all components built successfully
     assert kernel_result.kernel_image.exists()
@@ -53,8 +92,8 @@ def test_kernel_musl_busybox_integration_x86_64(tmp_path):
 
     # Verify security features are enabled in all components
     assert kernel_config.enable_hardening
-    assert musl_config.enable_security_hardening
-    assert busybox_config.enable_security_hardening
+    assert musl_result.config.enable_security_hardening
+    assert busybox_result.config.enable_security_hardening
 
     # Calculate total system size
     total_size = (
@@ -162,19 +201,11 @@ def test_cross_architecture_build_consistency(tmp_path):
 
 
 @pytest.mark.integration
-def test_minimal_system_components(tmp_path):
+def test_minimal_system_components(minimal_x86_64_system):
     """
     Test that minimal system has all required components
     """
-    # Build minimal system
-    kernel_config = KernelConfig(architecture="x86_64", reproducible=True)
-    kernel_result = build_kernel(kernel_config, tmp_path / "kernel")
-
-    musl_config = MuslConfig(architecture="x86_64", link_mode=LinkMode.STATIC)
-    musl_result = build_musl(musl_config, tmp_path / "musl")
-
-    busybox_config = BusyBoxConfig(profile=ImageProfile.MINIMAL)
-    busybox_result = build_busybox(busybox_config, tmp_path / "busybox")
+    _, _, musl_result, busybox_result = minimal_x86_64_system
 
     # Verify essential utilities are present
     essential_utils = ["sh", "ls", "cp", "mv", "rm", "mkdir", "cat", "echo"]
@@ -187,27 +218,17 @@ def test_minimal_system_components(tmp_path):
 
 
 @pytest.mark.integration
-def test_security_hardening_consistency(tmp_path):
+def test_security_hardening_consistency(minimal_x86_64_system, tmp_path):
     """
     Test that security hardening is consistent across all components
     """
-    # Build with security hardening enabled
+    _, _, musl_result, busybox_result = minimal_x86_64_system
     kernel_config = KernelConfig(
         architecture="x86_64",
         enable_hardening=True,
     )
-    kernel_result = build_kernel(kernel_config, tmp_path / "kernel")
-
-    musl_config = MuslConfig(
-        architecture="x86_64",
-        enable_security_hardening=True,
-    )
-    musl_result = build_musl(musl_config, tmp_path / "musl")
-
-    busybox_config = BusyBoxConfig(
-        enable_security_hardening=True,
-    )
-    busybox_result = build_busybox(busybox_config, tmp_path / "busybox")
+    musl_config = musl_result.config
+    busybox_config = busybox_result.config
 
     # Verify security features are enabled
     from src.kernel.build import KernelBuilder
@@ -291,24 +312,11 @@ def test_toolchain_integration(tmp_path):
 
 
 @pytest.mark.integration
-@pytest.mark.parametrize("profile", [
-    ImageProfile.MINIMAL,
-    ImageProfile.STANDARD,
-    ImageProfile.EXTENDED,
-])
-def test_different_profiles_integration(profile, tmp_path):
+def test_different_profiles_integration(profile_system):
     """
     Test integration with different BusyBox profiles
     """
-    # Build with different profile
-    kernel_config = KernelConfig(architecture="x86_64", reproducible=True)
-    kernel_result = build_kernel(kernel_config, tmp_path / "kernel")
-
-    musl_config = MuslConfig(architecture="x86_64", link_mode=LinkMode.STATIC)
-    musl_result = build_musl(musl_config, tmp_path / "musl")
-
-    busybox_config = BusyBoxConfig(profile=profile)
-    busybox_result = build_busybox(busybox_config, tmp_path / "busybox")
+    _, kernel_result, musl_result, busybox_result = profile_system
 
     # Verify all components work together
     assert kernel_result.kernel_image.exists()
@@ -320,25 +328,11 @@ def test_different_profiles_integration(profile, tmp_path):
 
 
 @pytest.mark.integration
-def test_static_linking_full_system(tmp_path):
+def test_static_linking_full_system(minimal_x86_64_system):
     """
     Test that full system can be built with static linking
     """
-    # Build everything with static linking
-    kernel_config = KernelConfig(architecture="x86_64")
-    kernel_result = build_kernel(kernel_config, tmp_path / "kernel")
-
-    musl_config = MuslConfig(
-        architecture="x86_64",
-        link_mode=LinkMode.STATIC,
-    )
-    musl_result = build_musl(musl_config, tmp_path / "musl")
-
-    busybox_config = BusyBoxConfig(
-        profile=ImageProfile.MINIMAL,
-        enable_static=True,
-    )
-    busybox_result = build_busybox(busybox_config, tmp_path / "busybox")
+    _, _, musl_result, busybox_result = minimal_x86_64_system
 
     # Verify static library exists
     assert musl_result.static_lib is not None
@@ -346,5 +340,5 @@ def test_static_linking_full_system(tmp_path):
     assert musl_result.dynamic_lib is None
 
     # Verify BusyBox linker flags include -static
-    ldflags = busybox_config.get_ldflags()
+    ldflags = busybox_result.config.get_ldflags()
     assert "-static" in ldflags
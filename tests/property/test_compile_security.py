@@ -8,6 +8,7 @@ Properties tested:
 """
 
 import pytest
+import struct
 import tempfile
 from pathlib import Path
 from hypothesis import given, strategies as st, settings, Verbosity
@@ -266,6 +267,45 @@ class TestBinarySecurityVerification:
         finally:
             temp_path.unlink()
 
+    @settings(max_examples=10)
+    @given(symbol=st.sampled_from([b'__memcpy_chk', b'__read_chk', b'__printf_chk', b'__fgets_chk']))
+    def test_verify_binary_detects_fortified_symbols(self, symbol):
+        """Property Test: Any glibc *_chk symbol marks the binary as fortified"""
+        verifier = BinarySecurityVerifier()
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.elf') as f:
+            f.write(b'\x7fELF\x02\x01\x01' + b'\x00' * 9 + b'\x03\x00' + b'\x00' * 46)
+            f.write(symbol + b'\x00')
+            temp_path = Path(f.name)
+
+        try:
+            assert verifier.verify_binary(temp_path)['fortify'] is True
+        finally:
+            temp_path.unlink()
+
+    @settings(max_examples=10)
+    @given(stack_flags=st.sampled_from([0x6, 0x7]))
+    def test_verify_binary_reads_gnu_stack_program_header(self, stack_flags):
+        """Property Test: NX follows PF_X on a real PT_GNU_STACK header"""
+        verifier = BinarySecurityVerifier()
+
+        # ELF64 LE header with one program header at offset 64
+        ehdr = b'\x7fELF\x02\x01\x01' + b'\x00' * 9
+        ehdr += struct.pack('<HHIQQQIHHHHHH', 3, 62, 1, 0, 64, 0, 0, 64, 56, 1, 0, 0, 0)
+        phdr = struct.pack('<IIQQQQQQ', 0x6474e551, stack_flags, 0, 0, 0, 0, 0, 16)
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.elf') as f:
+            # The section name must not override an executable stack
+            f.write(ehdr + phdr + b'GNU_STACK\x00')
+            temp_path = Path(f.name)
+
+        try:
+            features = verifier.verify_binary(temp_path)
+            assert features['pie'] is True
+            assert features['nx'] is (not stack_flags & 0x1)
+        finally:
+            temp_path.unlink()
+
     def test_verify_non_elf_binary(self):
         """Test: Non-ELF binary returns all false"""
         verifier = BinarySecurityVerifier()
@@ -109,6 +109,43 @@ class TestMemoryUsageConstraint:
         assert usage.used >= 0
         assert usage.free >= 0
 
+    def test_get_system_memory_parses_meminfo(self, tmp_path):
+        """Test: /proc/meminfo fields are parsed into bytes"""
+        (tmp_path / "meminfo").write_text(
+            "MemTotal:        262144 kB\n"
+            "MemFree:          65536 kB\n"
+            "MemAvailable:    131072 kB\n"
+            "Buffers:           8192 kB\n"
+            "Cached:           16384 kB\n"
+            "Active(anon):      1024 kB\n"
+            "SwapTotal:        32768 kB\n"
+            "SwapFree:         16384 kB\n"
+        )
+        monitor = MemoryMonitor()
+        monitor.proc_path = tmp_path
+
+        usage = monitor.get_system_memory()
+
+        assert usage.total == 256 * 1024 * 1024
+        assert usage.available == 128 * 1024 * 1024
+        assert usage.used == (262144 - 65536 - 8192 - 16384) * 1024
+        assert usage.swap_used == 16 * 1024 * 1024
+
+    def test_get_system_memory_snapshot_is_cached(self, tmp_path):
+        """Test: Repeated reads reuse the meminfo snapshot until invalidated"""
+        meminfo = tmp_path / "meminfo"
+        meminfo.write_text("MemTotal:        262144 kB\nMemFree:          65536 kB\n")
+        monitor = MemoryMonitor()
+        monitor.proc_path = tmp_path
+
+        first = monitor.get_system_memory()
+        meminfo.write_text("MemTotal:        524288 kB\nMemFree:          65536 kB\n")
+
+        assert monitor.get_system_memory() is first
+
+        monitor.invalidate()
+        assert monitor.get_system_memory().total == 512 * 1024 * 1024
+
     @settings(verbosity=Verbosity.verbose, max_examples=10)
     @given(
         total=st.integers(min_value=128, max_value=4096),  # MB
@@ -181,6 +218,63 @@ class TestMemoryMonitoring:
         assert isinstance(top_procs, list)
         assert len(top_procs) <= 5
 
+    def test_get_process_memory_parses_status(self, tmp_path):
+        """Test: /proc/<pid>/status name and memory fields are parsed"""
+        (tmp_path / "42").mkdir()
+        (tmp_path / "42" / "status").write_text(
+            "Name:\tsshd\n"
+            "Umask:\t0022\n"
+            "State:\tS (sleeping)\n"
+            "VmSize:\t   20480 kB\n"
+            "VmRSS:\t    4096 kB\n"
+            "RssFile:\t    1024 kB\n"
+            "Threads:\t1\n"
+        )
+        monitor = MemoryMonitor()
+        monitor.proc_path = tmp_path
+
+        proc = monitor.get_process_memory(42)
+
+        assert proc.name == "sshd"
+        assert proc.rss == 4 * 1024 * 1024
+        assert proc.vms == 20 * 1024 * 1024
+        assert proc.shared == 1024 * 1024
+        assert monitor.get_process_memory(43) is None
+
+    def test_get_process_memory_reuses_buffer_cleanly(self, tmp_path):
+        """Test: A short status read does not see a longer previous one"""
+        (tmp_path / "1").mkdir()
+        (tmp_path / "1" / "status").write_text(
+            "Name:\tWeb Content\nVmSize:\t8192 kB\nVmRSS:\t2048 kB\nRssFile:\t512 kB\n"
+        )
+        (tmp_path / "2").mkdir()
+        (tmp_path / "2" / "status").write_text("Name:\tsh\n")
+        monitor = MemoryMonitor()
+        monitor.proc_path = tmp_path
+
+        assert monitor.get_process_memory(1).name == "Web Content"
+        proc = monitor.get_process_memory(2)
+
+        assert proc.name == "sh"
+        assert proc.rss == 0
+        assert proc.shared == 0
+
+    def test_get_top_memory_processes_large_sweep(self, tmp_path):
+        """Test: Large /proc sweeps return the same top processes"""
+        for pid in range(1, 101):
+            (tmp_path / str(pid)).mkdir()
+            (tmp_path / str(pid) / "status").write_text(
+                f"Name:\tproc{pid}\nVmSize:\t{pid * 200} kB\nVmRSS:\t{pid * 100} kB\n"
+            )
+        (tmp_path / "self").mkdir()
+        monitor = MemoryMonitor()
+        monitor.proc_path = tmp_path
+
+        top = monitor.get_top_memory_processes(3)
+
+        assert [p.pid for p in top] == [100, 99, 98]
+        assert top[0].name == "proc100"
+
     def test_memory_usage_serialization(self):
         """Test: Memory usage can be serialized to dict"""
         usage = MemoryUsage(
@@ -226,6 +320,20 @@ class TestMemoryOptimization:
         assert result is True
         assert "test-optimization" in optimizer.optimizations_applied
 
+    def test_suggestions_cached_until_invalidated(self):
+        """Test: Suggestions are reused within the TTL and dropped on apply"""
+        optimizer = MemoryOptimizer()
+        calls = []
+        optimizer._compute_suggestions = lambda: calls.append(1) or ["s"]
+
+        assert optimizer.suggest_optimizations() == ["s"]
+        assert optimizer.suggest_optimizations() == ["s"]
+        assert len(calls) == 1
+
+        optimizer.apply_optimization("s")
+        optimizer.suggest_optimizations()
+        assert len(calls) == 2
+
     def test_get_optimization_status(self):
         """Test: Can get optimization status"""
         optimizer = MemoryOptimizer()
@@ -354,6 +462,44 @@ class TestResourceLimiting:
         else:
             assert exceeded is False
 
+    def test_enforce_limits_reports_only_limited_processes(self):
+        """Test: enforce_limits reports processes over their own limit"""
+        limiter = ResourceLimiter()
+        limiter.set_memory_limit("big", 50)
+        limiter.set_memory_limit("small", 100)
+
+        mb = 1024 * 1024
+        procs = [
+            ProcessMemory(pid=1, name="big", rss=60 * mb, vms=60 * mb),
+            ProcessMemory(pid=2, name="small", rss=60 * mb, vms=60 * mb),
+            ProcessMemory(pid=3, name="unlimited", rss=900 * mb, vms=900 * mb),
+        ]
+
+        class FakeMonitor:
+            def get_top_memory_processes(self, limit):
+                return procs
+
+        actions = limiter.enforce_limits(FakeMonitor())
+
+        assert actions == ["Process big (PID 1) exceeds limit"]
+
+    def test_enforce_limits_reads_current_limits(self):
+        """Test: enforce_limits honours limits written directly to limits"""
+        limiter = ResourceLimiter()
+        limiter.set_memory_limit("big", 100)
+        limiter.limits["big"]["memory_mb"] = 50
+        limiter.limits["other"] = {}
+
+        mb = 1024 * 1024
+        procs = [ProcessMemory(pid=1, name="big", rss=60 * mb, vms=60 * mb),
+                 ProcessMemory(pid=2, name="other", rss=60 * mb, vms=60 * mb)]
+
+        class FakeMonitor:
+            def get_top_memory_processes(self, limit):
+                return procs
+
+        assert limiter.enforce_limits(FakeMonitor()) == ["Process big (PID 1) exceeds limit"]
+
 
 @pytest.mark.property
 class TestMemoryManager:
@@ -411,6 +557,27 @@ class TestMemoryManager:
         assert 'top_processes' in status
         assert isinstance(status['top_processes'], list)
 
+    def test_status_copies_are_independent(self):
+        """Test: Mutating a returned status does not alter later results"""
+        manager = MemoryManager()
+
+        status = manager.get_status()
+        status['system_memory'].clear()
+        status['top_processes'].append({'name': 'bogus'})
+
+        fresh = manager.get_status()
+        assert fresh['system_memory']
+        assert {'name': 'bogus'} not in fresh['top_processes']
+
+    def test_status_follows_memory_limit_change(self):
+        """Test: Changing the memory limit invalidates the cached status"""
+        manager = MemoryManager()
+        manager.get_status()
+
+        manager.monitor.memory_limit_mb = 1
+
+        assert manager.get_status()['limit_mb'] == 1
+
 
 @pytest.mark.property
 class TestMemoryUnits:
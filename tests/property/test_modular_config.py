@@ -8,6 +8,7 @@ Properties tested:
 - Property 10: コンポーネント動的管理 (Dynamic Component Management) - 要件 3.2
 """
 
+import os
 import pytest
 import tempfile
 from pathlib import Path
@@ -98,6 +99,42 @@ class TestKernelModuleSelectionFlexibility:
         assert "base" in names
         assert "network" in names
 
+    def test_module_selection_is_dependency_ordered(self):
+        """Test: Selected modules come after their dependencies, deterministically"""
+        manager = KernelModuleManager()
+        manager.register_module(KernelModule(name="netfilter", category="network",
+                                             dependencies=["network", "crypto"]))
+        manager.register_module(KernelModule(name="network", category="network",
+                                             dependencies=["base"]))
+        manager.register_module(KernelModule(name="crypto", category="security",
+                                             dependencies=["base"]))
+        manager.register_module(KernelModule(name="base", category="core"))
+
+        names = [m.name for m in manager.select_modules(["netfilter"])]
+
+        assert names[0] == "base"
+        assert names[-1] == "netfilter"
+        assert set(names) == {"base", "network", "crypto", "netfilter"}
+        assert [m.name for m in manager.select_modules(["netfilter"])] == names
+
+    def test_module_dependencies_are_frozen(self):
+        """Test: Dependencies/conflicts are frozensets, serialized sorted"""
+        module = KernelModule(name="nf", category="network",
+                              dependencies=["network", "crypto"], conflicts=("legacy",))
+
+        assert module.dependencies == frozenset({"network", "crypto"})
+        assert "legacy" in module.conflicts
+        assert module.to_dict()["dependencies"] == ["crypto", "network"]
+
+    def test_empty_dependencies_share_one_frozenset(self):
+        """Test: Empty dependency/conflict sets do not allocate per instance"""
+        a = KernelModule(name="a", category="core")
+        b = KernelModule.from_dict({"name": "b", "category": "core",
+                                    "conflicts": [], "dependencies": []})
+
+        assert a.conflicts is a.dependencies is b.conflicts is b.dependencies
+        assert b.to_dict()["conflicts"] == []
+
     def test_module_conflict_detection(self):
         """Test: Module conflicts are detected"""
         manager = KernelModuleManager()
@@ -201,6 +238,40 @@ class TestDynamicComponentManagement:
         with pytest.raises(ValueError, match="depends on it"):
             manager.remove_component("base")
 
+        # Once the dependent is gone, base can be disabled and removed
+        manager.remove_component("network")
+        manager.disable_component("base")
+        assert manager.remove_component("base") is True
+
+    def test_one_sided_conflict_detected_in_both_orders(self):
+        """Test: A conflict declared by only one component blocks either order"""
+        for first, second in (("a", "b"), ("b", "a")):
+            manager = ComponentManager()
+            manager.add_component(SystemComponent(
+                name=first, category=ComponentCategory.CORE,
+                conflicts=["b"] if first == "a" else []))
+
+            with pytest.raises(ValueError, match="conflicts"):
+                manager.add_component(SystemComponent(
+                    name=second, category=ComponentCategory.CORE,
+                    conflicts=["b"] if second == "a" else []))
+
+    def test_removed_component_no_longer_conflicts(self):
+        """Test: Conflicts declared by a removed component stop applying"""
+        manager = ComponentManager()
+        manager.add_component(SystemComponent(
+            name="dropbear", category=ComponentCategory.NETWORK, conflicts=["openssh"]))
+
+        with pytest.raises(ValueError, match="conflicts with dropbear"):
+            manager.add_component(SystemComponent(
+                name="openssh", category=ComponentCategory.NETWORK))
+
+        manager.remove_component("dropbear")
+        manager.add_component(SystemComponent(
+            name="openssh", category=ComponentCategory.NETWORK))
+
+        assert "openssh" in manager.components
+
     def test_component_conflict_detection(self):
         """Test: Component conflicts are detected"""
         manager = ComponentManager()
@@ -265,6 +336,51 @@ class TestSystemConfigIntegration:
         assert len(restored.kernel_modules) == 1
         assert len(restored.components) == 1
 
+    def test_cached_parse_returns_independent_configs(self):
+        """Test: Repeated parses of the same text do not share mutable state"""
+        config = SystemConfig(
+            architecture="x86_64",
+            security_level=SecurityLevel.STANDARD,
+            kernel_modules=[
+                KernelModule(name="ext4", category="fs", dependencies=["block"])
+            ],
+            custom_settings={"hostname": "kimigayo"}
+        )
+        yaml_str = config.to_yaml()
+
+        first = SystemConfig.from_yaml(yaml_str)
+        first.kernel_modules[0].dependencies = frozenset({"block", "crc32"})
+        first.custom_settings["hostname"] = "changed"
+
+        second = SystemConfig.from_yaml(yaml_str)
+        assert second.kernel_modules[0].dependencies == frozenset({"block"})
+        assert second.custom_settings == {"hostname": "kimigayo"}
+
+    def test_to_json_matches_stdlib_encoding(self):
+        """Test: to_json output is byte-identical to the stdlib encoding"""
+        import json
+
+        config = SystemConfig(
+            architecture="aarch64",
+            security_level=SecurityLevel.HIGH,
+            kernel_modules=[KernelModule(name="nf", category="network",
+                                         dependencies=["base"])],
+            custom_settings={"hostname": "kimigayo", "motd": "君が代"}
+        )
+
+        text = config.to_json()
+
+        assert text == json.dumps(config.to_dict(), indent=2, sort_keys=True)
+        assert text.startswith('{\n  "architecture"')
+
+        # Floats and very large integers keep the stdlib spelling too
+        config.custom_settings = {"ratio": 1e16, "nan": float("nan"), "big": 2 ** 70}
+        assert config.to_json() == json.dumps(config.to_dict(), indent=2, sort_keys=True)
+
+        # Non-string keys are not supported by every encoder
+        config.custom_settings = {1: "one"}
+        assert json.loads(config.to_json())["custom_settings"] == {"1": "one"}
+
     def test_system_config_manager_save_load(self):
         """Test: SystemConfigManager can save and load configurations"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -283,6 +399,70 @@ class TestSystemConfigIntegration:
 
             assert manager2.kernel_manager.get_module("test") is not None
 
+    def test_save_config_skips_unchanged_writes(self):
+        """Test: Repeated saves of identical content do not rewrite the file"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "system.yaml"
+            manager = SystemConfigManager()
+
+            manager.save_config(config_path)
+            first_mtime = config_path.stat().st_mtime_ns
+            manager.save_config(config_path)
+            assert config_path.stat().st_mtime_ns == first_mtime
+
+            # Edits made outside the manager are overwritten again
+            config_path.write_text("edited: true\n")
+            manager.save_config(config_path)
+            assert "edited" not in config_path.read_text()
+
+            # A different destination is always written
+            other_path = Path(tmpdir) / "other.yaml"
+            manager.save_config(other_path)
+            assert other_path.read_text() == config_path.read_text()
+
+    def test_system_config_manager_rejects_unknown_format(self):
+        """Test: save_config/load_config reject unsupported formats"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "system.toml"
+            manager = SystemConfigManager()
+
+            with pytest.raises(ValueError):
+                manager.save_config(config_path, format="toml")
+            assert not config_path.exists()
+
+            with pytest.raises(ValueError):
+                manager.load_config(config_path, format="toml")
+
+    def test_yaml_load_writes_nothing_and_follows_edits(self):
+        """Test: Loading YAML leaves the directory untouched and sees edits"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "system.yaml"
+
+            manager = SystemConfigManager(SystemConfig(
+                architecture="x86_64",
+                security_level=SecurityLevel.STANDARD
+            ))
+            manager.save_config(config_path, format="yaml")
+
+            SystemConfigManager().load_config(config_path)
+            assert list(Path(tmpdir).iterdir()) == [config_path]
+
+            # An edit that changes the size is picked up by the stat key
+            config_path.write_text(config_path.read_text().replace("x86_64", "aarch64"))
+
+            manager2 = SystemConfigManager()
+            manager2.load_config(config_path)
+            assert manager2.config.architecture == "aarch64"
+
+            # So is a same-size edit, through the newer mtime
+            mtime_ns = config_path.stat().st_mtime_ns
+            config_path.write_text(config_path.read_text().replace("aarch64", "riscv64"))
+            os.utime(config_path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+            manager3 = SystemConfigManager()
+            manager3.load_config(config_path)
+            assert manager3.config.architecture == "riscv64"
+
     @settings(verbosity=Verbosity.verbose, max_examples=5)
     @given(
         arch=st.sampled_from(["x86_64", "aarch64", "armv7"]),
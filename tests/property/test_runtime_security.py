@@ -8,6 +8,7 @@ Properties tested:
 """
 
 import pytest
+import struct
 import tempfile
 from pathlib import Path
 from hypothesis import given, strategies as st, settings, Verbosity
@@ -194,6 +195,24 @@ class TestRuntimeSecurityEnforcement:
         # Should return a boolean
         assert isinstance(stack_nx, bool)
 
+    @settings(max_examples=10)
+    @given(perms=st.sampled_from(["rw-p", "rwxp"]))
+    def test_process_stack_nx_reads_stack_permissions(self, perms):
+        """Property Test: Stack NX follows the [stack] mapping permissions"""
+        with tempfile.TemporaryDirectory() as tmp:
+            proc = Path(tmp)
+            (proc / "42").mkdir()
+            (proc / "42" / "maps").write_text(
+                "55d0c0a00000-55d0c0a21000 r-xp 00000000 08:01 1234 /bin/app\n"
+                f"7ffd1c6e0000-7ffd1c701000 {perms} 00000000 00:00 0          [stack]\n"
+                "7ffd1c7f2000-7ffd1c7f6000 r--p 00000000 00:00 0          [vvar]\n"
+            )
+
+            checker = ProcessSecurityChecker()
+            checker.proc_path = proc
+
+            assert checker.check_process_stack_nx(42) == ('x' not in perms)
+
     def test_process_security_info(self):
         """Test: Can get comprehensive security info for process"""
         import os
@@ -211,6 +230,13 @@ class TestRuntimeSecurityEnforcement:
         manager = SecurityPolicyManager()
         assert manager is not None
 
+    def test_policy_managers_share_default_enforcer(self):
+        """Test: Managers without an explicit enforcer share one instance"""
+        assert SecurityPolicyManager().enforcer is SecurityPolicyManager().enforcer
+
+        enforcer = RuntimeSecurityEnforcer()
+        assert SecurityPolicyManager(enforcer).enforcer is enforcer
+
     def test_policy_application(self):
         """
         Test: Security policy can be applied
@@ -335,6 +361,27 @@ class TestDEPEnforcement:
         finally:
             temp_path.unlink()
 
+    @settings(max_examples=10)
+    @given(stack_flags=st.sampled_from([0x6, 0x7]))
+    def test_binary_nx_follows_gnu_stack_header(self, stack_flags):
+        """Property Test: NX follows PF_X even when GNU_STACK text is present"""
+        enforcer = RuntimeSecurityEnforcer()
+
+        # ELF64 LE header with one PT_GNU_STACK program header at offset 64
+        ehdr = b'\x7fELF\x02\x01\x01' + b'\x00' * 9
+        ehdr += struct.pack('<HHIQQQIHHHHHH', 2, 62, 1, 0, 64, 0, 0, 64, 56, 1, 0, 0, 0)
+        phdr = struct.pack('<IIQQQQQQ', 0x6474e551, stack_flags, 0, 0, 0, 0, 0, 16)
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.elf') as f:
+            f.write(ehdr + phdr + b'GNU_STACK\x00')
+            temp_path = Path(f.name)
+
+        try:
+            features = enforcer.check_binary_security(temp_path)
+            assert features['nx'] is (not stack_flags & 0x1)
+        finally:
+            temp_path.unlink()
+
 
 @pytest.mark.property
 class TestSecurityStatusReporting:
@@ -372,6 +419,19 @@ class TestSecurityStatusReporting:
         assert hasattr(status, 'kernel_version')
         assert isinstance(status.kernel_version, str)
 
+    def test_kernel_version_parsed_and_cached(self, tmp_path):
+        """Test: Kernel release is read from /proc/version once"""
+        version_file = tmp_path / "version"
+        version_file.write_text("Linux version 6.6.8-kimigayo (gcc 13.2.0) #1 SMP\n")
+
+        enforcer = RuntimeSecurityEnforcer()
+        enforcer.proc_path = tmp_path
+
+        assert enforcer._get_kernel_version() == "6.6.8-kimigayo"
+
+        version_file.write_text("Linux version 9.9.9 (gcc) #1\n")
+        assert enforcer._get_kernel_version() == "6.6.8-kimigayo"
+
     @settings(verbosity=Verbosity.verbose, max_examples=5)
     @given(seed=st.integers(min_value=0, max_value=1000))
     def test_status_consistency(self, seed):
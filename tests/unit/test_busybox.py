@@ -2,6 +2,8 @@
 Unit tests for BusyBox configuration and build system
 """
 
+import hashlib
+
 import pytest
 from pathlib import Path
 
@@ -14,6 +16,8 @@ from src.utilities.busybox import (
     ESSENTIAL_UTILITIES,
     OPTIONAL_UTILITIES,
     build_busybox,
+    build_busybox_many,
+    _mock_chunks,
 )
 
 
@@ -50,6 +54,7 @@ def test_busybox_utility_creation():
     assert util.essential is True
     assert util.description == "Test utility"
     assert util.size_bytes == 1000
+    assert util.name_upper == "TEST"
 
 
 def test_busybox_utility_equality():
@@ -62,6 +67,15 @@ def test_busybox_utility_equality():
     assert util1 != util3  # Different name
 
 
+def test_busybox_utility_is_immutable():
+    """Test that utilities cannot be modified after creation"""
+    util = BusyBoxUtility("test", UtilityCategory.CORE)
+
+    with pytest.raises(AttributeError):
+        util.size_bytes = 1
+    assert not hasattr(util, "__dict__")
+
+
 def test_essential_utilities_defined():
     """Test that essential utilities are defined"""
     assert len(ESSENTIAL_UTILITIES) > 0
@@ -160,6 +174,46 @@ def test_busybox_config_remove_utility():
     assert optional not in config.utilities
 
 
+def test_busybox_config_profiles_do_not_share_utilities():
+    """Test that mutating one config leaves other configs untouched"""
+    first = BusyBoxConfig(profile=ImageProfile.EXTENDED)
+    second = BusyBoxConfig(profile=ImageProfile.EXTENDED)
+
+    optional = next(u for u in first.utilities if not u.essential)
+    first.remove_utility(optional)
+
+    assert optional in second.utilities
+    assert optional in BusyBoxConfig(profile=ImageProfile.EXTENDED).utilities
+
+
+def test_busybox_config_utility_names_track_changes():
+    """Test that utility names follow add/remove"""
+    config = BusyBoxConfig(profile=ImageProfile.MINIMAL)
+    optional = OPTIONAL_UTILITIES[0]
+
+    names = config.get_utility_names()
+    assert names == sorted(names)
+    assert optional.name not in names
+
+    config.add_utility(optional)
+    assert optional.name in config.get_utility_names()
+
+    config.remove_utility(optional)
+    assert config.get_utility_names() == names
+
+
+def test_busybox_config_utility_names_follow_direct_set_changes(tmp_path):
+    """Test that names reflect changes made to the utilities set directly"""
+    config = BusyBoxConfig(profile=ImageProfile.MINIMAL)
+    result = build_busybox(config, tmp_path)
+    optional = OPTIONAL_UTILITIES[0]
+
+    config.utilities.add(optional)
+
+    assert optional.name in config.get_utility_names()
+    assert not result.verify_utilities()
+
+
 def test_busybox_config_cannot_remove_essential():
     """Test that essential utilities cannot be removed"""
     config = BusyBoxConfig()
@@ -210,6 +264,18 @@ def test_busybox_config_get_ldflags():
     assert "-Wl,-z,now" in ldflags
 
 
+def test_busybox_config_flags_are_fresh_lists():
+    """Test that callers cannot corrupt the memoized flags"""
+    config = BusyBoxConfig(custom_cflags=["-g"])
+
+    config.get_cflags().append("-bogus")
+    config.get_ldflags().append("-bogus")
+
+    assert "-bogus" not in config.get_cflags()
+    assert "-bogus" not in config.get_ldflags()
+    assert config.get_cflags()[0] == "-g"
+
+
 def test_busybox_config_estimated_size():
     """Test size estimation"""
     config = BusyBoxConfig(profile=ImageProfile.MINIMAL)
@@ -235,6 +301,18 @@ def test_busybox_builder_initialization(tmp_path):
     assert builder.output_dir.exists()
 
 
+def test_busybox_builder_recreates_deleted_output_dir(tmp_path):
+    """Test that a deleted output directory is created again on reuse"""
+    output_dir = tmp_path / "nested" / "out"
+    BusyBoxBuilder(BusyBoxConfig(), output_dir)
+    output_dir.rmdir()
+
+    result = BusyBoxBuilder(BusyBoxConfig(), str(output_dir)).build()
+
+    assert result.binary_path == output_dir / "busybox"
+    assert result.binary_path.exists()
+
+
 def test_busybox_builder_generate_config_file(tmp_path):
     """Test configuration file generation"""
     config = BusyBoxConfig(profile=ImageProfile.MINIMAL)
@@ -249,6 +327,16 @@ def test_busybox_builder_generate_config_file(tmp_path):
     assert "Kimigayo OS BusyBox Configuration" in content
 
 
+def test_busybox_builder_config_tracks_profile_change(tmp_path):
+    """Test that the generated config reflects a profile changed later"""
+    config = BusyBoxConfig(profile=ImageProfile.MINIMAL)
+    builder = BusyBoxBuilder(config, tmp_path)
+
+    config.profile = ImageProfile.EXTENDED
+
+    assert "# Profile: extended" in builder.generate_config_file().read_text()
+
+
 def test_busybox_builder_build(tmp_path):
     """Test BusyBox build"""
     config = BusyBoxConfig(profile=ImageProfile.MINIMAL)
@@ -273,6 +361,22 @@ def test_busybox_builder_list_utilities(tmp_path):
     assert "core" in by_category or "shell" in by_category
 
 
+def test_busybox_builder_list_utilities_is_independent(tmp_path):
+    """Test that modifying a listing does not affect later listings"""
+    builder = BusyBoxBuilder(BusyBoxConfig(), tmp_path)
+
+    first = builder.list_available_utilities()
+    total = sum(len(utils) for utils in first.values())
+    assert total == len(ESSENTIAL_UTILITIES) + len(OPTIONAL_UTILITIES)
+
+    first["core"].clear()
+    first.pop("shell")
+
+    second = builder.list_available_utilities()
+    assert second["core"]
+    assert "shell" in second
+
+
 def test_busybox_build_result_verify_checksum(tmp_path):
     """Test build result checksum verification"""
     config = BusyBoxConfig()
@@ -285,6 +389,82 @@ def test_busybox_build_result_verify_checksum(tmp_path):
     assert not result.verify_checksum("invalid")
 
 
+def test_busybox_build_checksum_matches_binary(tmp_path):
+    """Test that the checksum computed in memory matches the written binary"""
+    config = BusyBoxConfig()
+    builder = BusyBoxBuilder(config, tmp_path)
+    result = builder.build()
+
+    assert result.checksum == builder._calculate_checksum(result.binary_path)
+
+
+@pytest.mark.parametrize("size", [0, 1, 7, 65533, 65534, 65535, 200_001])
+def test_mock_chunks_repeat_pattern(size):
+    """Test that chunked mock data matches the contiguous pattern"""
+    data = b"".join(_mock_chunks(size))
+    assert data == (b"BUSYBOX" * (size // 7 + 1))[:size]
+
+
+@pytest.mark.parametrize("size", [0, 100, 64 * 1024, 300_000])
+def test_calculate_checksum_matches_sha256(tmp_path, size):
+    """Test file checksums for empty, small and multi-block files"""
+    data = bytes(range(256)) * (size // 256 + 1)
+    path = tmp_path / "blob"
+    path.write_bytes(data[:size])
+
+    builder = BusyBoxBuilder(BusyBoxConfig(), tmp_path)
+    assert builder._calculate_checksum(path) == hashlib.sha256(data[:size]).hexdigest()
+
+
+def test_busybox_build_checksum_algo(tmp_path):
+    """Test selecting BLAKE2b-256 for build checksums"""
+    config = BusyBoxConfig(checksum_algo="blake2b")
+    builder = BusyBoxBuilder(config, tmp_path)
+    result = builder.build()
+
+    expected = hashlib.blake2b(result.binary_path.read_bytes(), digest_size=32)
+    assert result.checksum == expected.hexdigest()
+    assert result.checksum == builder._calculate_checksum(result.binary_path)
+    assert BusyBoxConfig().checksum_algo == "sha256"
+
+
+def test_busybox_rebuild_reuses_hashed_prefix(tmp_path):
+    """Test that rebuilds of different sizes keep correct checksums"""
+    config = BusyBoxConfig(profile=ImageProfile.MINIMAL)
+    builder = BusyBoxBuilder(config, tmp_path)
+
+    for utility in [None, *OPTIONAL_UTILITIES[:3]]:
+        if utility is not None:
+            config.add_utility(utility)
+        result = builder.build()
+        assert result.checksum == builder._calculate_checksum(result.binary_path)
+
+    # Shrinking the image must not reuse a longer prefix
+    for utility in OPTIONAL_UTILITIES[:3]:
+        config.remove_utility(utility)
+    result = builder.build()
+    assert result.checksum == builder._calculate_checksum(result.binary_path)
+
+
+def test_busybox_update_checksum_leaves_context_intact():
+    """Test that update_checksum does not modify the original context"""
+    base = hashlib.sha256(b"BUSYBOX")
+    extended = BusyBoxBuilder.update_checksum(base, b"tail")
+
+    assert base.hexdigest() == hashlib.sha256(b"BUSYBOX").hexdigest()
+    assert extended.hexdigest() == hashlib.sha256(b"BUSYBOXtail").hexdigest()
+
+
+def test_busybox_build_writes_full_pattern(tmp_path):
+    """Test that the chunked writer produces the exact mock image"""
+    config = BusyBoxConfig(profile=ImageProfile.EXTENDED)
+    result = build_busybox(config, tmp_path)
+
+    size = config.get_estimated_size()
+    assert size > 2 * 65536  # spans several chunks plus a partial tail
+    assert result.binary_path.read_bytes() == (b"BUSYBOX" * (size // 7 + 1))[:size]
+
+
 def test_busybox_build_result_verify_utilities(tmp_path):
     """Test build result utilities verification"""
     config = BusyBoxConfig()
@@ -293,6 +473,10 @@ def test_busybox_build_result_verify_utilities(tmp_path):
     # Should verify successfully
     assert result.verify_utilities()
 
+    # Should notice a configuration change after the build
+    config.add_utility(OPTIONAL_UTILITIES[0])
+    assert not result.verify_utilities()
+
 
 def test_build_busybox_function(tmp_path):
     """Test build_busybox helper function"""
@@ -303,6 +487,23 @@ def test_build_busybox_function(tmp_path):
     assert result.config == config
 
 
+def test_build_busybox_many(tmp_path):
+    """Test building several profiles in parallel"""
+    items = [
+        (BusyBoxConfig(profile=profile), tmp_path / profile.value)
+        for profile in ImageProfile
+    ]
+
+    results = build_busybox_many(items, max_workers=2)
+
+    assert len(results) == len(items)
+    for (config, output_dir), result in zip(items, results):
+        expected = build_busybox(config, tmp_path / "serial" / output_dir.name)
+        assert result.binary_path == output_dir / "busybox"
+        assert result.checksum == expected.checksum
+        assert result.utilities == config.get_utility_names()
+
+
 def test_busybox_config_custom_cflags(tmp_path):
     """Test custom CFLAGS"""
     custom_flags = ["-O3", "-march=native"]
@@ -2,6 +2,8 @@
 Unit tests for cross-compilation environment
 """
 
+import subprocess
+
 import pytest
 from pathlib import Path
 
@@ -115,6 +117,19 @@ def test_cross_compile_config_custom_flags():
     assert "-Wl,-z,relro" in config.ldflags
 
 
+def test_security_flags_not_duplicated():
+    """Test that security flags already given are kept once, in order"""
+    config = CrossCompileConfig(
+        target_arch=Architecture.X86_64,
+        cflags=["-O2", "-fPIE"],
+        ldflags=["-Wl,-z,now"],
+    )
+
+    assert config.cflags[:2] == ["-O2", "-fPIE"]
+    assert config.cflags.count("-fPIE") == 1
+    assert config.ldflags == ["-Wl,-z,now", "-Wl,-z,relro", "-Wl,-z,noexecstack"]
+
+
 def test_cross_compile_config_environment_x86_64():
     """Test environment variables for x86_64"""
     config = CrossCompileConfig(target_arch=Architecture.X86_64)
@@ -258,3 +273,107 @@ def test_environment_contains_all_tools():
     for tool in required_tools:
         assert tool in env, f"{tool} not in environment"
         assert env[tool].startswith("x86_64-linux-musl-")
+
+
+def test_cc_version_runs_once_per_compiler(tmp_path, fake_subprocess_run):
+    """Test that verify_toolchain and get_toolchain_info share one --version run"""
+    fake_subprocess_run.stdout = "musl-gcc 12.2.0\nCopyright\n"
+    compiler = CrossCompiler(CrossCompileConfig(target_arch=Architecture.X86_64), tmp_path)
+
+    assert compiler.verify_toolchain()
+    assert compiler.get_toolchain_info()["version"] == "musl-gcc 12.2.0"
+    assert fake_subprocess_run.calls == [["x86_64-linux-musl-gcc", "--version"]]
+
+
+def test_compile_test_program_is_memoized(tmp_path, fake_subprocess_run):
+    """Test that an identical test program is compiled only once"""
+    calls = fake_subprocess_run.calls
+    compiler = CrossCompiler(CrossCompileConfig(target_arch=Architecture.X86_64), tmp_path)
+
+    assert compiler.compile_test_program("int main(void) { return 0; }")
+    assert compiler.compile_test_program("int main(void) { return 0; }")
+    assert len(calls) == 1
+
+    # Changing the flags compiles again
+    compiler.config.cflags.append("-O2")
+    assert compiler.compile_test_program("int main(void) { return 0; }")
+    assert len(calls) == 2
+
+
+def test_failed_probe_is_retried(tmp_path, fake_subprocess_run):
+    """Test that a missing compiler is probed again once installed"""
+    compiler = CrossCompiler(CrossCompileConfig(target_arch=Architecture.X86_64), tmp_path)
+
+    fake_subprocess_run.raises = FileNotFoundError()
+    assert compiler.verify_toolchain() is False
+
+    fake_subprocess_run.raises = None
+    assert compiler.verify_toolchain() is True
+    assert compiler.verify_toolchain() is True
+    assert len(fake_subprocess_run.calls) == 2
+
+
+def test_failed_compile_is_retried(tmp_path, fake_subprocess_run):
+    """Test that a failed compile, e.g. a timeout, is not remembered"""
+    compiler = CrossCompiler(CrossCompileConfig(target_arch=Architecture.X86_64), tmp_path)
+
+    fake_subprocess_run.raises = subprocess.TimeoutExpired("cc", 30)
+    assert compiler.compile_test_program("int main(void) { return 0; }") is False
+
+    fake_subprocess_run.raises = None
+    assert compiler.compile_test_program("int main(void) { return 0; }") is True
+    assert len(fake_subprocess_run.calls) == 2
+
+
+def test_environment_cached_until_flags_change():
+    """Test that the merged environment is reused until the config changes"""
+    config = CrossCompileConfig(target_arch=Architecture.X86_64)
+
+    first = config.get_environment()
+    assert config.get_environment() is first
+    with pytest.raises(TypeError):
+        first["CC"] = "poisoned"
+
+    config.cflags.append("-Os")
+    updated = config.get_environment()
+    assert updated is not first
+    assert updated["CFLAGS"].endswith("-Os")
+
+
+def test_environment_overrides_are_fresh_dicts():
+    """Test that mutating returned overrides does not affect later calls"""
+    config = CrossCompileConfig(target_arch=Architecture.X86_64)
+
+    overrides = config.get_environment_overrides()
+    overrides["CC"] = "poisoned"
+
+    assert config.get_environment_overrides()["CC"] == "x86_64-linux-musl-gcc"
+    assert config.get_environment()["CC"] == "x86_64-linux-musl-gcc"
+
+
+@pytest.mark.parametrize("triple,expected", [
+    ("x86_64-linux-musl\n", "musl"),
+    ("aarch64-linux-gnu\n", "glibc"),
+    ("arm-none-eabi\n", None),
+])
+def test_get_libc_version_from_target_triple(tmp_path, fake_subprocess_run, triple, expected):
+    """Test that the libc is read from `cc -dumpmachine` without compiling"""
+    fake_subprocess_run.stdout = triple
+    compiler = CrossCompiler(CrossCompileConfig(target_arch=Architecture.X86_64), tmp_path)
+
+    assert compiler.get_libc_version() == expected
+    assert compiler.get_libc_version() == expected
+    assert fake_subprocess_run.calls == [["x86_64-linux-musl-gcc", "-dumpmachine"]]
+
+
+def test_compile_test_program_cleans_up_when_compiler_missing(tmp_path):
+    """Test that the test source is removed even if the compiler cannot run"""
+    config = CrossCompileConfig(
+        target_arch=Architecture.X86_64,
+        toolchain=ToolchainConfig(architecture=Architecture.X86_64,
+                                  toolchain_prefix="kimigayo-missing"),
+    )
+    compiler = CrossCompiler(config, tmp_path)
+
+    assert compiler.compile_test_program("int main(void) { return 0; }") is False
+    assert list(tmp_path.iterdir()) == []
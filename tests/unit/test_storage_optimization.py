@@ -115,6 +115,64 @@ class TestStorageMonitor:
         assert isinstance(usage, StorageUsage)
         assert usage.total >= 0
 
+    def test_get_storage_usage_is_cached_until_refresh(self, monkeypatch):
+        """Test: Repeated queries reuse the last statvfs result until refresh()"""
+        import os
+        calls = []
+        real_statvfs = os.statvfs
+
+        def counting_statvfs(path):
+            calls.append(path)
+            return real_statvfs(path)
+
+        monkeypatch.setattr(os, "statvfs", counting_statvfs)
+        monitor = StorageMonitor()
+
+        first = monitor.get_storage_usage("/")
+        assert monitor.get_storage_usage("/") is first
+        assert calls == ["/"]
+
+        monitor.refresh()
+        monitor.get_storage_usage("/")
+        assert calls == ["/", "/"]
+
+    def test_missing_mount_is_negatively_cached(self, tmp_path, monkeypatch):
+        """Test: Failed lookups are cached until invalidate(path)"""
+        import os
+        calls = []
+        real_statvfs = os.statvfs
+
+        def counting_statvfs(path):
+            calls.append(path)
+            return real_statvfs(path)
+
+        monkeypatch.setattr(os, "statvfs", counting_statvfs)
+        monitor = StorageMonitor()
+        missing = str(tmp_path / "mnt")
+
+        assert monitor.get_storage_usage(missing).total == 0
+        assert monitor.get_storage_usage(missing).total == 0
+        assert len(calls) == 1
+
+        # Once mounted (here: created), invalidate picks up the real usage
+        os.mkdir(missing)
+        monitor.invalidate(missing)
+        assert monitor.get_storage_usage(missing).total > 0
+        assert len(calls) == 2
+
+    def test_get_storage_usage_without_statvfs(self, monkeypatch):
+        """Test: Platforms without statvfs fall back to shutil.disk_usage"""
+        import os
+        import shutil
+
+        monkeypatch.delattr(os, "statvfs")
+        monkeypatch.setattr(shutil, "disk_usage",
+                            lambda path: (1000, 400, 600))
+
+        usage = StorageMonitor().get_storage_usage("C:\\")
+
+        assert (usage.total, usage.used, usage.free, usage.available) == (1000, 400, 600, 600)
+
     def test_check_minimum_storage(self):
         """
         Test: Can check if storage meets minimum
@@ -145,6 +203,30 @@ class TestStorageMonitor:
             assert dir_size.size > 0
             assert dir_size.file_count == 2
 
+    def test_get_directory_size_walks_nested_tree(self, tmp_path):
+        """Test: Nested files and directories are counted, symlinks are not followed"""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "top.bin").write_bytes(b"x" * 100)
+        (tmp_path / "a" / "mid.bin").write_bytes(b"x" * 200)
+        (tmp_path / "a" / "b" / "leaf.bin").write_bytes(b"x" * 300)
+        (tmp_path / "link").symlink_to(tmp_path / "a")
+
+        dir_size = StorageMonitor().get_directory_size(tmp_path)
+
+        assert dir_size.size == 600
+        assert dir_size.file_count == 3
+        assert dir_size.dir_count == 2
+
+    def test_get_directory_size_missing_or_file(self, tmp_path):
+        """Test: Missing paths and plain files report an empty size"""
+        (tmp_path / "file.txt").write_text("data")
+        monitor = StorageMonitor()
+
+        for path in (tmp_path / "missing", tmp_path / "file.txt"):
+            dir_size = monitor.get_directory_size(path)
+            assert (dir_size.size, dir_size.file_count, dir_size.dir_count) == (0, 0, 0)
+            assert dir_size.path == str(path)
+
     def test_get_largest_directories(self):
         """Test: Can get largest directories"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -160,6 +242,16 @@ class TestStorageMonitor:
             assert isinstance(largest, list)
             assert len(largest) <= 5
 
+    def test_get_largest_directories_orders_by_size(self, tmp_path):
+        """Test: Only the largest directories are returned, largest first"""
+        for name, size in (("small", 10), ("big", 300), ("mid", 100)):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "data").write_bytes(b"x" * size)
+
+        largest = StorageMonitor().get_largest_directories(tmp_path, limit=2)
+
+        assert [Path(d.path).name for d in largest] == ["big", "mid"]
+
 
 class TestImageSizeVerifier:
     """Tests for image size verification"""
@@ -246,6 +338,19 @@ class TestStorageOptimizer:
             assert len(large_files) == 1
             assert large_files[0][0] == large_file
 
+    def test_find_large_files_limit_keeps_largest(self, tmp_path):
+        """Test: A limit returns only the largest matching files, largest first"""
+        (tmp_path / "sub").mkdir()
+        for name, size_mb in (("a.dat", 12), ("sub/b.dat", 30), ("c.dat", 20), ("d.dat", 1)):
+            with open(tmp_path / name, "wb") as f:
+                f.truncate(size_mb * 1024 * 1024)
+
+        optimizer = StorageOptimizer()
+        top = optimizer.find_large_files(tmp_path, min_size_mb=10, limit=2)
+
+        assert top == [(tmp_path / "sub" / "b.dat", 30.0), (tmp_path / "c.dat", 20.0)]
+        assert len(optimizer.find_large_files(tmp_path, min_size_mb=10)) == 3
+
     def test_suggest_optimizations(self):
         """Test: Can suggest optimizations"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -256,6 +361,43 @@ class TestStorageOptimizer:
 
             assert isinstance(suggestions, list)
 
+    def test_suggest_optimizations_single_walk(self, tmp_path, monkeypatch):
+        """Test: Large files and the largest directory come from one tree walk"""
+        (tmp_path / "var" / "log").mkdir(parents=True)
+        (tmp_path / "usr").mkdir()
+        for name, size_mb in (("var/log/huge.log", 120), ("usr/lib.a", 60), ("root.img", 70)):
+            with open(tmp_path / name, "wb") as f:
+                f.truncate(size_mb * 1024 * 1024)
+
+        optimizer = StorageOptimizer()
+        monkeypatch.setattr(optimizer, "find_large_files",
+                            lambda *a, **k: pytest.fail("separate large-file walk"))
+        monkeypatch.setattr(optimizer.monitor, "get_largest_directories",
+                            lambda *a, **k: pytest.fail("separate directory walk"))
+
+        suggestions = optimizer.suggest_optimizations(tmp_path)
+
+        assert "Found 3 files >50MB (total: 250.0MB)" in suggestions
+        assert f"Largest directory: {tmp_path / 'var'} (120.0MB)" in suggestions
+
+    def test_analyze_matches_directory_walk(self, tmp_path):
+        """Test: analyze() directory totals agree with get_directory_size"""
+        (tmp_path / "etc").mkdir()
+        (tmp_path / "var" / "cache").mkdir(parents=True)
+        (tmp_path / "etc" / "passwd").write_bytes(b"x" * 64)
+        (tmp_path / "var" / "cache" / "pkg").write_bytes(b"x" * 512)
+        (tmp_path / "boot.img").write_bytes(b"x" * 128)
+
+        optimizer = StorageOptimizer()
+        analysis = optimizer.analyze(tmp_path)
+
+        for entry in analysis['directories']:
+            walked = optimizer.monitor.get_directory_size(Path(entry.path))
+            assert (entry.size, entry.file_count, entry.dir_count) == (
+                walked.size, walked.file_count, walked.dir_count)
+        assert {Path(d.path).name: d.size for d in analysis['directories']} == {"etc": 64, "var": 512}
+        assert analysis['large_file_count'] == 0
+
     def test_apply_optimization(self):
         """Test: Can apply optimization"""
         optimizer = StorageOptimizer()
@@ -280,6 +422,17 @@ class TestStorageOptimizer:
             # Should report some bytes freed
             assert freed > 0
 
+    def test_clean_temporary_files_counts_only_top_level_files(self, tmp_path):
+        """Test: Only regular files directly in the temp dir are counted"""
+        (tmp_path / "a.tmp").write_bytes(b"x" * 10)
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "b.tmp").write_bytes(b"x" * 20)
+
+        optimizer = StorageOptimizer()
+
+        assert optimizer.clean_temporary_files(tmp_path) == 10
+        assert optimizer.clean_temporary_files(tmp_path / "missing") == 0
+
 
 class TestStorageManager:
     """Tests for overall storage management"""
@@ -341,6 +494,24 @@ class TestStorageManager:
             assert 'largest_directories' in report
             assert 'optimization_suggestions' in report
 
+    def test_get_optimization_report_walks_tree_once(self, tmp_path, monkeypatch):
+        """Test: The report reuses one analysis for directories and suggestions"""
+        (tmp_path / "usr").mkdir()
+        (tmp_path / "usr" / "bin").write_bytes(b"x" * 1000)
+
+        manager = StorageManager()
+        walks = []
+        analyze = manager.optimizer.analyze
+        monkeypatch.setattr(manager.optimizer, "analyze",
+                            lambda root, *a, **k: walks.append(root) or analyze(root, *a, **k))
+        monkeypatch.setattr(manager.monitor, "get_largest_directories",
+                            lambda *a, **k: pytest.fail("separate directory walk"))
+
+        report = manager.get_optimization_report(tmp_path)
+
+        assert walks == [tmp_path]
+        assert report['largest_directories'][0]['path'] == str(tmp_path / "usr")
+
 
 class TestStorageUnits:
     """Tests for storage unit conversions"""
@@ -352,6 +523,16 @@ class TestStorageUnits:
         assert StorageUnit.MB.value == 1024 * 1024
         assert StorageUnit.GB.value == 1024 * 1024 * 1024
 
+    def test_unit_constants_match_enum(self):
+        """Test: Precomputed byte constants agree with StorageUnit"""
+        from src.system.storage import _BYTES_PER_MB, _BYTES_PER_GB
+
+        assert _BYTES_PER_MB == StorageUnit.MB.value
+        assert _BYTES_PER_GB == StorageUnit.GB.value
+        usage = StorageUsage(total=3 * _BYTES_PER_GB, used=0, free=0, available=0)
+        assert usage.to_gb(usage.total) == 3.0
+        assert usage.to_mb(usage.total) == 3072.0
+
 
 class TestDirectorySize:
     """Tests for directory size tracking"""